@@ -0,0 +1,18 @@
+from freqtrade.benchmark.benchmark import run_benchmarks
+from freqtrade.benchmark.synthetic_data import (
+    generate_ohlcv,
+    generate_trades,
+    store_synthetic_data,
+    synthetic_markets,
+)
+from freqtrade.benchmark.synthetic_exchange import SyntheticExchange
+
+
+__all__ = [
+    "generate_ohlcv",
+    "generate_trades",
+    "run_benchmarks",
+    "store_synthetic_data",
+    "synthetic_markets",
+    "SyntheticExchange",
+]
@@ -0,0 +1,330 @@
+"""
+Benchmarks of freqtrade's hot paths, running on synthetic market data.
+"""
+
+import json
+import logging
+import platform
+import statistics
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from multiprocessing import get_context
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Any
+
+import numpy as np
+
+from freqtrade import __version__
+from freqtrade.benchmark.synthetic_data import generate_ohlcv, generate_trades, store_synthetic_data
+from freqtrade.benchmark.synthetic_exchange import SyntheticExchange
+from freqtrade.constants import BENCHMARK_CASES, Config
+from freqtrade.enums import CandleType, RunMode, TradingMode
+from freqtrade.mixins import LoggingMixin
+from freqtrade.persistence import enable_database_use
+from freqtrade.util import get_peak_memory_usage
+
+
+logger = logging.getLogger(__name__)
+
+# Fixed end date, so benchmark data doesn't change over time.
+BENCHMARK_END = datetime(2024, 1, 1, tzinfo=timezone.utc)
+STRATEGY_PATH = Path(__file__).parent / "strategies"
+DEFAULT_SETTINGS: dict[str, Any] = {
+    "cases": BENCHMARK_CASES,
+    "repeat": 3,
+    "pairs": 10,
+    "days": 30,
+    "latency_ms": 50,
+    "seed": 42,
+}
+
+
+def benchmark_pairs(count: int, trading_mode: TradingMode = TradingMode.SPOT) -> list[str]:
+    suffix = ":USDT" if trading_mode == TradingMode.FUTURES else ""
+    return [f"SYN{i:03d}/USDT{suffix}" for i in range(count)]
+
+
+def _get_datadir(workdir: Path) -> Path:
+    return workdir / "user_data" / "data" / "binance"
+
+
+def _get_config(
+    settings: dict[str, Any],
+    workdir: Path,
+    runmode: RunMode,
+    *,
+    trading_mode: TradingMode = TradingMode.SPOT,
+    **overrides: Any,
+) -> Config:
+    """
+    Build the configuration for a benchmark, passing it through the regular configuration
+    handling (so all defaults are applied as in a real run).
+    """
+    from freqtrade.configuration import Configuration
+
+    futures = trading_mode == TradingMode.FUTURES
+    start = BENCHMARK_END - timedelta(days=settings["days"])
+    config = {
+        "max_open_trades": 5,
+        "stake_currency": "USDT",
+        "stake_amount": 100,
+        "tradable_balance_ratio": 0.99,
+        "dry_run": True,
+        "dry_run_wallet": 1000,
+        "fee": 0.001,
+        "trading_mode": trading_mode.value,
+        "margin_mode": "isolated" if futures else "",
+        "timeframe": "5m",
+        "unfilledtimeout": {"entry": 10, "exit": 10, "unit": "minutes"},
+        "entry_pricing": {
+            "price_side": "same",
+            "use_order_book": False,
+            "order_book_top": 1,
+            "price_last_balance": 0.0,
+            "check_depth_of_market": {"enabled": False, "bids_to_ask_delta": 1},
+        },
+        "exit_pricing": {"price_side": "same", "use_order_book": False, "order_book_top": 1},
+        "exchange": {
+            # Only used for naming - all markets and data are synthetic.
+            "name": "binance",
+            "key": "",
+            "secret": "",
+            "pair_whitelist": benchmark_pairs(settings["pairs"], trading_mode),
+            "pair_blacklist": [],
+        },
+        "pairlists": [{"method": "StaticPairList"}],
+        "strategy": "BenchmarkSignalsStrategy",
+        "strategy_path": str(STRATEGY_PATH),
+        "user_data_dir": str(workdir / "user_data"),
+        "timerange": f"{start:%Y%m%d}-{BENCHMARK_END:%Y%m%d}",
+        "export": "none",
+        "dataformat_ohlcv": "feather",
+        "dataformat_trades": "feather",
+        "hyperopt_loss": "SharpeHyperOptLossDaily",
+        "spaces": ["buy", "sell"],
+        "hyperopt_min_trades": 1,
+        "internals": {},
+        **overrides,
+    }
+    config_file = workdir / f"config_{runmode.value}_{trading_mode.value}.json"
+    config_file.write_text(json.dumps(config))
+    # Pass the data directory explicitly, as it's written by _prepare_data().
+    args = {"config": [str(config_file)], "datadir": str(_get_datadir(workdir))}
+    return Configuration(args, runmode).get_config()
+
+
+def _prepare_data(settings: dict[str, Any], workdir: Path) -> None:
+    """
+    Create the user directory and store synthetic data for all benchmarks.
+    One day of additional data is generated to cover the startup period.
+    """
+    from freqtrade.configuration.directory_operations import create_userdata_dir
+
+    create_userdata_dir(str(workdir / "user_data"), create_dir=True)
+    start = BENCHMARK_END - timedelta(days=settings["days"] + 1)
+    modes = [TradingMode.SPOT]
+    if "backtest_short" in settings["cases"]:
+        modes.append(TradingMode.FUTURES)
+    for trading_mode in modes:
+        store_synthetic_data(
+            _get_datadir(workdir),
+            benchmark_pairs(settings["pairs"], trading_mode),
+            ["1m", "5m", "1h"],
+            start,
+            BENCHMARK_END,
+            trading_mode=trading_mode,
+            seed=settings["seed"],
+        )
+
+
+def _backtest(
+    strategy: str, trading_mode: TradingMode = TradingMode.SPOT, **overrides: Any
+) -> Callable[[dict[str, Any], Path], Callable[[], Any]]:
+    def setup(settings: dict[str, Any], workdir: Path) -> Callable[[], Any]:
+        from freqtrade.data import history
+        from freqtrade.data.converter import trim_dataframes
+        from freqtrade.optimize.backtesting import Backtesting
+
+        config = _get_config(
+            settings,
+            workdir,
+            RunMode.BACKTEST,
+            trading_mode=trading_mode,
+            strategy=strategy,
+            **overrides,
+        )
+        exchange = SyntheticExchange(config, seed=settings["seed"], load_leverage_tiers=True)
+        backtesting = Backtesting(config, exchange)
+        data, timerange = backtesting.load_bt_data()
+        backtesting.load_bt_data_detail()
+        backtesting._set_strategy(backtesting.strategylist[0])
+        preprocessed = backtesting._advise_all_indicators(data, timerange)
+        min_date, max_date = history.get_timerange(
+            trim_dataframes(preprocessed, timerange, backtesting.required_startup)
+        )
+
+        def run() -> Any:
+            # backtest() clears the dictionary it's given.
+            return backtesting.backtest(dict(preprocessed), min_date, max_date)
+
+        return run
+
+    return setup
+
+
+def _hyperopt_epoch(settings: dict[str, Any], workdir: Path) -> Callable[[], Any]:
+    from skopt.space import Space
+
+    from freqtrade.optimize.hyperopt import Hyperopt
+
+    config = _get_config(settings, workdir, RunMode.HYPEROPT)
+    hyperopt = Hyperopt(config, SyntheticExchange(config, seed=settings["seed"]))
+    hyperopt.init_spaces()
+    hyperopt.prepare_hyperopt_data()
+    # Random (but reproducible) parameters per epoch - the first one is used for the warm-up.
+    space = Space(hyperopt.dimensions)
+    points = iter(space.rvs(n_samples=settings["repeat"] + 1, random_state=settings["seed"]))
+    return lambda: hyperopt.generate_optimizer(next(points))
+
+
+def _dataprovider(settings: dict[str, Any], workdir: Path) -> Callable[[], Any]:
+    from freqtrade.data.dataprovider import DataProvider
+
+    config = _get_config(settings, workdir, RunMode.BACKTEST, startup_candle_count=50)
+    dp = DataProvider(config, SyntheticExchange(config, seed=settings["seed"]))
+    pairs = config["exchange"]["pair_whitelist"]
+    start = BENCHMARK_END - timedelta(days=settings["days"])
+    # Simulates a strategy requesting an informative timeframe once per hour of a backtest.
+    dates = [start + timedelta(hours=i) for i in range(settings["days"] * 24)]
+
+    def run() -> None:
+        for date in dates:
+            dp._set_dataframe_max_date(date)
+            for pair in pairs:
+                dp.get_pair_dataframe(pair, "1h")
+
+    return run
+
+
+def _refresh_ohlcv(settings: dict[str, Any], workdir: Path) -> Callable[[], Any]:
+    config = _get_config(settings, workdir, RunMode.DRY_RUN)
+    exchange = SyntheticExchange(
+        config, latency=settings["latency_ms"] / 1000, end=BENCHMARK_END, seed=settings["seed"]
+    )
+    pair_list = [
+        (pair, timeframe, CandleType.SPOT)
+        for pair in config["exchange"]["pair_whitelist"]
+        for timeframe in ("5m", "1h")
+    ]
+    return lambda: exchange.refresh_latest_ohlcv(pair_list, cache=False)
+
+
+def _ohlcv_to_dataframe(settings: dict[str, Any], workdir: Path) -> Callable[[], Any]:
+    from freqtrade.data.converter import ohlcv_to_dataframe
+
+    start = BENCHMARK_END - timedelta(days=settings["days"])
+    ohlcv = {}
+    for pair in benchmark_pairs(settings["pairs"]):
+        df = generate_ohlcv(pair, "5m", start, BENCHMARK_END, settings["seed"])
+        df["date"] = df["date"].astype(np.int64) // 1000 // 1000
+        # Remove some candles, so missing candles are filled.
+        ohlcv[pair] = df.values.tolist()[::50]
+
+    def run() -> None:
+        for pair, candles in ohlcv.items():
+            ohlcv_to_dataframe(candles, "5m", pair, fill_missing=True, drop_incomplete=True)
+
+    return run
+
+
+def _trades_to_ohlcv(settings: dict[str, Any], workdir: Path) -> Callable[[], Any]:
+    from freqtrade.data.converter import trades_to_ohlcv
+
+    start = BENCHMARK_END - timedelta(days=1)
+    trades = {
+        pair: generate_trades(pair, start, BENCHMARK_END, settings["seed"])
+        for pair in benchmark_pairs(settings["pairs"])
+    }
+
+    def run() -> None:
+        for df in trades.values():
+            trades_to_ohlcv(df, "1m")
+
+    return run
+
+
+# Setup functions per benchmark - each returns the function to time.
+BENCHMARKS: dict[str, Callable[[dict[str, Any], Path], Callable[[], Any]]] = {
+    "backtest_signals": _backtest("BenchmarkSignalsStrategy"),
+    "backtest_callbacks": _backtest("BenchmarkCallbacksStrategy"),
+    "backtest_dca": _backtest("BenchmarkDCAStrategy"),
+    "backtest_short": _backtest("BenchmarkShortStrategy", TradingMode.FUTURES),
+    "backtest_detail": _backtest("BenchmarkCallbacksStrategy", timeframe_detail="1m"),
+    "hyperopt_epoch": _hyperopt_epoch,
+    "dataprovider": _dataprovider,
+    "refresh_ohlcv": _refresh_ohlcv,
+    "ohlcv_to_dataframe": _ohlcv_to_dataframe,
+    "trades_to_ohlcv": _trades_to_ohlcv,
+}
+
+
+def run_benchmark(case: str, settings: dict[str, Any], workdir: Path) -> dict[str, Any]:
+    """
+    Run one benchmark: setup, one untimed warm-up run, and `repeat` timed runs.
+    :return: Dict with timings (in seconds) and the peak memory usage of the process (in bytes)
+    """
+    try:
+        run = BENCHMARKS[case](settings, workdir)
+        run()
+        timings = []
+        for _ in range(settings["repeat"]):
+            start = perf_counter()
+            run()
+            timings.append(perf_counter() - start)
+    finally:
+        # Backtesting disables database use and log output - restore both when running
+        # in-process (as Backtesting.cleanup() does).
+        LoggingMixin.show_output = True
+        enable_database_use()
+    return {
+        "timings": timings,
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.mean(timings),
+        "peak_memory": get_peak_memory_usage(),
+    }
+
+
+def run_benchmarks(settings: dict[str, Any], *, isolate: bool = True) -> dict[str, Any]:
+    """
+    Run benchmarks on synthetic data.
+    :param settings: Benchmark settings - missing keys default to DEFAULT_SETTINGS
+    :param isolate: Run each benchmark in a separate process, so peak memory usage
+        is measured per benchmark.
+    :return: Results, including the settings and environment used.
+    """
+    settings = {**DEFAULT_SETTINGS, **settings}
+    settings["cases"] = [case for case in BENCHMARK_CASES if case in settings["cases"]]
+    results: dict[str, Any] = {}
+    with TemporaryDirectory(prefix="ft-benchmark-") as tmpdir:
+        workdir = Path(tmpdir)
+        logger.info("Generating synthetic data ...")
+        _prepare_data(settings, workdir)
+        for case in settings["cases"]:
+            logger.info(f"Running benchmark {case} ...")
+            if isolate:
+                with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+                    results[case] = pool.submit(run_benchmark, case, settings, workdir).result()
+            else:
+                results[case] = run_benchmark(case, settings, workdir)
+            logger.info(f"Benchmark {case}: {results[case]['median']:.4f}s (median).")
+    return {
+        "freqtrade_version": __version__,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": settings,
+        "results": results,
+    }
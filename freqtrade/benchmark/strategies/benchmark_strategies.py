@@ -0,0 +1,218 @@
+# pragma pylint: disable=missing-docstring, invalid-name, pointless-string-statement
+"""
+Reference strategies used by `freqtrade benchmark`.
+Please do not modify these strategies - changes invalidate comparisons between benchmark results.
+Indicators only use pandas, so the benchmarks don't depend on TA-Lib.
+"""
+
+from datetime import datetime, timedelta
+from typing import Optional, Union
+
+from pandas import DataFrame, Series
+
+from freqtrade.persistence import Trade
+from freqtrade.strategy import IntParameter, IStrategy, informative, stoploss_from_open
+
+
+def _rsi(close: Series, period: int = 14) -> Series:
+    delta = close.diff()
+    gain = delta.clip(lower=0).ewm(alpha=1 / period, adjust=False).mean()
+    loss = (-delta.clip(upper=0)).ewm(alpha=1 / period, adjust=False).mean()
+    return 100 - 100 / (1 + gain / loss)
+
+
+class BenchmarkSignalsStrategy(IStrategy):
+    """
+    Entry and exit signals, ROI and stoploss only.
+    Doesn't implement any callbacks - so backtesting can use the signals-only fast path.
+    """
+
+    INTERFACE_VERSION = 3
+
+    timeframe = "5m"
+    minimal_roi = {"180": 0.0, "60": 0.01, "0": 0.03}
+    stoploss = -0.05
+    startup_candle_count: int = 50
+
+    buy_rsi = IntParameter(15, 40, default=30, space="buy")
+    sell_rsi = IntParameter(60, 85, default=70, space="sell")
+
+    def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        dataframe["rsi"] = _rsi(dataframe["close"])
+        dataframe["sma_fast"] = dataframe["close"].rolling(10).mean()
+        dataframe["sma_slow"] = dataframe["close"].rolling(50).mean()
+        return dataframe
+
+    def populate_entry_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        dataframe.loc[
+            (dataframe["rsi"] < self.buy_rsi.value) & (dataframe["volume"] > 0),
+            ["enter_long", "enter_tag"],
+        ] = (1, "rsi_low")
+        return dataframe
+
+    def populate_exit_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        dataframe.loc[
+            (dataframe["rsi"] > self.sell_rsi.value) & (dataframe["volume"] > 0),
+            ["exit_long", "exit_tag"],
+        ] = (1, "rsi_high")
+        return dataframe
+
+
+class BenchmarkCallbacksStrategy(BenchmarkSignalsStrategy):
+    """
+    Uses an informative timeframe and the commonly used callbacks -
+    some of them accessing the analyzed dataframe.
+    """
+
+    use_custom_stoploss = True
+
+    @informative("1h")
+    def populate_indicators_1h(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        dataframe["sma"] = dataframe["close"].rolling(24).mean()
+        return dataframe
+
+    def custom_stake_amount(
+        self,
+        pair: str,
+        current_time: datetime,
+        current_rate: float,
+        proposed_stake: float,
+        min_stake: Optional[float],
+        max_stake: float,
+        leverage: float,
+        entry_tag: Optional[str],
+        side: str,
+        **kwargs,
+    ) -> float:
+        return proposed_stake * 0.9
+
+    def custom_entry_price(
+        self,
+        pair: str,
+        trade: Optional[Trade],
+        current_time: datetime,
+        proposed_rate: float,
+        entry_tag: Optional[str],
+        side: str,
+        **kwargs,
+    ) -> float:
+        return proposed_rate * (0.999 if side == "long" else 1.001)
+
+    def confirm_trade_entry(
+        self,
+        pair: str,
+        order_type: str,
+        amount: float,
+        rate: float,
+        time_in_force: str,
+        current_time: datetime,
+        entry_tag: Optional[str],
+        side: str,
+        **kwargs,
+    ) -> bool:
+        dataframe, _ = self.dp.get_analyzed_dataframe(pair, self.timeframe)
+        return len(dataframe) == 0 or dataframe["volume"].iat[-1] > 0
+
+    def custom_stoploss(
+        self,
+        pair: str,
+        trade: Trade,
+        current_time: datetime,
+        current_rate: float,
+        current_profit: float,
+        after_fill: bool,
+        **kwargs,
+    ) -> Optional[float]:
+        if current_profit > 0.02:
+            return stoploss_from_open(
+                0.01, current_profit, is_short=trade.is_short, leverage=trade.leverage
+            )
+        return None
+
+    def custom_exit(
+        self,
+        pair: str,
+        trade: Trade,
+        current_time: datetime,
+        current_rate: float,
+        current_profit: float,
+        **kwargs,
+    ) -> Optional[Union[str, bool]]:
+        dataframe, _ = self.dp.get_analyzed_dataframe(pair, self.timeframe)
+        if len(dataframe) > 0:
+            last_candle = dataframe.iloc[-1]
+            if current_profit > 0 and last_candle["sma_fast"] < last_candle["sma_slow"]:
+                return "sma_cross"
+        if current_time - trade.open_date_utc > timedelta(hours=12):
+            return "timeout"
+        return None
+
+
+class BenchmarkDCAStrategy(BenchmarkSignalsStrategy):
+    """
+    Adjusts positions - adding to losing positions, and partially exiting winning positions.
+    """
+
+    position_adjustment_enable = True
+    max_entry_position_adjustment = 3
+    stoploss = -0.15
+
+    def adjust_trade_position(
+        self,
+        trade: Trade,
+        current_time: datetime,
+        current_rate: float,
+        current_profit: float,
+        min_stake: Optional[float],
+        max_stake: float,
+        current_entry_rate: float,
+        current_exit_rate: float,
+        current_entry_profit: float,
+        current_exit_profit: float,
+        **kwargs,
+    ) -> Union[Optional[float], tuple[Optional[float], Optional[str]]]:
+        if trade.has_open_orders:
+            return None
+        entries = trade.nr_of_successful_entries
+        if current_profit < -0.02 * entries and entries <= self.max_entry_position_adjustment:
+            return trade.select_filled_orders(trade.entry_side)[0].stake_amount, "dca"
+        if current_profit > 0.015 and trade.nr_of_successful_exits == 0:
+            return -(trade.stake_amount / 2), "partial_exit"
+        return None
+
+
+class BenchmarkShortStrategy(BenchmarkCallbacksStrategy):
+    """
+    Futures strategy, trading both directions with leverage.
+    """
+
+    can_short = True
+
+    def populate_entry_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        dataframe = super().populate_entry_trend(dataframe, metadata)
+        dataframe.loc[
+            (dataframe["rsi"] > self.sell_rsi.value) & (dataframe["volume"] > 0),
+            ["enter_short", "enter_tag"],
+        ] = (1, "rsi_high")
+        return dataframe
+
+    def populate_exit_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        dataframe = super().populate_exit_trend(dataframe, metadata)
+        dataframe.loc[
+            (dataframe["rsi"] < self.buy_rsi.value) & (dataframe["volume"] > 0),
+            ["exit_short", "exit_tag"],
+        ] = (1, "rsi_low")
+        return dataframe
+
+    def leverage(
+        self,
+        pair: str,
+        current_time: datetime,
+        current_rate: float,
+        proposed_leverage: float,
+        max_leverage: float,
+        entry_tag: Optional[str],
+        side: str,
+        **kwargs,
+    ) -> float:
+        return min(3.0, max_leverage)
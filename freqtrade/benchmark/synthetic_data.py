@@ -0,0 +1,241 @@
+"""
+Deterministic synthetic market data - used to benchmark freqtrade without exchange data.
+"""
+
+import logging
+import zlib
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, DEFAULT_TRADES_COLUMNS
+from freqtrade.data.converter import trades_convert_types
+from freqtrade.data.history import get_datahandler
+from freqtrade.enums import CandleType, TradingMode
+from freqtrade.exchange import timeframe_to_msecs, timeframe_to_resample_freq
+
+
+logger = logging.getLogger(__name__)
+
+# All candles are resampled from 1m candles, so data of different timeframes is consistent.
+BASE_TIMEFRAME = "1m"
+_BASE_MS = 60 * 1000
+
+
+def _rng(seed: int, *keys: str) -> np.random.Generator:
+    """
+    Random generator depending on the seed and the keys only (not on the call order).
+    """
+    return np.random.default_rng([seed, *(zlib.crc32(key.encode()) for key in keys)])
+
+
+def initial_price(pair: str, seed: int = 42) -> float:
+    """
+    Price of the first candle of a pair - between 0.1 and 1000.
+    """
+    return float(10 ** _rng(seed, pair, "price").uniform(-1, 3))
+
+
+def _base_candles(pair: str, start: datetime, end: datetime, seed: int) -> pd.DataFrame:
+    """
+    1m candles following a random walk, with volatility and trend changing every few hours.
+    """
+    start_ms = int(start.timestamp() * 1000) // _BASE_MS * _BASE_MS
+    count = max(int(end.timestamp() * 1000 - start_ms) // _BASE_MS, 0)
+    rng = _rng(seed, pair, str(start_ms))
+
+    regime = 240
+    regimes = count // regime + 1
+    volatility = np.repeat(rng.uniform(0.0005, 0.004, regimes), regime)[:count]
+    trend = np.repeat(rng.normal(0, 0.0002, regimes), regime)[:count]
+
+    close = initial_price(pair, seed) * np.exp(np.cumsum(rng.normal(trend, volatility)))
+    open_ = np.empty(count)
+    open_[:1] = initial_price(pair, seed)
+    open_[1:] = close[:-1]
+    wick = np.abs(rng.normal(0, volatility / 2))
+    return pd.DataFrame(
+        {
+            "date": pd.to_datetime(start_ms + np.arange(count) * _BASE_MS, unit="ms", utc=True),
+            "open": open_,
+            "high": np.maximum(open_, close) * (1 + wick),
+            "low": np.minimum(open_, close) * (1 - wick),
+            "close": close,
+            "volume": rng.lognormal(8, 1, count),
+        },
+        columns=DEFAULT_DATAFRAME_COLUMNS,
+    )
+
+
+def resample_candles(candles: pd.DataFrame, timeframe: str) -> pd.DataFrame:
+    """
+    Resample 1m candles to a larger timeframe.
+    """
+    if timeframe == BASE_TIMEFRAME:
+        return candles
+    df = candles.resample(timeframe_to_resample_freq(timeframe), on="date", origin="epoch").agg(
+        {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
+    )
+    return df.dropna().reset_index().loc[:, DEFAULT_DATAFRAME_COLUMNS]
+
+
+def generate_ohlcv(
+    pair: str, timeframe: str, start: datetime, end: datetime, seed: int = 42
+) -> pd.DataFrame:
+    """
+    Generate OHLCV candles for a pair.
+    Identical arguments result in identical candles.
+    :param pair: Pair to generate candles for - each pair gets a different random walk
+    :param timeframe: Timeframe of the candles - 1m or larger
+    :param start: Date of the first candle
+    :param end: End date (exclusive)
+    :param seed: Random seed
+    :return: Dataframe with DEFAULT_DATAFRAME_COLUMNS as columns
+    """
+    if timeframe_to_msecs(timeframe) < _BASE_MS:
+        raise ValueError(f"Timeframe {timeframe} is not supported. Minimum is {BASE_TIMEFRAME}.")
+    return resample_candles(_base_candles(pair, start, end, seed), timeframe)
+
+
+def generate_funding_rates(
+    pair: str, timeframe: str, start: datetime, end: datetime, seed: int = 42
+) -> pd.DataFrame:
+    """
+    Generate funding rate candles (the rate is stored in the open column).
+    """
+    tf_ms = timeframe_to_msecs(timeframe)
+    start_ms = -(-int(start.timestamp() * 1000) // tf_ms) * tf_ms
+    dates = np.arange(start_ms, int(end.timestamp() * 1000), tf_ms)
+    rates = _rng(seed, pair, "funding", str(start_ms)).normal(0.0001, 0.0002, len(dates))
+    return pd.DataFrame(
+        {
+            "date": pd.to_datetime(dates, unit="ms", utc=True),
+            "open": rates,
+            "high": rates,
+            "low": rates,
+            "close": rates,
+            "volume": 0.0,
+        },
+        columns=DEFAULT_DATAFRAME_COLUMNS,
+    )
+
+
+def generate_trades(
+    pair: str, start: datetime, end: datetime, seed: int = 42, trades_per_minute: int = 20
+) -> pd.DataFrame:
+    """
+    Generate public trades for a pair. Trade prices are within the range of the 1m candles
+    generated by `generate_ohlcv()` for the same arguments.
+    :param trades_per_minute: Average number of trades per minute
+    :return: Dataframe with DEFAULT_TRADES_COLUMNS and date as columns
+    """
+    candles = _base_candles(pair, start, end, seed)
+    rng = _rng(seed, pair, "trades", str(int(start.timestamp())))
+    candle_idx = np.repeat(np.arange(len(candles)), rng.poisson(trades_per_minute, len(candles)))
+    candle_ms = candles["date"].astype(np.int64).to_numpy() // 1000 // 1000
+    timestamps = candle_ms[candle_idx] + rng.integers(0, _BASE_MS, len(candle_idx))
+    order = np.argsort(timestamps, kind="stable")
+    candle_idx, timestamps = candle_idx[order], timestamps[order]
+
+    low = candles["low"].to_numpy()[candle_idx]
+    high = candles["high"].to_numpy()[candle_idx]
+    price = low + (high - low) * rng.random(len(candle_idx))
+    amount = rng.lognormal(0, 1, len(candle_idx))
+    df = pd.DataFrame(
+        {
+            "timestamp": timestamps,
+            "id": np.arange(len(timestamps)).astype(str),
+            "type": "",
+            "side": np.where(rng.random(len(candle_idx)) < 0.5, "buy", "sell"),
+            "price": price,
+            "amount": amount,
+            "cost": price * amount,
+        },
+        columns=DEFAULT_TRADES_COLUMNS,
+    )
+    return trades_convert_types(df)
+
+
+def synthetic_markets(pairs: list[str], trading_mode: TradingMode, seed: int = 42) -> dict:
+    """
+    Markets (in ccxt format) for the given pairs.
+    Futures pairs are linear swap contracts (e.g. XXX/USDT:USDT).
+    """
+    futures = trading_mode == TradingMode.FUTURES
+    markets: dict[str, Any] = {}
+    for pair in pairs:
+        base, quote = pair.split(":")[0].split("/")
+        tick = 10 ** (int(np.floor(np.log10(initial_price(pair, seed)))) - 6)
+        markets[pair] = {
+            "id": f"{base}{quote}",
+            "symbol": pair,
+            "base": base,
+            "quote": quote,
+            "settle": quote if futures else None,
+            "baseId": base,
+            "quoteId": quote,
+            "settleId": quote if futures else None,
+            "type": "swap" if futures else "spot",
+            "spot": not futures,
+            "margin": False,
+            "swap": futures,
+            "future": False,
+            "option": False,
+            "active": True,
+            "contract": futures,
+            "linear": True if futures else None,
+            "inverse": False if futures else None,
+            "contractSize": 1.0 if futures else None,
+            "precision": {"amount": 1e-8, "price": tick},
+            "limits": {
+                "amount": {"min": 1e-8, "max": None},
+                "cost": {"min": 5.0, "max": None},
+                "price": {"min": None, "max": None},
+                "leverage": {"min": 1.0, "max": 20.0 if futures else None},
+            },
+            "info": {},
+        }
+    return markets
+
+
+def store_synthetic_data(
+    datadir: Path,
+    pairs: list[str],
+    timeframes: list[str],
+    start: datetime,
+    end: datetime,
+    *,
+    trading_mode: TradingMode = TradingMode.SPOT,
+    data_format: str = "feather",
+    seed: int = 42,
+    funding_timeframe: str = "8h",
+) -> None:
+    """
+    Generate and store candles for all pairs and timeframes.
+    In futures mode, funding rate and mark candles are stored as well.
+    """
+    data_handler = get_datahandler(datadir, data_format)
+    futures = trading_mode == TradingMode.FUTURES
+    candle_type = CandleType.FUTURES if futures else CandleType.SPOT
+    for pair in pairs:
+        logger.info(f"Generating synthetic data for {pair}.")
+        base = _base_candles(pair, start, end, seed)
+        for timeframe in timeframes:
+            candles = resample_candles(base, timeframe)
+            data_handler.ohlcv_store(pair, timeframe, candles, candle_type)
+        if futures:
+            data_handler.ohlcv_store(
+                pair, funding_timeframe, resample_candles(base, funding_timeframe), CandleType.MARK
+            )
+            # Funding rates may start before the first candle.
+            data_handler.ohlcv_store(
+                pair,
+                funding_timeframe,
+                generate_funding_rates(
+                    pair, funding_timeframe, start - timedelta(days=1), end, seed
+                ),
+                CandleType.FUNDING_RATE,
+            )
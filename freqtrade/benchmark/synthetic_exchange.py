@@ -0,0 +1,200 @@
+"""
+Exchange serving synthetic markets and market data - without any network access.
+"""
+
+import asyncio
+import logging
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+import numpy as np
+from ccxt import TICK_SIZE
+
+from freqtrade.benchmark.synthetic_data import generate_ohlcv, generate_trades, synthetic_markets
+from freqtrade.constants import Config
+from freqtrade.enums import MarginMode, TradingMode
+from freqtrade.exchange import Exchange, timeframe_to_msecs
+from freqtrade.util import dt_floor_day, dt_now
+
+
+logger = logging.getLogger(__name__)
+
+
+class SyntheticCcxtApi:
+    """
+    Stand-in for a ccxt exchange instance.
+    Implements the properties and (async) methods used to load markets, candles and trades.
+    Every request waits for the configured latency before it's answered, simulating
+    the network roundtrip to the exchange.
+    Candles and trades are generated once per pair (and timeframe) and end at `end`.
+    """
+
+    name = "Synthetic"
+    id = "synthetic"
+    precisionMode = TICK_SIZE
+    timeframes = {
+        tf: tf for tf in ("1m", "3m", "5m", "15m", "30m", "1h", "2h", "4h", "8h", "12h", "1d")
+    }
+    has = {
+        "fetchOHLCV": True,
+        "fetchTrades": True,
+        "fetchTickers": False,
+        "watchOHLCV": False,
+    }
+
+    def __init__(
+        self, markets: dict[str, Any], *, latency: float, end: datetime, seed: int, history: int
+    ) -> None:
+        """
+        :param markets: Markets, as returned by `synthetic_markets()`
+        :param latency: Latency of each request in seconds
+        :param end: End date of the generated data
+        :param seed: Random seed for the generated data
+        :param history: Number of candles available per pair and timeframe
+        """
+        self.markets = markets
+        self.currencies: dict[str, Any] = {}
+        self.options: dict[str, Any] = {}
+        self.session = None
+        self.latency = latency
+        self.requests = 0
+        self._end = end
+        self._seed = seed
+        self._history = history
+        self._ohlcv: dict[tuple[str, str], tuple[list[int], list[list]]] = {}
+        self._trades: dict[str, tuple[list[int], list[dict]]] = {}
+
+    async def _request(self) -> None:
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+    def _get_ohlcv(self, symbol: str, timeframe: str) -> tuple[list[int], list[list]]:
+        if (symbol, timeframe) not in self._ohlcv:
+            candle = timedelta(milliseconds=timeframe_to_msecs(timeframe))
+            start = self._end - candle * self._history
+            df = generate_ohlcv(symbol, timeframe, start, self._end, self._seed)
+            df["date"] = df["date"].astype(np.int64) // 1000 // 1000
+            candles = df.values.tolist()
+            self._ohlcv[(symbol, timeframe)] = ([int(c[0]) for c in candles], candles)
+        return self._ohlcv[(symbol, timeframe)]
+
+    def _get_trades(self, symbol: str) -> tuple[list[int], list[dict]]:
+        if symbol not in self._trades:
+            df = generate_trades(symbol, self._end - timedelta(hours=1), self._end, self._seed)
+            trades = df.drop(columns=["date"]).to_dict(orient="records")
+            self._trades[symbol] = ([t["timestamp"] for t in trades], trades)
+        return self._trades[symbol]
+
+    @staticmethod
+    def _slice(timestamps: list[int], rows: list, since: Optional[int], limit: int) -> list:
+        if since is None:
+            return rows[-limit:]
+        start = bisect_left(timestamps, since)
+        return rows[start : start + limit]
+
+    async def load_markets(self, reload: bool = False, params: Optional[dict] = None) -> dict:
+        await self._request()
+        return self.markets
+
+    def set_markets(self, markets: dict, currencies: Optional[dict] = None) -> None:
+        self.markets = markets
+        self.currencies = currencies or {}
+
+    async def fetch_ohlcv(
+        self,
+        symbol: str,
+        timeframe: str = "1m",
+        since: Optional[int] = None,
+        limit: Optional[int] = None,
+        params: Optional[dict] = None,
+    ) -> list[list]:
+        await self._request()
+        timestamps, candles = self._get_ohlcv(symbol, timeframe)
+        return [list(c) for c in self._slice(timestamps, candles, since, limit or 500)]
+
+    async def fetch_trades(
+        self,
+        symbol: str,
+        since: Optional[int] = None,
+        limit: Optional[int] = None,
+        params: Optional[dict] = None,
+    ) -> list[dict]:
+        await self._request()
+        timestamps, trades = self._get_trades(symbol)
+        return [dict(t) for t in self._slice(timestamps, trades, since, limit or 1000)]
+
+    async def close(self) -> None:
+        pass
+
+
+class SyntheticExchange(Exchange):
+    """
+    Exchange using synthetic markets and data, with a configurable latency per request.
+    Markets are generated for the pairs in the whitelist.
+    Supports spot and (isolated) futures trading modes.
+    """
+
+    _supported_trading_mode_margin_pairs = [
+        (TradingMode.SPOT, MarginMode.NONE),
+        (TradingMode.FUTURES, MarginMode.ISOLATED),
+    ]
+
+    def __init__(
+        self,
+        config: Config,
+        *,
+        latency: float = 0.0,
+        end: Optional[datetime] = None,
+        seed: int = 42,
+        load_leverage_tiers: bool = False,
+    ) -> None:
+        """
+        :param config: Configuration - the pair whitelist determines the available markets
+        :param latency: Latency of each request in seconds
+        :param end: End date of the generated candles and trades - defaults to today
+        :param seed: Random seed for the generated data
+        """
+        self._latency = latency
+        self._data_end = end or dt_floor_day(dt_now())
+        self._seed = seed
+        super().__init__(config, validate=False, load_leverage_tiers=load_leverage_tiers)
+        self._startup_candle_count = config.get("startup_candle_count", 0)
+
+    def _init_ccxt(
+        self, exchange_config: dict[str, Any], sync: bool, ccxt_kwargs: dict[str, Any]
+    ) -> Any:
+        markets = synthetic_markets(
+            exchange_config.get("pair_whitelist", []), self.trading_mode, self._seed
+        )
+        return SyntheticCcxtApi(
+            markets,
+            latency=self._latency,
+            end=self._data_end,
+            seed=self._seed,
+            history=self._ft_has["ohlcv_candle_limit"],
+        )
+
+    def load_leverage_tiers(self) -> dict[str, list[dict]]:
+        if self.trading_mode != TradingMode.FUTURES:
+            return {}
+        return {
+            pair: [
+                {
+                    "minNotional": 0,
+                    "maxNotional": 100_000,
+                    "maintenanceMarginRate": 0.005,
+                    "maxLeverage": 20,
+                    "info": {"cum": "0"},
+                },
+                {
+                    "minNotional": 100_000,
+                    "maxNotional": 1_000_000,
+                    "maintenanceMarginRate": 0.01,
+                    "maxLeverage": 10,
+                    "info": {"cum": "500"},
+                },
+            ]
+            for pair in self._api.markets
+        }
@@ -42,10 +42,20 @@ ARGS_BACKTEST = ARGS_COMMON_OPTIMIZE + [
     "dry_run_wallet",
     "timeframe_detail",
     "strategy_list",
+    "strategy_list_jobs",
     "export",
     "exportfilename",
+    "export_format",
     "backtest_breakdown",
     "backtest_cache",
+    "backtest_engine",
+    "backtest_indicator_cache",
+    "backtest_incremental",
+    "backtest_profile_callbacks",
+    "backtest_fast_math",
+    "backtest_fast_math_verify",
+    "backtest_wallet_ledger",
+    "backtest_memory_bounded",
     "freqai_backtest_live_models",
 ]
 
@@ -69,6 +79,13 @@ ARGS_HYPEROPT = ARGS_COMMON_OPTIMIZE + [
     "disableparamexport",
     "hyperopt_ignore_missing_space",
     "analyze_per_epoch",
+    "hyperopt_successive_halving",
+    "hyperopt_halving_rungs",
+    "hyperopt_halving_eta",
+    "backtest_engine",
+    "backtest_profile_callbacks",
+    "backtest_fast_math",
+    "backtest_wallet_ledger",
 ]
 
 ARGS_EDGE = ARGS_COMMON_OPTIMIZE + ["stoploss_range"]
@@ -243,11 +260,32 @@ ARGS_LOOKAHEAD_ANALYSIS = [
     a
     for a in ARGS_BACKTEST
     if a
-    not in ("position_stacking", "use_max_market_positions", "backtest_cache", "backtest_breakdown")
+    not in (
+        "position_stacking",
+        "use_max_market_positions",
+        "backtest_cache",
+        "backtest_breakdown",
+        "strategy_list_jobs",
+        "backtest_incremental",
+        "backtest_profile_callbacks",
+        "backtest_fast_math_verify",
+        "export_format",
+        "backtest_memory_bounded",
+    )
 ] + ["minimum_trade_amount", "targeted_trade_amount", "lookahead_analysis_exportfilename"]
 
 ARGS_RECURSIVE_ANALYSIS = ["timeframe", "timerange", "dataformat_ohlcv", "pairs", "startup_candle"]
 
+ARGS_BENCHMARK = [
+    "benchmark_cases",
+    "benchmark_repeat",
+    "benchmark_pairs",
+    "benchmark_days",
+    "benchmark_latency",
+    "benchmark_seed",
+    "benchmark_output",
+]
+
 # Command level configs - keep at the bottom of the above definitions
 NO_CONF_REQURIED = [
     "convert-data",
@@ -270,7 +308,7 @@ NO_CONF_REQURIED = [
     "strategy-updater",
 ]
 
-NO_CONF_ALLOWED = ["create-userdir", "list-exchanges", "new-strategy"]
+NO_CONF_ALLOWED = ["create-userdir", "list-exchanges", "new-strategy", "benchmark"]
 
 
 class Arguments:
@@ -353,6 +391,7 @@ class Arguments:
             start_analysis_entries_exits,
             start_backtesting,
             start_backtesting_show,
+            start_benchmark,
             start_convert_data,
             start_convert_db,
             start_convert_trades,
@@ -681,3 +720,12 @@ class Arguments:
         recursive_analayis_cmd.set_defaults(func=start_recursive_analysis)
 
         self._build_args(optionlist=ARGS_RECURSIVE_ANALYSIS, parser=recursive_analayis_cmd)
+
+        # Add benchmark subcommand
+        benchmark_cmd = subparsers.add_parser(
+            "benchmark",
+            help="Benchmark core functions using synthetic market data.",
+        )
+        benchmark_cmd.set_defaults(func=start_benchmark)
+
+        self._build_args(optionlist=ARGS_BENCHMARK, parser=benchmark_cmd)
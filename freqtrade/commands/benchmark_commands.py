@@ -0,0 +1,34 @@
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+
+logger = logging.getLogger(__name__)
+
+
+def start_benchmark(args: dict[str, Any]) -> None:
+    """
+    Run benchmarks on synthetic market data and print (or store) the results as JSON.
+    :param args: Cli args from Arguments()
+    :return: None
+    """
+    # Import here to avoid loading the benchmark module when it's not used
+    from freqtrade.benchmark import run_benchmarks
+    from freqtrade.constants import BENCHMARK_CASES
+
+    settings = {
+        "cases": args["benchmark_cases"] or BENCHMARK_CASES,
+        "repeat": args["benchmark_repeat"],
+        "pairs": args["benchmark_pairs"],
+        "days": args["benchmark_days"],
+        "latency_ms": args["benchmark_latency"],
+        "seed": args["benchmark_seed"],
+    }
+    results = json.dumps(run_benchmarks(settings), indent=2)
+    if args["benchmark_output"]:
+        output = Path(args["benchmark_output"])
+        output.write_text(results)
+        logger.info(f"Benchmark results written to {output}.")
+    else:
+        print(results)
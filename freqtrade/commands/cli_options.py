@@ -200,6 +200,15 @@ AVAILABLE_CLI_OPTIONS = {
         "(so `backtest-data.json` becomes `backtest-data-SampleStrategy.json`",
         nargs="+",
     ),
+    "strategy_list_jobs": Arg(
+        "--strategy-list-jobs",
+        help="Backtest the strategies of `--strategy-list` in parallel, using this number of "
+        "worker processes. Market data is loaded once and shared between all workers. "
+        "If -1, all CPUs are used, for -2, all CPUs but one are used, etc. "
+        "If 1 (default), strategies are backtested one after another.",
+        type=int,
+        metavar="JOBS",
+    ),
     "export": Arg(
         "--export",
         help="Export backtest results (default: trades).",
@@ -213,6 +222,13 @@ AVAILABLE_CLI_OPTIONS = {
         "Example: `--export-filename=user_data/backtest_results/backtest_today.json`",
         metavar="PATH",
     ),
+    "export_format": Arg(
+        "--export-format",
+        help="Format to store backtest results in (default: json). "
+        "`columnar` stores trades in a separate feather file, "
+        "allowing to load trades or statistics only.",
+        choices=constants.EXPORT_FORMAT_OPTIONS,
+    ),
     "disableparamexport": Arg(
         "--disable-param-export",
         help="Disable automatic hyperopt parameter export.",
@@ -236,6 +252,65 @@ AVAILABLE_CLI_OPTIONS = {
         default=constants.BACKTEST_CACHE_DEFAULT,
         choices=constants.BACKTEST_CACHE_AGE,
     ),
+    "backtest_engine": Arg(
+        "--backtest-engine",
+        help="Select the backtesting engine. `columnar` keeps candle data in typed NumPy "
+        "arrays, which greatly reduces memory usage (default: %(default)s).",
+        default=constants.BACKTEST_ENGINE_DEFAULT,
+        choices=constants.BACKTEST_ENGINES,
+    ),
+    "backtest_indicator_cache": Arg(
+        "--indicator-cache",
+        help="Cache populated indicators in `user_data/backtest_results/.cache`. "
+        "Indicators are reused as long as configuration, strategy, parameters and the "
+        "underlying data didn't change.",
+        action="store_true",
+        default=False,
+    ),
+    "backtest_incremental": Arg(
+        "--incremental",
+        help="Save the simulation state at the end of the backtest. Later backtests with "
+        "identical configuration, strategy and timerange start - but a later end date - "
+        "continue from this state instead of re-simulating the whole timerange.",
+        action="store_true",
+        default=False,
+    ),
+    "backtest_profile_callbacks": Arg(
+        "--profile-callbacks",
+        help="Measure calls and duration of strategy callbacks and backtest loop stages "
+        "and show them as a table after the backtest result.",
+        action="store_true",
+        default=False,
+    ),
+    "backtest_fast_math": Arg(
+        "--fast-math",
+        help="Use float arithmetic instead of exact decimal arithmetic for trade value "
+        "and profit calculations. Faster, but results may deviate slightly.",
+        action="store_true",
+        default=False,
+    ),
+    "backtest_fast_math_verify": Arg(
+        "--fast-math-verify",
+        help="Re-calculate profits of closed trades with exact decimal arithmetic after a "
+        "backtest using `--fast-math`, and report the maximum deviation.",
+        action="store_true",
+        default=False,
+    ),
+    "backtest_wallet_ledger": Arg(
+        "--wallet-ledger",
+        help="Update wallets by applying the changes of individual trades, instead of "
+        "recomputing them from all open trades after every entry, fill and exit.",
+        action="store_true",
+        default=False,
+    ),
+    "backtest_memory_bounded": Arg(
+        "--memory-bounded",
+        help="Analyze pairs one at a time and keep their signals in memory-mapped files, "
+        "instead of keeping analyzed dataframes of all pairs in memory. "
+        "Implies `--backtest-engine columnar`.",
+        action="store_true",
+        default=False,
+    ),
     # Edge
     "stoploss_range": Arg(
         "--stoplosses",
@@ -286,6 +361,26 @@ AVAILABLE_CLI_OPTIONS = {
         action="store_true",
         default=False,
     ),
+    "hyperopt_successive_halving": Arg(
+        "--successive-halving",
+        help="Evaluate parameter sets on parts of the timerange first, and only continue "
+        "with the best ones on the full timerange.",
+        action="store_true",
+        default=False,
+    ),
+    "hyperopt_halving_rungs": Arg(
+        "--halving-rungs",
+        help="Number of timerange parts evaluated with --successive-halving (default: 3).",
+        type=check_int_positive,
+        metavar="INT",
+    ),
+    "hyperopt_halving_eta": Arg(
+        "--halving-eta",
+        help="Factor by which the timerange part grows - and the number of parameter sets "
+        "shrinks - from one part to the next with --successive-halving (default: 3).",
+        type=check_int_positive,
+        metavar="INT",
+    ),
     "print_all": Arg(
         "--print-all",
         help="Print all results, not only the best ones.",
@@ -783,4 +878,50 @@ AVAILABLE_CLI_OPTIONS = {
         action="store_true",
         default=False,
     ),
+    "benchmark_cases": Arg(
+        "--cases",
+        help="Benchmarks to run. Space-separated list. Default: all benchmarks.",
+        choices=constants.BENCHMARK_CASES,
+        nargs="+",
+    ),
+    "benchmark_repeat": Arg(
+        "--repeat",
+        help="Number of timed runs per benchmark (default: `%(default)s`).",
+        type=check_int_positive,
+        metavar="INT",
+        default=3,
+    ),
+    "benchmark_pairs": Arg(
+        "--pair-count",
+        help="Number of synthetic pairs to use (default: `%(default)s`).",
+        type=check_int_positive,
+        metavar="INT",
+        default=10,
+    ),
+    "benchmark_days": Arg(
+        "--days",
+        help="Number of days of synthetic data to use (default: `%(default)s`).",
+        type=check_int_positive,
+        metavar="INT",
+        default=30,
+    ),
+    "benchmark_latency": Arg(
+        "--latency",
+        help="Simulated exchange latency per request in milliseconds (default: `%(default)s`).",
+        type=float,
+        metavar="FLOAT",
+        default=50,
+    ),
+    "benchmark_seed": Arg(
+        "--seed",
+        help="Random seed for the synthetic data (default: `%(default)s`).",
+        type=int,
+        metavar="INT",
+        default=42,
+    ),
+    "benchmark_output": Arg(
+        "--output",
+        help="Write benchmark results to this JSON file instead of printing them.",
+        metavar="PATH",
+    ),
 }
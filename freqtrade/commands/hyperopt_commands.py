@@ -63,7 +63,7 @@ def start_hyperopt_show(args: dict[str, Any]) -> None:
     from freqtrade.configuration import setup_utils_configuration
     from freqtrade.data.btanalysis import get_latest_hyperopt_file
     from freqtrade.optimize.hyperopt_tools import HyperoptTools
-    from freqtrade.optimize.optimize_reports import show_backtest_result
+    from freqtrade.optimize.optimize_reports import complete_strategy_stats, show_backtest_result
 
     config = setup_utils_configuration(args, RunMode.UTIL_NO_EXCHANGE)
 
@@ -96,7 +96,7 @@ def start_hyperopt_show(args: dict[str, Any]) -> None:
     if epochs:
         val = epochs[n]
 
-        metrics = val["results_metrics"]
+        metrics = complete_strategy_stats(val["results_metrics"])
         if "strategy_name" in metrics:
             strategy_name = metrics["strategy_name"]
             show_backtest_result(
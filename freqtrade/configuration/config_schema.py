@@ -4,8 +4,11 @@ from freqtrade.constants import (
     AVAILABLE_DATAHANDLERS,
     AVAILABLE_PAIRLISTS,
     BACKTEST_BREAKDOWNS,
+    BACKTEST_ENGINES,
     DRY_RUN_WALLET,
+    EXPORT_FORMAT_OPTIONS,
     EXPORT_OPTIONS,
+    FAST_MATH_TOLERANCE_DEFAULT,
     MARGIN_MODES,
     ORDERTIF_POSSIBILITIES,
     ORDERTYPE_POSSIBILITIES,
@@ -210,6 +213,51 @@ CONF_SCHEMA = {
             "type": "array",
             "items": {"type": "string", "enum": BACKTEST_BREAKDOWNS},
         },
+        "backtest_engine": {
+            "description": "Engine used for backtesting and hyperopt.",
+            "type": "string",
+            "enum": BACKTEST_ENGINES,
+        },
+        "backtest_indicator_cache": {
+            "description": "Cache populated indicators for backtesting.",
+            "type": "boolean",
+        },
+        "backtest_incremental": {
+            "description": "Continue backtests from the state of a prior backtest "
+            "with an earlier end date.",
+            "type": "boolean",
+        },
+        "backtest_profile_callbacks": {
+            "description": "Profile strategy callbacks and backtest loop stages.",
+            "type": "boolean",
+        },
+        "backtest_fast_math": {
+            "description": "Use float arithmetic for trade value and profit calculations.",
+            "type": "boolean",
+        },
+        "backtest_fast_math_verify": {
+            "description": "Verify profits calculated with fast math using exact arithmetic.",
+            "type": "boolean",
+        },
+        "backtest_fast_math_tolerance": {
+            "description": "Maximum deviation of fast math profits before a warning is shown.",
+            "type": "number",
+            "minimum": 0,
+            "default": FAST_MATH_TOLERANCE_DEFAULT,
+        },
+        "backtest_wallet_ledger": {
+            "description": "Update backtest wallets incrementally from changed trades.",
+            "type": "boolean",
+        },
+        "backtest_wallet_ledger_check": {
+            "description": "Verify the wallet ledger against a full recomputation (debug).",
+            "type": "boolean",
+        },
+        "backtest_memory_bounded": {
+            "description": "Analyze pairs one at a time and spill signals to memory-mapped "
+            "files during backtesting.",
+            "type": "boolean",
+        },
         "bot_name": {
             "description": "Name of the trading bot. Passed via API to a client.",
             "type": "string",
@@ -659,6 +707,15 @@ CONF_SCHEMA = {
             "enum": EXPORT_OPTIONS,
             "default": "trades",
         },
+        "export_format": {
+            "description": (
+                "Format to store backtest results in. "
+                "`columnar` stores trades in a separate feather file."
+            ),
+            "type": "string",
+            "enum": EXPORT_FORMAT_OPTIONS,
+            "default": "json",
+        },
         "disableparamexport": {
             "description": "Disable parameter export.",
             "type": "boolean",
@@ -293,6 +293,12 @@ class Configuration:
             logfun=len,
         )
 
+        self._args_to_config(
+            config,
+            argname="strategy_list_jobs",
+            logstring="Parameter --strategy-list-jobs detected: {} ...",
+        )
+
         configurations = [
             (
                 "recursive_strategy_search",
@@ -300,8 +306,17 @@ class Configuration:
             ),
             ("timeframe", "Overriding timeframe with Command line argument"),
             ("export", "Parameter --export detected: {} ..."),
+            ("export_format", "Parameter --export-format detected: {} ..."),
             ("backtest_breakdown", "Parameter --breakdown detected ..."),
             ("backtest_cache", "Parameter --cache={} detected ..."),
+            ("backtest_engine", "Using backtest engine: {} ..."),
+            ("backtest_indicator_cache", "Parameter --indicator-cache detected ..."),
+            ("backtest_incremental", "Parameter --incremental detected ..."),
+            ("backtest_profile_callbacks", "Parameter --profile-callbacks detected ..."),
+            ("backtest_fast_math", "Parameter --fast-math detected ..."),
+            ("backtest_fast_math_verify", "Parameter --fast-math-verify detected ..."),
+            ("backtest_wallet_ledger", "Parameter --wallet-ledger detected ..."),
+            ("backtest_memory_bounded", "Parameter --memory-bounded detected ..."),
             ("disableparamexport", "Parameter --disableparamexport detected: {} ..."),
             ("freqai_backtest_live_models", "Parameter --freqai-backtest-live-models detected ..."),
         ]
@@ -325,6 +340,9 @@ class Configuration:
             ("epochs", "Parameter --epochs detected ... Will run Hyperopt with for {} epochs ..."),
             ("spaces", "Parameter -s/--spaces detected: {}"),
             ("analyze_per_epoch", "Parameter --analyze-per-epoch detected."),
+            ("hyperopt_successive_halving", "Parameter --successive-halving detected."),
+            ("hyperopt_halving_rungs", "Parameter --halving-rungs detected: {}"),
+            ("hyperopt_halving_eta", "Parameter --halving-eta detected: {}"),
             ("print_all", "Parameter --print-all detected ..."),
         ]
         self._args_to_config_loop(config, configurations)
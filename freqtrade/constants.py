@@ -16,6 +16,7 @@ HYPEROPT_EPOCH = 100  # epochs
 RETRY_TIMEOUT = 30  # sec
 TIMEOUT_UNITS = ["minutes", "seconds"]
 EXPORT_OPTIONS = ["none", "trades", "signals"]
+EXPORT_FORMAT_OPTIONS = ["json", "columnar"]
 DEFAULT_DB_PROD_URL = "sqlite:///tradesv3.sqlite"
 DEFAULT_DB_DRYRUN_URL = "sqlite:///tradesv3.dryrun.sqlite"
 UNLIMITED_STAKE_AMOUNT = "unlimited"
@@ -61,6 +62,21 @@ AVAILABLE_DATAHANDLERS = ["json", "jsongz", "hdf5", "feather", "parquet"]
 BACKTEST_BREAKDOWNS = ["day", "week", "month"]
 BACKTEST_CACHE_AGE = ["none", "day", "week", "month"]
 BACKTEST_CACHE_DEFAULT = "day"
+BACKTEST_ENGINES = ["legacy", "columnar"]
+BACKTEST_ENGINE_DEFAULT = "legacy"
+FAST_MATH_TOLERANCE_DEFAULT = 1e-6
+BENCHMARK_CASES = [
+    "backtest_signals",
+    "backtest_callbacks",
+    "backtest_dca",
+    "backtest_short",
+    "backtest_detail",
+    "hyperopt_epoch",
+    "dataprovider",
+    "refresh_ohlcv",
+    "ohlcv_to_dataframe",
+    "trades_to_ohlcv",
+]
 DRY_RUN_WALLET = 1000
 DATETIME_PRINT_FORMAT = "%Y-%m-%d %H:%M:%S"
 MATH_CLOSE_PREC = 1e-14  # Precision used for float comparisons
@@ -82,6 +98,7 @@ TRADING_MODES = ["spot", "margin", "futures"]
 MARGIN_MODES = ["cross", "isolated", ""]
 
 LAST_BT_RESULT_FN = ".last_result.json"
+BT_RESULT_INDEX_FN = ".backtest_index.json"
 FTHYPT_FILEVERSION = "fthypt_fileversion"
 
 USERPATH_HYPEROPTS = "hyperopts"
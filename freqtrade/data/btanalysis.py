@@ -10,12 +10,19 @@ from typing import Any, Literal, Optional, Union
 
 import numpy as np
 import pandas as pd
+import rapidjson
 
 from freqtrade.constants import LAST_BT_RESULT_FN, IntOrInf
 from freqtrade.exceptions import ConfigurationError, OperationalException
 from freqtrade.ft_types import BacktestHistoryEntryType, BacktestResultType
 from freqtrade.misc import file_dump_json, json_load
-from freqtrade.optimize.backtest_caching import get_backtest_metadata_filename
+from freqtrade.optimize.backtest_caching import (
+    get_backtest_metadata_filename,
+    get_backtest_trades_filename,
+    load_backtest_index,
+    save_backtest_index,
+    update_backtest_index,
+)
 from freqtrade.persistence import LocalTrade, Trade, init_db
 
 
@@ -154,16 +161,40 @@ def load_backtest_metadata(filename: Union[Path, str]) -> dict[str, Any]:
         raise OperationalException("Unexpected error while loading backtest metadata.") from e
 
 
-def load_backtest_stats(filename: Union[Path, str]) -> BacktestResultType:
+def _get_backtest_filename(filename: Union[Path, str]) -> Path:
     """
-    Load backtest statistics file.
-    :param filename: pathlib.Path object, or string pointing to the file.
-    :return: a dictionary containing the resulting file.
+    Resolve the backtest result file - using the latest result for directories.
     """
     if isinstance(filename, str):
         filename = Path(filename)
     if filename.is_dir():
         filename = filename / get_latest_backtest_filename(filename)
+    return filename
+
+
+def _load_backtest_trades(filename: Path) -> pd.DataFrame:
+    """
+    Load trades of a backtest result stored in columnar format.
+    :param filename: Backtest result file
+    :return: Dataframe with trades of all strategies, with a "strategy" column.
+    """
+    df = pd.read_feather(get_backtest_trades_filename(filename))
+    if "orders" in df.columns:
+        df["orders"] = df["orders"].map(rapidjson.loads)
+    return df
+
+
+def load_backtest_stats(
+    filename: Union[Path, str], *, include_trades: bool = True
+) -> BacktestResultType:
+    """
+    Load backtest statistics file.
+    :param filename: pathlib.Path object, or string pointing to the file.
+    :param include_trades: Load trades of results stored in columnar format.
+        Without trades, only the (much smaller) statistics file is read.
+    :return: a dictionary containing the resulting file.
+    """
+    filename = _get_backtest_filename(filename)
     if not filename.is_file():
         raise ValueError(f"File {filename} does not exist.")
     logger.info(f"Loading backtest result from {filename}")
@@ -173,6 +204,15 @@ def load_backtest_stats(filename: Union[Path, str]) -> BacktestResultType:
     # Legacy list format does not contain metadata.
     if isinstance(data, dict):
         data["metadata"] = load_backtest_metadata(filename)
+        if include_trades and get_backtest_trades_filename(filename).is_file():
+            trades = _load_backtest_trades(filename)
+            # Restore None values - which became NaN in the dataframe
+            trades = trades.astype(object).where(trades.notna(), None)
+            for strategy, strat_trades in trades.groupby("strategy", sort=False):
+                if strategy in data["strategy"]:
+                    data["strategy"][strategy]["trades"] = strat_trades.drop(
+                        columns="strategy"
+                    ).to_dict(orient="records")
     return data
 
 
@@ -200,8 +240,30 @@ def _get_backtest_files(dirname: Path) -> list[Path]:
     return list(reversed(sorted(dirname.glob("backtest-result-*-[0-9][0-9].json"))))
 
 
-def _extract_backtest_result(filename: Path) -> list[BacktestHistoryEntryType]:
-    metadata = load_backtest_metadata(filename)
+def _get_backtest_index(dirname: Path) -> dict[str, dict[str, Any]]:
+    """
+    Get metadata of all backtest results in this directory, from newest to oldest.
+    Read from the backtest result index - results missing in the index are added to it,
+    so only new results require reading their metadata file.
+    :return: Dict with metadata by result filename (without suffix)
+    """
+    index = load_backtest_index(dirname)
+    result = {}
+    for filename in _get_backtest_files(dirname):
+        if filename.stem in index:
+            result[filename.stem] = index[filename.stem]
+        else:
+            result[filename.stem] = load_backtest_metadata(filename)
+    if result != index:
+        save_backtest_index(dirname, result)
+    return result
+
+
+def _extract_backtest_result(
+    filename: Path, metadata: Optional[dict[str, Any]] = None
+) -> list[BacktestHistoryEntryType]:
+    if metadata is None:
+        metadata = load_backtest_metadata(filename)
     return [
         {
             "filename": filename.stem,
@@ -229,12 +291,12 @@ def get_backtest_result(filename: Path) -> list[BacktestHistoryEntryType]:
 
 def get_backtest_resultlist(dirname: Path) -> list[BacktestHistoryEntryType]:
     """
-    Get list of backtest results read from metadata files
+    Get list of backtest results read from the backtest result index
     """
     return [
         result
-        for filename in _get_backtest_files(dirname)
-        for result in _extract_backtest_result(filename)
+        for stem, metadata in _get_backtest_index(dirname).items()
+        for result in _extract_backtest_result(dirname / f"{stem}.json", metadata)
     ]
 
 
@@ -248,6 +310,7 @@ def delete_backtest_result(file_abs: Path):
     for file in file_abs.parent.glob(f"{file_abs.stem}*"):
         logger.info(f"Deleting file: {file}")
         file.unlink()
+    update_backtest_index(file_abs, None)
 
 
 def update_backtest_metadata(filename: Path, strategy: str, content: dict[str, Any]):
@@ -263,6 +326,7 @@ def update_backtest_metadata(filename: Path, strategy: str, content: dict[str, A
     metadata[strategy].update(content)
     # Write data again.
     file_dump_json(get_backtest_metadata_filename(filename), metadata)
+    update_backtest_index(filename, metadata)
 
 
 def get_backtest_market_change(filename: Path, include_ts: bool = True) -> pd.DataFrame:
@@ -294,8 +358,8 @@ def find_existing_backtest_stats(
         "strategy_comparison": [],
     }
 
-    for filename in _get_backtest_files(dirname):
-        metadata = load_backtest_metadata(filename)
+    for stem, metadata in _get_backtest_index(dirname).items():
+        filename = dirname / f"{stem}.json"
         if not metadata:
             # Files are sorted from newest to oldest. When file without metadata is encountered it
             # is safe to assume older files will also not have any metadata.
@@ -345,6 +409,29 @@ def _load_backtest_data_df_compatibility(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def _select_backtest_strategy(strategies: list[str], strategy: Optional[str]) -> str:
+    """
+    Select the strategy to load from a backtest result.
+    :param strategies: Strategies contained in the backtest result
+    :param strategy: Requested strategy - can be empty for results with only one strategy.
+    :raise: ValueError if the strategy can't be determined or is not available.
+    """
+    if not strategy:
+        if len(strategies) == 1:
+            strategy = strategies[0]
+        else:
+            raise ValueError(
+                "Detected backtest result with more than one strategy. Please specify a strategy."
+            )
+
+    if strategy not in strategies:
+        raise ValueError(
+            f"Strategy {strategy} not available in the backtest result. "
+            f"Available strategies are '{','.join(strategies)}'"
+        )
+    return strategy
+
+
 def load_backtest_data(filename: Union[Path, str], strategy: Optional[str] = None) -> pd.DataFrame:
     """
     Load backtest data file.
@@ -354,27 +441,28 @@ def load_backtest_data(filename: Union[Path, str], strategy: Optional[str] = Non
     :return: a dataframe with the analysis results
     :raise: ValueError if loading goes wrong.
     """
+    filename = _get_backtest_filename(filename)
+    if get_backtest_trades_filename(filename).is_file():
+        # Columnar format - load trades without the statistics.
+        trades = _load_backtest_trades(filename)
+        strategy = _select_backtest_strategy(
+            list(load_backtest_metadata(filename)) or list(trades["strategy"].unique()),
+            strategy,
+        )
+        df = trades.loc[trades["strategy"] == strategy].drop(columns="strategy")
+        df = df.reset_index(drop=True)
+        if not df.empty:
+            df = _load_backtest_data_df_compatibility(df)
+            df = df.sort_values("open_date").reset_index(drop=True)
+        return df
+
     data = load_backtest_stats(filename)
     if not isinstance(data, list):
         # new, nested format
         if "strategy" not in data:
             raise ValueError("Unknown dataformat.")
 
-        if not strategy:
-            if len(data["strategy"]) == 1:
-                strategy = list(data["strategy"].keys())[0]
-            else:
-                raise ValueError(
-                    "Detected backtest result with more than one strategy. "
-                    "Please specify a strategy."
-                )
-
-        if strategy not in data["strategy"]:
-            raise ValueError(
-                f"Strategy {strategy} not available in the backtest result. "
-                f"Available strategies are '{','.join(data['strategy'].keys())}'"
-            )
-
+        strategy = _select_backtest_strategy(list(data["strategy"].keys()), strategy)
         data = data["strategy"][strategy]["trades"]
         df = pd.DataFrame(data)
         if not df.empty:
@@ -445,7 +533,16 @@ def trade_list_to_dataframe(trades: Union[list[Trade], list[LocalTrade]]) -> pd.
     :param trades: List of trade objects
     :return: Dataframe with BT_DATA_COLUMNS
     """
-    df = pd.DataFrame.from_records([t.to_json(True) for t in trades], columns=BT_DATA_COLUMNS)
+    return trade_records_to_dataframe([t.to_json(True) for t in trades])
+
+
+def trade_records_to_dataframe(records: list[dict[str, Any]]) -> pd.DataFrame:
+    """
+    Convert list of serialized trades (as returned by `trade.to_json(True)`) to pandas Dataframe
+    :param records: List of serialized trades
+    :return: Dataframe with BT_DATA_COLUMNS
+    """
+    df = pd.DataFrame.from_records(records, columns=BT_DATA_COLUMNS)
     if len(df) > 0:
         df["close_date"] = pd.to_datetime(df["close_date"], utc=True)
         df["open_date"] = pd.to_datetime(df["open_date"], utc=True)
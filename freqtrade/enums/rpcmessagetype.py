@@ -24,6 +24,8 @@ class RPCMessageType(str, Enum):
     ANALYZED_DF = "analyzed_df"
     NEW_CANDLE = "new_candle"
 
+    BACKTEST = "backtest"
+
     def __repr__(self):
         return self.value
 
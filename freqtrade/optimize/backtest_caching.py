@@ -1,26 +1,59 @@
 import hashlib
+import inspect
+import logging
+import shutil
 from copy import deepcopy
 from pathlib import Path
-from typing import Union
+from string import hexdigits
+from typing import Any, Optional, Union
 
 import rapidjson
+from pandas import DataFrame
 
+from freqtrade import __version__
+from freqtrade.constants import BT_RESULT_INDEX_FN, Config, ListPairsWithTimeframes
+from freqtrade.misc import file_dump_json, json_load, pair_to_filename
 
-def get_strategy_run_id(strategy) -> str:
+
+logger = logging.getLogger(__name__)
+
+INDICATOR_CACHE_INDEX = "index.json"
+# Number of indicator cache entries kept - older entries are removed.
+INDICATOR_CACHE_ENTRIES = 10
+
+
+def get_strategy_run_id(strategy, ignore_timerange_end: bool = False) -> str:
     """
     Generate unique identification hash for a backtest run. Identical config and strategy file will
     always return an identical hash.
     :param strategy: strategy object.
+    :param ignore_timerange_end: Only consider the start of the timerange.
+        Used to identify backtests which can be extended incrementally.
     :return: hex string id.
     """
     digest = hashlib.sha1()  # noqa: S324
     config = deepcopy(strategy.config)
 
     # Options that have no impact on results of individual backtest.
-    not_important_keys = ("strategy_list", "original_config", "telegram", "api_server")
+    not_important_keys = (
+        "strategy_list",
+        "strategy_list_jobs",
+        "backtest_indicator_cache",
+        "backtest_incremental",
+        "backtest_profile_callbacks",
+        "backtest_fast_math_verify",
+        "backtest_fast_math_tolerance",
+        "backtest_wallet_ledger_check",
+        "backtest_memory_bounded",
+        "original_config",
+        "telegram",
+        "api_server",
+    )
     for k in not_important_keys:
         if k in config:
             del config[k]
+    if ignore_timerange_end and config.get("timerange"):
+        config["timerange"] = str(config["timerange"]).split("-")[0]
 
     # Explicitly allow NaN values (e.g. max_open_trades).
     # as it does not matter for getting the hash.
@@ -42,3 +75,180 @@ def get_backtest_metadata_filename(filename: Union[Path, str]) -> Path:
     """Return metadata filename for specified backtest results file."""
     filename = Path(filename)
     return filename.parent / Path(f"{filename.stem}.meta{filename.suffix}")
+
+
+def get_backtest_trades_filename(filename: Union[Path, str]) -> Path:
+    """Return columnar trades filename for specified backtest results file."""
+    filename = Path(filename)
+    return filename.parent / f"{filename.stem}_trades.feather"
+
+
+def load_backtest_index(dirname: Path) -> dict[str, Any]:
+    """
+    Load the backtest result index of a directory.
+    :param dirname: Directory containing backtest results
+    :return: Dict with the metadata of each result, by result filename (without suffix).
+        Empty dict if the index does not exist (or can't be read).
+    """
+    try:
+        with (dirname / BT_RESULT_INDEX_FN).open() as fp:
+            index = json_load(fp)
+        return index if isinstance(index, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_backtest_index(dirname: Path, index: dict[str, Any]) -> None:
+    """
+    Store the backtest result index of a directory.
+    :param dirname: Directory containing backtest results
+    :param index: Dict with the metadata of each result, by result filename (without suffix).
+    """
+    try:
+        file_dump_json(dirname / BT_RESULT_INDEX_FN, index, log=False)
+    except OSError as e:
+        # The index is an optimization only - results remain available without it.
+        logger.warning(f"Could not store backtest result index: {e}")
+
+
+def update_backtest_index(filename: Path, metadata: Optional[dict[str, Any]]) -> None:
+    """
+    Update the metadata of one backtest result in the result index of its directory.
+    :param filename: Backtest result file
+    :param metadata: Metadata of the result - None to remove the result from the index.
+    """
+    index = load_backtest_index(filename.parent)
+    if metadata is None:
+        if index.pop(filename.stem, None) is None:
+            return
+    else:
+        index[filename.stem] = metadata
+    save_backtest_index(filename.parent, index)
+
+
+def get_data_fingerprint(config: Config, pairs: ListPairsWithTimeframes) -> list[list]:
+    """
+    Fingerprint of the data files for the given pairs - based on file size and modification time.
+    Downloading new data for any of these pairs changes the fingerprint.
+    :param config: Configuration (datadir and dataformat_ohlcv are used)
+    :param pairs: List of (pair, timeframe, candle_type) tuples
+    :return: list of [filename, size, mtime] - [filename, None, None] for missing files.
+    """
+    from freqtrade.data.history.datahandlers.idatahandler import get_datahandlerclass
+
+    handler = get_datahandlerclass(config.get("dataformat_ohlcv", "feather"))
+    fingerprint = []
+    for pair, timeframe, candle_type in sorted(set(pairs)):
+        filename = handler._pair_data_filename(config["datadir"], pair, timeframe, candle_type)
+        if filename.is_file():
+            stat = filename.stat()
+            fingerprint.append([filename.name, stat.st_size, stat.st_mtime_ns])
+        else:
+            fingerprint.append([filename.name, None, None])
+    return fingerprint
+
+
+def get_indicator_cache_key(
+    strategy, timerange, startup_candles: int, data_fingerprint: list[list]
+) -> str:
+    """
+    Generate identification hash for the indicators of a strategy.
+    Based on the backtest run id (configuration and strategy file), the files of all base
+    classes of the strategy outside of freqtrade, and the freqtrade version.
+    :param strategy: strategy object.
+    :param timerange: Timerange of the loaded data.
+    :param startup_candles: Number of startup candles.
+    :param data_fingerprint: Fingerprint of the data files, from get_data_fingerprint().
+    :return: hex string id.
+    """
+    digest = hashlib.sha1()  # noqa: S324
+    settings = {
+        "run_id": get_strategy_run_id(strategy),
+        "version": __version__,
+        "timerange": [timerange.starttype, timerange.startts, timerange.stoptype, timerange.stopts],
+        "startup_candles": startup_candles,
+        "parameters": {name: param.value for name, param in strategy.enumerate_parameters()},
+        "data": data_fingerprint,
+    }
+    digest.update(
+        rapidjson.dumps(settings, default=str, number_mode=rapidjson.NM_NAN).encode("utf-8")
+    )
+    # Base classes and mixins may live in other files than the strategy itself.
+    for cls in type(strategy).__mro__:
+        if cls.__module__.split(".")[0] in ("freqtrade", "builtins", "abc"):
+            continue
+        try:
+            filename = inspect.getsourcefile(cls)
+        except (TypeError, OSError):
+            # Source not available - the strategy file itself is part of the run id.
+            continue
+        if filename:
+            digest.update(Path(filename).read_bytes())
+    return digest.hexdigest().lower()
+
+
+def _get_indicator_cache_entries(cache_dir: Path) -> list[Path]:
+    """
+    Entries of the indicator cache - most recently used first.
+    """
+    entries = [
+        path
+        for path in cache_dir.iterdir()
+        if path.is_dir() and len(path.name) == 40 and all(c in hexdigits for c in path.name)
+    ]
+    return sorted(entries, key=lambda path: path.stat().st_mtime_ns, reverse=True)
+
+
+def prune_indicator_cache(cache_dir: Path, keep: int = INDICATOR_CACHE_ENTRIES) -> None:
+    """
+    Remove all but the most recently used entries of the indicator cache.
+    :param cache_dir: Directory containing the indicator cache
+    :param keep: Number of entries to keep
+    """
+    for entry_dir in _get_indicator_cache_entries(cache_dir)[keep:]:
+        logger.info(f"Removing cached indicators {entry_dir.name}.")
+        shutil.rmtree(entry_dir, ignore_errors=True)
+
+
+def load_indicator_cache(cache_dir: Path, key: str) -> Optional[dict[str, DataFrame]]:
+    """
+    Load cached indicator dataframes.
+    :param cache_dir: Directory containing the indicator cache
+    :param key: Key generated by get_indicator_cache_key()
+    :return: dict of {pair: DataFrame} - or None if no complete cache entry exists.
+    """
+    entry_dir = cache_dir / key
+    index_file = entry_dir / INDICATOR_CACHE_INDEX
+    if not index_file.is_file():
+        return None
+    from pyarrow import feather
+
+    # Mark the entry as recently used - see prune_indicator_cache().
+    entry_dir.touch()
+
+    with index_file.open("r") as fp:
+        index = rapidjson.load(fp)
+    return {
+        pair: feather.read_table(entry_dir / filename).to_pandas()
+        for pair, filename in index["pairs"].items()
+    }
+
+
+def store_indicator_cache(cache_dir: Path, key: str, data: dict[str, DataFrame]) -> None:
+    """
+    Store indicator dataframes as uncompressed feather files (Arrow IPC format),
+    which load without decompression.
+    The index file is written last - so incomplete entries are never loaded.
+    :param cache_dir: Directory containing the indicator cache
+    :param key: Key generated by get_indicator_cache_key()
+    :param data: dict of {pair: DataFrame}
+    """
+    entry_dir = cache_dir / key
+    entry_dir.mkdir(parents=True, exist_ok=True)
+    pairs = {}
+    for pair, df in data.items():
+        filename = f"{pair_to_filename(pair)}.feather"
+        df.reset_index(drop=True).to_feather(entry_dir / filename, compression="uncompressed")
+        pairs[pair] = filename
+    with (entry_dir / INDICATOR_CACHE_INDEX).open("w") as fp:
+        rapidjson.dump({"pairs": pairs}, fp)
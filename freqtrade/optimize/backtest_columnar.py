@@ -0,0 +1,303 @@
+"""
+Columnar (struct-of-arrays) representation of analyzed candles used by backtesting.
+"""
+
+import logging
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import utils_find_1st as utf1st
+from pandas import DataFrame, Timestamp, factorize
+
+
+logger = logging.getLogger(__name__)
+
+SIGNAL_COLUMNS = ["enter_long", "exit_long", "enter_short", "exit_short"]
+TAG_COLUMNS = ["enter_tag", "exit_tag"]
+ARRAY_COLUMNS = ("date", "open", "high", "low", "close", *SIGNAL_COLUMNS, *TAG_COLUMNS)
+
+
+class ColumnarPairData:
+    """
+    Analyzed candles of one pair, stored as contiguous NumPy buffers.
+
+    Signal and tag columns are already shifted by one candle (same as the list-based
+    representation), so index ``i`` contains the candle ``i`` together with the signals
+    of the previous candle.
+    Rows are only materialized on access - using the layout defined by
+    ``freqtrade.optimize.backtesting.HEADERS``.
+    """
+
+    __slots__ = (*ARRAY_COLUMNS, "tags")
+
+    # Candle open time, as int64 nanoseconds since epoch (UTC)
+    date: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    enter_long: np.ndarray
+    exit_long: np.ndarray
+    enter_short: np.ndarray
+    exit_short: np.ndarray
+    # Tag columns contain codes into self.tags. -1 (the last element) maps to None.
+    enter_tag: np.ndarray
+    exit_tag: np.ndarray
+    tags: list[Optional[str]]
+
+    def __init__(self, arrays: dict[str, np.ndarray], tags: list[Optional[str]]) -> None:
+        for col in ARRAY_COLUMNS:
+            setattr(self, col, arrays[col])
+        self.tags = tags
+
+    def __len__(self) -> int:
+        return len(self.date)
+
+    def __getitem__(self, idx: int) -> list:
+        """
+        Materialize one row - in the same layout as the list-based representation.
+        Raises IndexError if idx is out of bounds.
+        """
+        return [
+            Timestamp(self.date[idx], tz="UTC"),
+            self.open.item(idx),
+            self.high.item(idx),
+            self.low.item(idx),
+            self.close.item(idx),
+            self.enter_long.item(idx),
+            self.exit_long.item(idx),
+            self.enter_short.item(idx),
+            self.exit_short.item(idx),
+            self.tags[self.enter_tag.item(idx)],
+            self.tags[self.exit_tag.item(idx)],
+        ]
+
+    def has_entry_signal(self, idx: int, can_short: bool) -> bool:
+        """
+        Quick check if the candle at idx carries any entry signal.
+        Avoids materializing the full row for candles without activity.
+        """
+        return bool(self.enter_long[idx]) or (can_short and bool(self.enter_short[idx]))
+
+    @property
+    def nbytes(self) -> int:
+        return sum(getattr(self, col).nbytes for col in ARRAY_COLUMNS)
+
+
+def _tag_codes(column, tags: list[Optional[str]], tag_index: dict[str, int]) -> np.ndarray:
+    """
+    Convert a tag column to integer codes into the shared tags list.
+    Missing values are encoded as -1.
+    """
+    codes, uniques = factorize(column, use_na_sentinel=True)
+    mapping = np.empty(len(uniques) + 1, dtype=np.int32)
+    mapping[-1] = -1
+    for i, tag in enumerate(uniques):
+        if tag not in tag_index:
+            # Insert before the trailing None
+            tag_index[tag] = len(tags) - 1
+            tags.insert(len(tags) - 1, tag)
+        mapping[i] = tag_index[tag]
+    return mapping[codes]
+
+
+def dataframe_to_columnar(df_analyzed: DataFrame) -> ColumnarPairData:
+    """
+    Convert an analyzed (and trimmed) dataframe to ColumnarPairData.
+    To avoid using data from the future, entry/exit signals and tags are shifted by one candle
+    and the first candle is dropped.
+    :param df_analyzed: Dataframe with OHLCV, signal and tag columns
+    :return: ColumnarPairData object
+    """
+    length = max(len(df_analyzed) - 1, 0)
+    tags: list[Optional[str]] = [None]
+    tag_index: dict[str, int] = {}
+    if not length:
+        return ColumnarPairData(
+            {
+                "date": np.empty(0, dtype=np.int64),
+                **{col: np.empty(0, dtype=np.float64) for col in ("open", "high", "low", "close")},
+                **{col: np.empty(0, dtype=np.int8) for col in SIGNAL_COLUMNS},
+                **{col: np.empty(0, dtype=np.int32) for col in TAG_COLUMNS},
+            },
+            tags,
+        )
+
+    arrays: dict[str, np.ndarray] = {
+        "date": df_analyzed["date"].values[1:].astype("datetime64[ns]").view(np.int64)
+    }
+    for col in ("open", "high", "low", "close"):
+        arrays[col] = df_analyzed[col].to_numpy(dtype=np.float64)[1:].copy()
+
+    for col in SIGNAL_COLUMNS:
+        if col in df_analyzed.columns:
+            arrays[col] = (df_analyzed[col].to_numpy()[:-1] == 1).astype(np.int8)
+        else:
+            arrays[col] = np.zeros(length, dtype=np.int8)
+
+    for col in TAG_COLUMNS:
+        if col in df_analyzed.columns:
+            arrays[col] = _tag_codes(df_analyzed[col].to_numpy()[:-1], tags, tag_index)
+        else:
+            arrays[col] = np.full(length, -1, dtype=np.int32)
+
+    return ColumnarPairData(arrays, tags)
+
+
+def spill_columnar(pair_data: ColumnarPairData, directory: Path) -> ColumnarPairData:
+    """
+    Write the arrays of pair_data to .npy files and re-open them as read-only memory maps.
+    Pages of memory-mapped arrays are loaded on access and can be evicted by the operating
+    system - so spilled pairs don't need to stay in memory for the whole backtest.
+    :param pair_data: Columnar data of one pair
+    :param directory: Directory to store the arrays in. Must not be used for other pairs.
+    :return: ColumnarPairData object backed by the memory-mapped files
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    arrays: dict[str, np.ndarray] = {}
+    for col in ARRAY_COLUMNS:
+        array = getattr(pair_data, col)
+        if not len(array):
+            # Empty files can't be memory-mapped
+            arrays[col] = array
+            continue
+        filename = directory / f"{col}.npy"
+        np.save(filename, array)
+        arrays[col] = np.load(filename, mmap_mode="r")
+    return ColumnarPairData(arrays, pair_data.tags)
+
+
+def spill_dataframe(dataframe: DataFrame, directory: Path) -> DataFrame:
+    """
+    Write the numeric columns of dataframe to .npy files and re-open them as copy-on-write
+    memory maps, like spill_columnar(). Other columns (dates, tags) remain in memory.
+    :param dataframe: Dataframe to spill - not modified
+    :param directory: Directory to store the arrays in. Must not be used for other dataframes.
+    :return: Dataframe with the same columns and index, backed by the memory-mapped files
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    columns = {}
+    for idx, col in enumerate(dataframe.columns):
+        array = dataframe[col].to_numpy()
+        if array.dtype.kind not in "biuf" or not len(array):
+            columns[col] = dataframe[col]
+            continue
+        # Column names can't be used as filenames
+        filename = directory / f"{idx}.npy"
+        np.save(filename, array)
+        columns[col] = np.load(filename, mmap_mode="c")
+    # copy=False keeps one block per column - consolidating blocks would load all columns.
+    return DataFrame(columns, index=dataframe.index, copy=False)
+
+
+def find_next_exit_candidate(
+    pair_data: ColumnarPairData,
+    start: int,
+    low_threshold: float,
+    high_threshold: float,
+    exit_signal: Optional[np.ndarray] = None,
+) -> int:
+    """
+    Find the first candle (at or after start) on which an open trade could exit.
+    A candle is a candidate if its low is <= low_threshold, its high is >= high_threshold
+    or if the exit signal is set.
+    The search is conservative - it may return candles on which nothing happens,
+    but never skips a candle on which something could happen.
+    Scans in growing windows to avoid scanning the full remaining data for each trade.
+    :return: Index of the next candidate - or the last index if no candidate was found.
+    """
+    end = len(pair_data)
+    window = 64
+    while start < end:
+        stop = min(start + window, end)
+        hits = [
+            utf1st.find_1st(pair_data.low[start:stop], low_threshold, utf1st.cmp_smaller_eq),
+            utf1st.find_1st(pair_data.high[start:stop], high_threshold, utf1st.cmp_larger_eq),
+        ]
+        if exit_signal is not None:
+            hits.append(
+                utf1st.find_1st(exit_signal[start:stop].view(np.bool_), True, utf1st.cmp_equal)
+            )
+        found = [hit for hit in hits if hit >= 0]
+        if found:
+            return start + min(found)
+        start = stop
+        window *= 2
+    return end - 1
+
+
+class DetailPairData:
+    """
+    Detail timeframe candles of one pair, stored as contiguous NumPy buffers.
+    Contains an offset table mapping each main candle to the range of its detail candles,
+    so a detail window is a zero-copy slice.
+    """
+
+    __slots__ = ("date", "open", "high", "low", "close", "starts", "ends")
+
+    # Candle open time, as int64 nanoseconds since epoch (UTC)
+    date: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    # Detail candle range [starts[i], ends[i]) of main candle i
+    starts: np.ndarray
+    ends: np.ndarray
+
+    def __init__(self, df_detail: DataFrame, main_dates: np.ndarray, timeframe_ns: int) -> None:
+        """
+        :param df_detail: Detail timeframe OHLCV dataframe, sorted by date
+        :param main_dates: Main candle dates, as int64 nanoseconds
+        :param timeframe_ns: Length of one main candle, in nanoseconds
+        """
+        self.date = df_detail["date"].values.astype("datetime64[ns]").view(np.int64)
+        for col in ("open", "high", "low", "close"):
+            setattr(self, col, df_detail[col].to_numpy(dtype=np.float64))
+        self.starts = np.searchsorted(self.date, main_dates, side="left")
+        self.ends = np.searchsorted(self.date, main_dates + timeframe_ns, side="left")
+
+    def __len__(self) -> int:
+        return len(self.date)
+
+    def rows(self, idx: int, signals: tuple) -> list[tuple]:
+        """
+        Materialize the detail candles of the main candle at idx.
+        :param idx: Index of the main candle
+        :param signals: Signal and tag values of the main candle, applied to all detail candles
+        :return: List of rows in the layout of ``freqtrade.optimize.backtesting.HEADERS``.
+            Empty if no detail candles exist for this main candle.
+        """
+        start = self.starts[idx]
+        end = self.ends[idx]
+        if start >= end:
+            return []
+        return [
+            (Timestamp(date, tz="UTC"), o, h, low, c, *signals)
+            for date, o, h, low, c in zip(
+                self.date[start:end].tolist(),
+                self.open[start:end].tolist(),
+                self.high[start:end].tolist(),
+                self.low[start:end].tolist(),
+                self.close[start:end].tolist(),
+            )
+        ]
+
+
+def entry_signal_dates(data: dict[str, ColumnarPairData], can_short: bool) -> np.ndarray:
+    """
+    Collect the dates of all candles carrying an entry signal, across all pairs.
+    :param data: dict with ColumnarPairData per pair
+    :param can_short: Include short entry signals
+    :return: Sorted, unique int64 array of candle dates (nanoseconds)
+    """
+    dates = []
+    for pair_data in data.values():
+        signal = pair_data.enter_long.view(np.bool_)
+        if can_short:
+            signal = signal | pair_data.enter_short.view(np.bool_)
+        dates.append(pair_data.date[signal])
+    if not dates:
+        return np.empty(0, dtype=np.int64)
+    return np.unique(np.concatenate(dates))
@@ -5,19 +5,26 @@ This module contains the backtesting logic
 """
 
 import logging
+import sys
+from bisect import bisect_right
 from collections import defaultdict
-from copy import deepcopy
+from copy import copy, deepcopy
 from datetime import datetime, timedelta, timezone
-from typing import Any, Optional
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, Optional, Union, cast
 
+import numpy as np
+from joblib import Parallel, delayed, dump, load, wrap_non_picklable_objects
+from joblib.externals import cloudpickle
 from numpy import nan
-from pandas import DataFrame
+from pandas import DataFrame, Timestamp
 
-from freqtrade import constants
+from freqtrade import __version__, constants
 from freqtrade.configuration import TimeRange, validate_config_consistency
 from freqtrade.constants import DATETIME_PRINT_FORMAT, Config, IntOrInf, LongShort
 from freqtrade.data import history
-from freqtrade.data.btanalysis import find_existing_backtest_stats, trade_list_to_dataframe
+from freqtrade.data.btanalysis import find_existing_backtest_stats
 from freqtrade.data.converter import trim_dataframe, trim_dataframes
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.data.metrics import combined_dataframes_with_rel_mean
@@ -40,8 +47,29 @@ from freqtrade.exchange.exchange import Exchange
 from freqtrade.ft_types import BacktestResultType, get_BacktestResultType_default
 from freqtrade.leverage.liquidation_price import update_liquidation_prices
 from freqtrade.mixins import LoggingMixin
-from freqtrade.optimize.backtest_caching import get_strategy_run_id
+from freqtrade.optimize.backtest_caching import (
+    get_data_fingerprint,
+    get_indicator_cache_key,
+    get_strategy_run_id,
+    load_indicator_cache,
+    prune_indicator_cache,
+    store_indicator_cache,
+)
+from freqtrade.optimize.backtest_columnar import (
+    ColumnarPairData,
+    DetailPairData,
+    dataframe_to_columnar,
+    entry_signal_dates,
+    find_next_exit_candidate,
+    spill_columnar,
+    spill_dataframe,
+)
+from freqtrade.optimize.bt_hooks import BacktestHooks
+from freqtrade.optimize.bt_profiler import PROFILED_CALLBACKS, BacktestProfiler
 from freqtrade.optimize.bt_progress import BTProgress
+from freqtrade.optimize.bt_pruner import BacktestPruner
+from freqtrade.optimize.bt_signal_cache import SignalCache
+from freqtrade.optimize.bt_stream import BacktestStream
 from freqtrade.optimize.optimize_reports import (
     generate_backtest_stats,
     generate_rejected_signals,
@@ -51,6 +79,8 @@ from freqtrade.optimize.optimize_reports import (
     store_backtest_stats,
 )
 from freqtrade.persistence import (
+    BacktestOrder,
+    BacktestTrade,
     CustomDataWrapper,
     LocalTrade,
     Order,
@@ -62,9 +92,10 @@ from freqtrade.persistence import (
 from freqtrade.plugins.pairlistmanager import PairListManager
 from freqtrade.plugins.protectionmanager import ProtectionManager
 from freqtrade.resolvers import ExchangeResolver, StrategyResolver
+from freqtrade.resolvers.strategy_resolver import check_override
 from freqtrade.strategy.interface import IStrategy
 from freqtrade.strategy.strategy_wrapper import strategy_safe_wrapper
-from freqtrade.util import FtPrecise
+from freqtrade.util import FtPrecise, get_peak_memory_usage
 from freqtrade.util.migrations import migrate_data
 from freqtrade.wallets import Wallets
 
@@ -100,6 +131,16 @@ HEADERS = [
     "exit_tag",
 ]
 
+# Callbacks which are evaluated on every candle of an open trade (or which can reject exits).
+# Strategies overriding none of these can use the signals-only fast path.
+SIGNALS_ONLY_BLOCKING_CALLBACKS = (
+    "custom_exit",
+    "custom_sell",
+    "custom_stoploss",
+    "adjust_trade_position",
+    "confirm_trade_exit",
+)
+
 
 class Backtesting:
     """
@@ -125,6 +166,7 @@ class Backtesting:
         self.rejected_dict: dict[str, list] = {}
         self.rejected_df: dict[str, dict] = {}
         self.exited_dfs: dict[str, dict] = {}
+        self.checkpoint_file: Optional[Path] = None
 
         self._exchange_name = self.config["exchange"]["name"]
         if not exchange:
@@ -213,10 +255,72 @@ class Backtesting:
         self._can_short = self.trading_mode != TradingMode.SPOT
         self._position_stacking: bool = self.config.get("position_stacking", False)
         self.enable_protections: bool = self.config.get("enable_protections", False)
+        self.backtest_engine: str = self.config.get(
+            "backtest_engine", constants.BACKTEST_ENGINE_DEFAULT
+        )
+        self.indicator_cache: bool = self._init_indicator_cache()
+        self.memory_bounded: bool = self._init_memory_bounded()
+        self.profiler: Optional[BacktestProfiler] = (
+            BacktestProfiler() if self.config.get("backtest_profile_callbacks", False) else None
+        )
+        # Streams closed trades while backtesting - set by the webserver.
+        self.stream: Optional[BacktestStream] = None
+        # Stops hopeless backtests early - set by hyperopt.
+        self.pruner: Optional[BacktestPruner] = None
+        # Keep the converted candle data (including signals) of the first backtest() call and
+        # reuse it for all following calls - only valid while signals don't change between calls.
+        self.reuse_signals = False
+        self._signal_data: Optional[dict] = None
+        self._signal_detail: dict[str, DetailPairData] = {}
+        # Reuses signals calculated with the same parameter values - set by hyperopt.
+        self.signal_cache: Optional[SignalCache] = None
+        self.fast_math: bool = self.config.get("backtest_fast_math", False)
+        self.fast_math_verify: bool = self.config.get("backtest_fast_math_verify", False)
+        self.fast_math_tolerance: float = self.config.get(
+            "backtest_fast_math_tolerance", constants.FAST_MATH_TOLERANCE_DEFAULT
+        )
         migrate_data(config, self.exchange)
 
         self.init_backtest()
 
+    def _init_indicator_cache(self) -> bool:
+        if not self.config.get("backtest_indicator_cache", False):
+            return False
+        if self.config.get("freqai", {}).get("enabled", False) or self.config["exchange"].get(
+            "use_public_trades", False
+        ):
+            logger.warning(
+                "Indicator cache is not supported in combination with FreqAI "
+                "or public trades data. Disabling indicator cache."
+            )
+            return False
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            logger.warning("Indicator cache requires pyarrow. Disabling indicator cache.")
+            return False
+        return True
+
+    def _init_memory_bounded(self) -> bool:
+        if not self.config.get("backtest_memory_bounded", False):
+            return False
+        if self.config.get("export", "none") == "signals":
+            logger.warning(
+                "Memory-bounded mode does not keep analyzed dataframes, which are required "
+                "to export signals. Disabling memory-bounded mode."
+            )
+            return False
+        if self.backtest_engine != "columnar":
+            logger.info("Memory-bounded mode requires the columnar backtest engine. Using it.")
+            self.backtest_engine = "columnar"
+        if self.indicator_cache:
+            logger.warning(
+                "Indicator cache is not supported in memory-bounded mode. "
+                "Disabling indicator cache."
+            )
+            self.indicator_cache = False
+        return True
+
     def _validate_pairlists_for_backtesting(self):
         if "VolumePairList" in self.pairlists.name_list:
             raise OperationalException(
@@ -233,6 +337,32 @@ class Backtesting:
         LoggingMixin.show_output = True
         enable_database_use()
 
+    @staticmethod
+    def strategy_pickle_magic(bases) -> None:
+        """
+        Allow strategy inheritance across files when running in worker processes.
+        For this to properly work, we need to register the module of the imported class
+        to pickle as value.
+        """
+        for modules in bases:
+            if modules.__name__ != "IStrategy":
+                cloudpickle.register_pickle_by_value(sys.modules[modules.__module__])
+                Backtesting.strategy_pickle_magic(modules.__bases__)
+
+    def detach_exchange(self) -> None:
+        """
+        Release the exchange connection, which is no longer needed once all data is loaded.
+        Required before sending this instance to worker processes.
+        """
+        self.exchange.close()
+        self.exchange._api = None
+        self.exchange._api_async = None
+        self.exchange.loop = None  # type: ignore
+        self.exchange._loop_lock = None  # type: ignore
+        self.exchange._cache_lock = None  # type: ignore
+        # self.exchange = None  # type: ignore
+        self.pairlists = None  # type: ignore
+
     def init_backtest_detail(self) -> None:
         # Load detail timeframe if specified
         self.timeframe_detail = str(self.config.get("timeframe_detail", ""))
@@ -389,12 +519,16 @@ class Backtesting:
         PairLocks.reset_locks()
         Trade.reset_trades()
         CustomDataWrapper.reset_custom_data()
+        BacktestTrade.fast_math = self.fast_math
         self.rejected_trades = 0
         self.timedout_entry_orders = 0
         self.timedout_exit_orders = 0
         self.canceled_trade_entries = 0
         self.canceled_entry_orders = 0
         self.replaced_entry_orders = 0
+        self._signals_only = False
+        # trade_id -> (last processed candle index, next exit candidate index)
+        self._exit_candidates: dict[int, tuple[int, int]] = {}
         self.dataprovider.clear_cache()
         if enable_protections:
             self._load_protections(self.strategy)
@@ -408,6 +542,31 @@ class Backtesting:
             self.abort = False
             raise DependencyException("Stop requested")
 
+    def _advise_pair_signals(self, pair: str, processed: dict[str, DataFrame]) -> DataFrame:
+        """
+        Populate entry / exit signals for one pair and trim the startup period.
+        Updates the dataprovider cache and replaces processed[pair] with the trimmed dataframe.
+        :return: Trimmed, analyzed dataframe (not shifted)
+        """
+        pair_data = processed[pair]
+        if not pair_data.empty:
+            # Cleanup from prior runs - without modifying the passed dataframe
+            pair_data = pair_data.drop(HEADERS[5:] + ["buy", "sell"], axis=1, errors="ignore")
+        if self.signal_cache:
+            df_analyzed = self.signal_cache.advise_signals(self.strategy, pair, pair_data)
+        else:
+            df_analyzed = self.strategy.ft_advise_signals(pair_data, {"pair": pair})
+        # Update dataprovider cache
+        self.dataprovider._set_cached_df(
+            pair, self.timeframe, df_analyzed, self.config["candle_type_def"]
+        )
+
+        # Trim startup period from analyzed dataframe
+        df_analyzed = processed[pair] = trim_dataframe(
+            df_analyzed, self.timerange, startup_candles=self.required_startup
+        )
+        return df_analyzed
+
     def _get_ohlcv_as_lists(self, processed: dict[str, DataFrame]) -> dict[str, tuple]:
         """
         Helper function to convert a processed dataframes into lists for performance reasons.
@@ -423,27 +582,12 @@ class Backtesting:
 
         # Create dict with data
         for pair in processed.keys():
-            pair_data = processed[pair]
             self.check_abort()
             self.progress.increment()
 
-            if not pair_data.empty:
-                # Cleanup from prior runs
-                pair_data.drop(HEADERS[5:] + ["buy", "sell"], axis=1, errors="ignore")
-            df_analyzed = self.strategy.ft_advise_signals(pair_data, {"pair": pair})
-            # Update dataprovider cache
-            self.dataprovider._set_cached_df(
-                pair, self.timeframe, df_analyzed, self.config["candle_type_def"]
-            )
-
-            # Trim startup period from analyzed dataframe
-            df_analyzed = processed[pair] = pair_data = trim_dataframe(
-                df_analyzed, self.timerange, startup_candles=self.required_startup
-            )
-
             # Create a copy of the dataframe before shifting, that way the entry signal/tag
             # remains on the correct candle for callbacks.
-            df_analyzed = df_analyzed.copy()
+            df_analyzed = self._advise_pair_signals(pair, processed).copy()
 
             # To avoid using data from future, we use entry/exit signals shifted
             # from the previous candle
@@ -465,6 +609,92 @@ class Backtesting:
             data[pair] = df_analyzed[HEADERS].values.tolist() if not df_analyzed.empty else []
         return data
 
+    def _get_ohlcv_as_arrays(self, processed: dict[str, DataFrame]) -> dict[str, ColumnarPairData]:
+        """
+        Columnar alternative to _get_ohlcv_as_lists().
+        Converts processed dataframes into typed, contiguous NumPy buffers per pair.
+        Signals are shifted by one candle - identical to the list-based representation.
+
+        :param processed: a processed dictionary with format {pair, data}, which gets cleared to
+        optimize memory usage!
+        """
+        data: dict[str, ColumnarPairData] = {}
+        self.progress.init_step(BacktestState.CONVERT, len(processed))
+
+        for pair, pair_data in processed.items():
+            self.check_abort()
+            self.progress.increment()
+            if isinstance(pair_data, ColumnarPairData):
+                # Already analyzed and converted (memory-bounded mode)
+                data[pair] = pair_data
+            else:
+                data[pair] = dataframe_to_columnar(self._advise_pair_signals(pair, processed))
+        return data
+
+    def _advise_pairs_memory_bounded(
+        self, data: dict[str, DataFrame], spill_dir: Path
+    ) -> dict[str, ColumnarPairData]:
+        """
+        Memory-bounded alternative to populating indicators for all pairs at once.
+        Analyzes one pair at a time, converts the trimmed result to columnar arrays and spills
+        these to memory-mapped files - so only one analyzed dataframe is held in memory at a time.
+        Analyzed dataframes are only kept in the dataprovider cache if the strategy implements
+        callbacks (which may use dp.get_analyzed_dataframe()) - spilled to memory-mapped files
+        as well.
+        :param data: Dict of pair: raw candle dataframe - which is not modified
+        :param spill_dir: Directory for the memory-mapped files
+        :return: Dict of pair: ColumnarPairData, to be passed to backtest()
+        """
+        strategy = self.strategy
+        keep_analyzed = any(
+            callback in vars(strategy) or check_override(strategy, IStrategy, callback)
+            for callback in PROFILED_CALLBACKS
+        )
+        if keep_analyzed:
+            logger.info(
+                "Strategy implements callbacks - keeping analyzed dataframes for "
+                "dp.get_analyzed_dataframe() in memory-mapped files."
+            )
+        processed: dict[str, ColumnarPairData] = {}
+        self.progress.init_step(BacktestState.ANALYZE, len(data))
+        for idx, (pair, pair_data) in enumerate(data.items()):
+            self.check_abort()
+            self.progress.increment()
+            df_analyzed = strategy.ft_advise_signals(
+                strategy.advise_indicators(pair_data.copy(), {"pair": pair}), {"pair": pair}
+            )
+            if keep_analyzed:
+                df_analyzed = spill_dataframe(df_analyzed, spill_dir / str(idx) / "analyzed")
+                self.dataprovider._set_cached_df(
+                    pair, self.timeframe, df_analyzed, self.config["candle_type_def"]
+                )
+            df_analyzed = trim_dataframe(
+                df_analyzed, self.timerange, startup_candles=self.required_startup
+            )
+            # Pair names can't be used as directory names
+            processed[pair] = spill_columnar(
+                dataframe_to_columnar(df_analyzed), spill_dir / str(idx)
+            )
+            del df_analyzed
+        return processed
+
+    def _get_trimmed_timerange(
+        self, data: dict[str, DataFrame], timerange: TimeRange
+    ) -> Optional[tuple[datetime, datetime]]:
+        """
+        Timerange of the data after trimming the startup period.
+        Trims one pair at a time, so no trimmed copy of all pairs is held in memory.
+        :return: min_date, max_date - or None if no data is left after trimming
+        """
+        timeranges = []
+        for pair, pair_data in data.items():
+            trimmed = trim_dataframes({pair: pair_data}, timerange, self.required_startup)
+            if trimmed:
+                timeranges.append(history.get_timerange(trimmed))
+        if not timeranges:
+            return None
+        return min(t[0] for t in timeranges), max(t[1] for t in timeranges)
+
     def _get_close_rate(
         self, row: tuple, trade: LocalTrade, exit_: ExitCheckTuple, trade_dur: int
     ) -> float:
@@ -685,7 +915,11 @@ class Backtesting:
         )
 
     def _try_close_open_order(
-        self, order: Optional[Order], trade: LocalTrade, current_date: datetime, row: tuple
+        self,
+        order: Union[Order, BacktestOrder, None],
+        trade: LocalTrade,
+        current_date: datetime,
+        row: tuple,
     ) -> bool:
         """
         Check if an order is open and if it should've filled.
@@ -697,7 +931,8 @@ class Backtesting:
             strategy_safe_wrapper(self.strategy.order_filled, default_retval=None)(
                 pair=trade.pair,
                 trade=trade,  # type: ignore[arg-type]
-                order=order,
+                # BacktestOrder mirrors the Order model
+                order=cast(Order, order),
                 current_time=current_date,
             )
 
@@ -832,7 +1067,7 @@ class Backtesting:
         amount = amount_to_contract_precision(
             amount or trade.amount, trade.amount_precision, self.precision_mode, trade.contract_size
         )
-        order = Order(
+        order = BacktestOrder(
             id=self.order_id_counter,
             ft_trade_id=trade.id,
             order_date=exit_candle_time,
@@ -854,8 +1089,7 @@ class Backtesting:
             cost=amount * close_rate,
             ft_order_tag=exit_reason,
         )
-        order._trade_bt = trade
-        trade.orders.append(order)
+        trade.add_bt_order(order)  # type: ignore[arg-type]
         return trade
 
     def _check_trade_exit(
@@ -1088,7 +1322,7 @@ class Backtesting:
             if trade is None:
                 # Enter trade
                 self.trade_id_counter += 1
-                trade = LocalTrade(
+                trade = BacktestTrade(
                     id=self.trade_id_counter,
                     pair=pair,
                     base_currency=base_currency,
@@ -1119,7 +1353,7 @@ class Backtesting:
 
             trade.adjust_stop_loss(trade.open_rate, self.strategy.stoploss, initial=True)
 
-            order = Order(
+            order = BacktestOrder(
                 id=self.order_id_counter,
                 ft_trade_id=trade.id,
                 ft_is_open=True,
@@ -1142,25 +1376,31 @@ class Backtesting:
                 cost=amount * propose_rate + trade.fee_open,
                 ft_order_tag=entry_tag,
             )
-            order._trade_bt = trade
-            trade.orders.append(order)
+            trade.add_bt_order(order)  # type: ignore[arg-type]
             self._try_close_open_order(order, trade, current_time, row)
             trade.recalc_trade_from_orders()
 
         return trade
 
     def handle_left_open(
-        self, open_trades: dict[str, list[LocalTrade]], data: dict[str, list[tuple]]
+        self,
+        open_trades: dict[str, list[LocalTrade]],
+        data: dict[str, list[tuple]],
+        end_date: datetime,
     ) -> None:
         """
         Handling of left open trades at the end of backtesting
+        Trades are exited on the last candle at or before end_date - data can extend beyond
+        end_date when backtesting a part of the timerange.
         """
         for pair in open_trades.keys():
+            if not open_trades[pair]:
+                continue
+            exit_row = data[pair][self._get_end_index(data[pair], end_date) - 1]
             for trade in list(open_trades[pair]):
                 if trade.has_open_orders and trade.nr_of_successful_entries == 0:
                     # Ignore trade if entry-order did not fill yet
                     continue
-                exit_row = data[pair][-1]
                 self._exit_trade(
                     trade, exit_row, exit_row[OPEN_IDX], trade.amount, ExitType.FORCE_EXIT.value
                 )
@@ -1202,7 +1442,7 @@ class Backtesting:
         Check if any open order needs to be cancelled or replaced.
         Returns True if the trade should be deleted.
         """
-        for order in [o for o in trade.orders if o.ft_is_open]:
+        for order in trade.open_orders:
             oc = self.check_order_cancel(trade, order, current_time)
             if oc:
                 # delete trade due to order timeout
@@ -1236,12 +1476,12 @@ class Backtesting:
                     return True
                 else:
                     # Close additional entry order
-                    del trade.orders[trade.orders.index(order)]
+                    trade.remove_bt_order(order)
                     return False
             if order.side == trade.exit_side:
                 self.timedout_exit_orders += 1
                 # Close exit order and retry exiting on next signal.
-                del trade.orders[trade.orders.index(order)]
+                trade.remove_bt_order(order)
                 return False
         return None
 
@@ -1274,7 +1514,7 @@ class Backtesting:
                 # assumption: there can't be multiple open entry orders at any given time
                 return False
             else:
-                del trade.orders[trade.orders.index(order)]
+                trade.remove_bt_order(order)
                 self.canceled_entry_orders += 1
 
             # place new order if result was not None
@@ -1313,6 +1553,271 @@ class Backtesting:
             return None
         return row
 
+    def _get_detail_as_arrays(self, data: dict) -> dict[str, DetailPairData]:
+        """
+        Convert detail data to NumPy arrays, indexed by the candles of the main timeframe.
+        :param data: Main timeframe data, as returned by _get_ohlcv_as_lists / _get_ohlcv_as_arrays
+        :return: dict with DetailPairData per pair
+        """
+        if not self.timeframe_detail:
+            return {}
+        timeframe_ns = int(self.timeframe_td.total_seconds()) * 1_000_000_000
+        detail: dict[str, DetailPairData] = {}
+        for pair, pair_data in data.items():
+            if pair not in self.detail_data:
+                continue
+            detail[pair] = DetailPairData(
+                self.detail_data[pair], self._get_candle_dates(pair_data), timeframe_ns
+            )
+        return detail
+
+    @staticmethod
+    def _get_candle_dates(pair_data) -> np.ndarray:
+        """
+        Candle dates (int64 nanoseconds) of one pair,
+        as returned by _get_ohlcv_as_lists / _get_ohlcv_as_arrays.
+        """
+        if isinstance(pair_data, ColumnarPairData):
+            return pair_data.date
+        return np.array([row[DATE_IDX].value for row in pair_data], dtype=np.int64)
+
+    @staticmethod
+    def _get_end_index(pair_data, end_date: datetime) -> int:
+        """
+        Number of candles of one pair up to (and including) end_date.
+        """
+        end_ts = Timestamp(end_date).value
+        if isinstance(pair_data, ColumnarPairData):
+            return int(np.searchsorted(pair_data.date, end_ts, side="right"))
+        return bisect_right(pair_data, end_ts, key=lambda row: row[DATE_IDX].value)
+
+    def _restore_checkpoint(
+        self, data: dict, indexes: dict[str, int], start_date: datetime, end_date: datetime
+    ) -> datetime:
+        """
+        Incremental backtesting: Restore the simulator state saved by a prior backtest with
+        identical configuration and start date, which ended before end_date.
+        Moves the candle indexes of all pairs past the end of the prior backtest.
+        :return: Date to continue backtesting from - start_date if no checkpoint applies.
+        """
+        if not self.checkpoint_file or not self.checkpoint_file.is_file():
+            return start_date
+        checkpoint = load(self.checkpoint_file)
+        if (
+            checkpoint["freqtrade_version"] != __version__
+            or checkpoint["start_date"] != start_date
+            or checkpoint["end_date"] >= end_date
+        ):
+            return start_date
+
+        logger.info(
+            f"Resuming backtest from checkpoint at "
+            f"{checkpoint['end_date'].strftime(DATETIME_PRINT_FORMAT)}."
+        )
+        for attr, value in checkpoint["trades"].items():
+            setattr(LocalTrade, attr, value)
+        PairLocks.locks = checkpoint["locks"]
+        CustomDataWrapper.custom_data = checkpoint["custom_data"]
+        for attr, value in checkpoint["counters"].items():
+            setattr(self, attr, value)
+        self.rejected_dict = checkpoint["rejected_dict"]
+        self.wallets.update()
+
+        resume_ts = Timestamp(checkpoint["end_date"]).value
+        for pair, pair_data in data.items():
+            indexes[pair] = int(
+                np.searchsorted(self._get_candle_dates(pair_data), resume_ts, side="right")
+            )
+        return checkpoint["end_date"]
+
+    def _save_checkpoint(
+        self, data: dict, indexes: dict[str, int], start_date: datetime, end_date: datetime
+    ) -> None:
+        """
+        Incremental backtesting: Save the simulator state after the candle at end_date,
+        so a later backtest with a later end date can continue from here.
+        """
+        if not self.checkpoint_file:
+            return
+        if self._signals_only:
+            # Apply candles skipped by the signals-only fast path to open trades.
+            for pair, pair_data in data.items():
+                self._catch_up_skipped_candles(pair_data, pair, indexes[pair])
+        self.checkpoint_file.parent.mkdir(parents=True, exist_ok=True)
+        dump(
+            {
+                "freqtrade_version": __version__,
+                "start_date": start_date,
+                "end_date": end_date,
+                "trades": {
+                    "bt_trades": LocalTrade.bt_trades,
+                    "bt_trades_open": LocalTrade.bt_trades_open,
+                    "bt_trades_open_pp": LocalTrade.bt_trades_open_pp,
+                    "bt_open_open_trade_count": LocalTrade.bt_open_open_trade_count,
+                    "bt_total_profit": LocalTrade.bt_total_profit,
+                },
+                "locks": PairLocks.locks,
+                "custom_data": CustomDataWrapper.custom_data,
+                "counters": {
+                    attr: getattr(self, attr)
+                    for attr in (
+                        "trade_id_counter",
+                        "order_id_counter",
+                        "rejected_trades",
+                        "timedout_entry_orders",
+                        "timedout_exit_orders",
+                        "canceled_trade_entries",
+                        "canceled_entry_orders",
+                        "replaced_entry_orders",
+                    )
+                },
+                "rejected_dict": self.rejected_dict,
+            },
+            self.checkpoint_file,
+        )
+
+    def _is_idle_candle(
+        self, pair_data: ColumnarPairData, pair: str, row_index: int, current_ts: int
+    ) -> bool:
+        """
+        Columnar engine only.
+        A candle is idle if it's valid for the current time and nothing can happen on it.
+        That's the case if the pair has no open trades and the candle carries no entry signal.
+        With the signals-only fast path, candles before the next exit candidate
+        of all open trades are idle, too.
+        """
+        if row_index >= len(pair_data) or pair_data.date[row_index] > current_ts:
+            return False
+        open_trades = LocalTrade.bt_trades_open_pp[pair]
+        if not open_trades:
+            return not pair_data.has_entry_signal(row_index, self._can_short)
+        return (
+            self._signals_only
+            and not (
+                self._position_stacking and pair_data.has_entry_signal(row_index, self._can_short)
+            )
+            and all(self._exit_candidates.get(t.id, (0, -1))[1] > row_index for t in open_trades)
+        )
+
+    def _get_entry_signal_dates(self, data: dict[str, ColumnarPairData]) -> Optional[np.ndarray]:
+        """
+        Dates of all candles with entry signals, used by the time iterator to skip idle candles
+        while no trade is open.
+        Only available if bot_loop_start() doesn't need to be called on every candle.
+        """
+        strategy = self.strategy
+        if not strategy.skip_idle_bot_loop_start and (
+            "bot_loop_start" in vars(strategy)
+            or check_override(strategy, IStrategy, "bot_loop_start")
+        ):
+            return None
+        return entry_signal_dates(data, self._can_short)
+
+    @staticmethod
+    def _skip_to_candle(
+        data: dict[str, ColumnarPairData], indexes: dict[str, int], current_ts: int
+    ) -> None:
+        """
+        Move the candle index of all pairs to the first candle at or after current_ts.
+        """
+        for pair, pair_data in data.items():
+            indexes[pair] = int(np.searchsorted(pair_data.date, current_ts))
+
+    def _is_signals_only_strategy(self) -> bool:
+        """
+        Detect strategies which only use entry / exit signals, ROI, stoploss and trailing
+        settings. For these, candles of open trades can be skipped until one of the exit
+        conditions could trigger (signals-only fast path).
+        Requires the columnar engine.
+        """
+        strategy = self.strategy
+        if (
+            self.backtest_engine != "columnar"
+            or self.timeframe_detail
+            or self.trading_mode == TradingMode.FUTURES
+            or strategy.position_adjustment_enable
+            or strategy.use_custom_stoploss
+        ):
+            return False
+        if (
+            strategy.trailing_stop
+            and strategy.trailing_stop_positive is not None
+            and abs(strategy.trailing_stop_positive) > abs(strategy.stoploss)
+        ):
+            # A lower high could move the stoploss in this configuration.
+            return False
+        return not any(
+            callback in vars(strategy) or check_override(strategy, IStrategy, callback)
+            for callback in SIGNALS_ONLY_BLOCKING_CALLBACKS
+        )
+
+    def _catch_up_skipped_candles(
+        self, pair_data: ColumnarPairData, pair: str, row_index: int
+    ) -> None:
+        """
+        Signals-only fast path: Apply the candles skipped since the last processed candle
+        to the min / max rates of all open trades of this pair.
+        """
+        for trade in LocalTrade.bt_trades_open_pp[pair]:
+            candidate = self._exit_candidates.pop(trade.id, None)
+            if candidate is not None and candidate[0] + 1 < row_index:
+                trade.adjust_min_max_rates(
+                    float(pair_data.high[candidate[0] + 1 : row_index].max()),
+                    float(pair_data.low[candidate[0] + 1 : row_index].min()),
+                )
+
+    def _schedule_exit_candidates(
+        self, pair_data: ColumnarPairData, pair: str, row_index: int
+    ) -> None:
+        """
+        Signals-only fast path: Determine the next candle on which each open trade
+        of this pair could exit, using vectorized forward scans.
+        Trades with open orders are processed on every candle.
+        """
+        strategy = self.strategy
+        min_roi = min(strategy.minimal_roi.values()) if strategy.minimal_roi else None
+        for trade in LocalTrade.bt_trades_open_pp[pair]:
+            if trade.has_open_orders:
+                continue
+            leverage = trade.leverage or 1.0
+            # Small safety margin to account for rounding of profit ratios.
+            if trade.is_short:
+                low_threshold = trade.min_rate or trade.open_rate if strategy.trailing_stop else 0.0
+                if min_roi is not None:
+                    roi_rate = (
+                        trade.open_rate
+                        * (1 - min_roi / leverage)
+                        * (1 - trade.fee_open)
+                        / (1 + (trade.fee_close or 0.0))
+                    )
+                    low_threshold = max(low_threshold, roi_rate * (1 + 1e-6))
+                high_threshold = min(trade.stop_loss, trade.liquidation_price or trade.stop_loss)
+                exit_signal = pair_data.exit_short
+            else:
+                high_threshold = (
+                    trade.max_rate or trade.open_rate if strategy.trailing_stop else float("inf")
+                )
+                if min_roi is not None:
+                    roi_rate = (
+                        trade.open_rate
+                        * (1 + min_roi / leverage)
+                        * (1 + trade.fee_open)
+                        / (1 - (trade.fee_close or 0.0))
+                    )
+                    high_threshold = min(high_threshold, roi_rate * (1 - 1e-6))
+                low_threshold = max(trade.stop_loss, trade.liquidation_price or trade.stop_loss)
+                exit_signal = pair_data.exit_long
+            self._exit_candidates[trade.id] = (
+                row_index,
+                find_next_exit_candidate(
+                    pair_data,
+                    row_index + 1,
+                    low_threshold,
+                    high_threshold,
+                    exit_signal if strategy.use_exit_signal else None,
+                ),
+            )
+
     def _collate_rejected(self, pair, row):
         """
         Temporarily store rejected signal information for downstream use in backtesting_analysis
@@ -1381,19 +1886,46 @@ class Backtesting:
                 self._process_exit_order(order, trade, current_time, row, pair)
 
     def time_pair_generator(
-        self, start_date: datetime, end_date: datetime, increment: timedelta, pairs: list[str]
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        increment: timedelta,
+        pairs: list[str],
+        entry_dates: Optional[np.ndarray] = None,
     ):
         """
         Backtest time and pair generator
+        :param entry_dates: Sorted dates (int64 nanoseconds) of candles with entry signals.
+            If provided, candles are skipped while no trade is open,
+            jumping straight to the next candle with an entry signal.
         """
         current_time = start_date + increment
         self.progress.init_step(
             BacktestState.BACKTEST, int((end_date - start_date) / self.timeframe_td)
         )
+        increment_ns = int(increment.total_seconds()) * 1_000_000_000
         while current_time <= end_date:
+            if entry_dates is not None and not LocalTrade.bt_trades_open:
+                current_ts = Timestamp(current_time).value
+                next_idx = np.searchsorted(entry_dates, current_ts)
+                next_ts = entry_dates[next_idx] if next_idx < len(entry_dates) else None
+                if next_ts is None or next_ts > current_ts:
+                    # Nothing is open - jump to the next candle with an entry signal.
+                    if next_ts is None:
+                        steps = (end_date - current_time) // increment + 1
+                    else:
+                        steps = -(-int(next_ts - current_ts) // increment_ns)
+                    current_time += increment * steps
+                    self.progress.increment(steps)
+                    continue
+
             is_first = True
             # Pairs that have open trades should be processed first
-            new_pairlist = list(dict.fromkeys([t.pair for t in LocalTrade.bt_trades_open] + pairs))
+            new_pairlist = (
+                list(dict.fromkeys([t.pair for t in LocalTrade.bt_trades_open] + pairs))
+                if LocalTrade.bt_trades_open
+                else pairs
+            )
 
             for pair in new_pairlist:
                 yield current_time, pair, is_first
@@ -1402,6 +1934,151 @@ class Backtesting:
             self.progress.increment()
             current_time += increment
 
+    def _get_signal_data(self, processed: dict) -> tuple[dict, dict[str, DetailPairData]]:
+        """
+        Convert the processed dataframes to lists (or columnar arrays) and detail candles.
+        With `reuse_signals`, the data converted by the first call is returned by all
+        following calls.
+        """
+        if self.reuse_signals and self._signal_data is not None:
+            # Detail candles are indexed by the (unchanged) main candles.
+            return self._signal_data, self._signal_detail
+        data = (
+            self._get_ohlcv_as_arrays(processed)
+            if self.backtest_engine == "columnar"
+            else self._get_ohlcv_as_lists(processed)
+        )
+        detail = self._get_detail_as_arrays(data)
+        if self.reuse_signals:
+            self._signal_data = data
+            self._signal_detail = detail
+        return data, detail
+
+    def _start_candle(self, current_time: datetime, hooks: BacktestHooks) -> bool:
+        """
+        Called once per candle, before the pairs are processed.
+        :return: True if the backtest should stop
+        """
+        self.check_abort()
+        PairLocks.expire_locks(current_time)
+        strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)(
+            current_time=current_time
+        )
+        return hooks.update(current_time, self.wallets)
+
+    def _backtest_detail_candles(
+        self,
+        pair_detail: DetailPairData,
+        row: tuple,
+        pair: str,
+        row_index: int,
+        current_time: datetime,
+        trade_dir: Optional[LongShort],
+        is_last_row: bool,
+    ) -> None:
+        """
+        Spread out one candle into the detail timeframe.
+        Signals and tags of the main candle apply to all detail candles.
+        """
+        detail_rows = pair_detail.rows(row_index - 1, row[LONG_IDX:])
+        if len(detail_rows) == 0:
+            # Fall back to "regular" data if no detail data was found for this candle
+            self.dataprovider._set_dataframe_max_date(current_time)
+            self.backtest_loop(row, pair, current_time, trade_dir, not is_last_row)
+            return
+        is_first = True
+        current_time_det = current_time
+        for det_row in detail_rows:
+            self.dataprovider._set_dataframe_max_date(current_time_det)
+            self.backtest_loop(
+                det_row,
+                pair,
+                current_time_det,
+                trade_dir,
+                is_first and not is_last_row,
+            )
+            current_time_det += self.timeframe_detail_td
+            is_first = False
+
+    def _backtest_pair_candle(
+        self,
+        data: dict,
+        detail: dict[str, DetailPairData],
+        indexes: dict[str, int],
+        pair: str,
+        current_time: datetime,
+        current_ts: int,
+        end_date: datetime,
+    ) -> None:
+        """
+        Process the candle of one pair at current_time.
+        :param current_ts: current_time as int64 nanoseconds - columnar engine only
+        """
+        columnar = self.backtest_engine == "columnar"
+        row_index = indexes[pair]
+        if columnar and self._is_idle_candle(data[pair], pair, row_index, current_ts):
+            # Nothing can happen on this candle - skip materializing the row.
+            row_index += 1
+            indexes[pair] = row_index
+            self.dataprovider._set_dataframe_max_index(self.required_startup + row_index)
+            self.dataprovider._set_dataframe_max_date(current_time)
+            return
+        row = self.validate_row(data, pair, row_index, current_time)
+        if not row:
+            return
+        if self._signals_only:
+            self._catch_up_skipped_candles(data[pair], pair, row_index)
+
+        row_index += 1
+        indexes[pair] = row_index
+        is_last_row = current_time == end_date
+        self.dataprovider._set_dataframe_max_index(self.required_startup + row_index)
+        self.dataprovider._set_dataframe_max_date(current_time)
+        trade_dir: Optional[LongShort] = self.check_for_trade_entry(row)
+
+        if (
+            trade_dir is not None or len(LocalTrade.bt_trades_open_pp[pair]) > 0
+        ) and pair in detail:
+            # Spread out into detail timeframe.
+            # Should only happen when we are either in a trade for this pair
+            # or when we got the signal for a new trade.
+            self._backtest_detail_candles(
+                detail[pair], row, pair, row_index, current_time, trade_dir, is_last_row
+            )
+        else:
+            self.dataprovider._set_dataframe_max_date(current_time)
+            self.backtest_loop(row, pair, current_time, trade_dir, not is_last_row)
+            if self._signals_only:
+                self._schedule_exit_candidates(data[pair], pair, row_index - 1)
+
+    def _finish_backtest(
+        self,
+        data: dict,
+        indexes: dict[str, int],
+        start_date: datetime,
+        end_date: datetime,
+        checkpoint_saved: bool,
+        hooks: BacktestHooks,
+    ) -> None:
+        """
+        Apply the candles skipped at the end of the timerange, save the checkpoint (if not
+        saved yet) and close trades left open.
+        """
+        if hooks.stopped:
+            # A stopped backtest only reports the trades closed until then.
+            return
+        if self._signals_only:
+            # Apply candles skipped at the end of the timerange to open trades.
+            for pair, pair_data in data.items():
+                self._catch_up_skipped_candles(
+                    pair_data, pair, self._get_end_index(pair_data, end_date)
+                )
+        if not checkpoint_saved:
+            # The last candle was skipped - no trade is open.
+            self._save_checkpoint(data, indexes, start_date, end_date - self.timeframe_td)
+
+        self.handle_left_open(LocalTrade.bt_trades_open_pp, data=data, end_date=end_date)
+
     def backtest(self, processed: dict, start_date: datetime, end_date: datetime) -> dict[str, Any]:
         """
         Implement backtesting functionality
@@ -1411,7 +2088,7 @@ class Backtesting:
         Avoid extensive logging in this method and functions it calls.
 
         :param processed: a processed dictionary with format {pair, data}, which gets cleared to
-        optimize memory usage!
+        optimize memory usage! Not used if `reuse_signals` is set and data was already converted.
         :param start_date: backtesting timerange start datetime
         :param end_date: backtesting timerange end datetime
         :return: DataFrame with trades (results of backtesting)
@@ -1419,84 +2096,52 @@ class Backtesting:
         self.prepare_backtest(self.enable_protections)
         # Ensure wallets are up-to-date (important for --strategy-list)
         self.wallets.update()
-        # Use dict of lists with data for performance
+        columnar = self.backtest_engine == "columnar"
+        self._signals_only = self._is_signals_only_strategy()
+        hooks = BacktestHooks(self.profiler, self.stream, self.pruner)
+        hooks.start(self, start_date, end_date)
+        # Use dict of lists (or columnar arrays) with data for performance
         # (looping lists is a lot faster than pandas DataFrames)
-        data: dict = self._get_ohlcv_as_lists(processed)
+        data, detail = self._get_signal_data(processed)
+        entry_dates = self._get_entry_signal_dates(data) if columnar else None
 
         # Indexes per pair, so some pairs are allowed to have a missing start.
         indexes: dict = defaultdict(int)
+        current_ts = 0
+        resume_date = self._restore_checkpoint(data, indexes, start_date, end_date)
+        checkpoint_saved = False
+        next_ts = Timestamp(resume_date + self.timeframe_td).value
+        increment_ns = next_ts - Timestamp(resume_date).value
 
         # Loop timerange and get candle for each pair at that point in time
         for current_time, pair, is_first_call in self.time_pair_generator(
-            start_date, end_date, self.timeframe_td, list(data.keys())
+            resume_date, end_date, self.timeframe_td, list(data.keys()), entry_dates
         ):
             if is_first_call:
-                self.check_abort()
-                strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)(
-                    current_time=current_time
-                )
-            row_index = indexes[pair]
-            row = self.validate_row(data, pair, row_index, current_time)
-            if not row:
-                continue
-
-            row_index += 1
-            indexes[pair] = row_index
-            is_last_row = current_time == end_date
-            self.dataprovider._set_dataframe_max_index(self.required_startup + row_index)
-            self.dataprovider._set_dataframe_max_date(current_time)
-            current_detail_time: datetime = row[DATE_IDX].to_pydatetime()
-            trade_dir: Optional[LongShort] = self.check_for_trade_entry(row)
-
-            if (
-                (trade_dir is not None or len(LocalTrade.bt_trades_open_pp[pair]) > 0)
-                and self.timeframe_detail
-                and pair in self.detail_data
-            ):
-                # Spread out into detail timeframe.
-                # Should only happen when we are either in a trade for this pair
-                # or when we got the signal for a new trade.
-                exit_candle_end = current_detail_time + self.timeframe_td
-
-                detail_data = self.detail_data[pair]
-                detail_data = detail_data.loc[
-                    (detail_data["date"] >= current_detail_time)
-                    & (detail_data["date"] < exit_candle_end)
-                ].copy()
-                if len(detail_data) == 0:
-                    # Fall back to "regular" data if no detail data was found for this candle
-                    self.dataprovider._set_dataframe_max_date(current_time)
-                    self.backtest_loop(row, pair, current_time, trade_dir, not is_last_row)
-                    continue
-                detail_data.loc[:, "enter_long"] = row[LONG_IDX]
-                detail_data.loc[:, "exit_long"] = row[ELONG_IDX]
-                detail_data.loc[:, "enter_short"] = row[SHORT_IDX]
-                detail_data.loc[:, "exit_short"] = row[ESHORT_IDX]
-                detail_data.loc[:, "enter_tag"] = row[ENTER_TAG_IDX]
-                detail_data.loc[:, "exit_tag"] = row[EXIT_TAG_IDX]
-                is_first = True
-                current_time_det = current_time
-                for det_row in detail_data[HEADERS].values.tolist():
-                    self.dataprovider._set_dataframe_max_date(current_time_det)
-                    self.backtest_loop(
-                        det_row,
-                        pair,
-                        current_time_det,
-                        trade_dir,
-                        is_first and not is_last_row,
+                if self._start_candle(current_time, hooks):
+                    break
+                if columnar:
+                    current_ts = Timestamp(current_time).value
+                    if current_ts > next_ts:
+                        # Candles were skipped by the time iterator - move all pairs forward.
+                        self._skip_to_candle(data, indexes, current_ts)
+                    next_ts = current_ts + increment_ns
+                if current_time == end_date:
+                    # Save the state before the last candle, which doesn't allow new entries.
+                    self._save_checkpoint(
+                        data, indexes, start_date, current_time - self.timeframe_td
                     )
-                    current_time_det += self.timeframe_detail_td
-                    is_first = False
-            else:
-                self.dataprovider._set_dataframe_max_date(current_time)
-                self.backtest_loop(row, pair, current_time, trade_dir, not is_last_row)
+                    checkpoint_saved = True
+            self._backtest_pair_candle(
+                data, detail, indexes, pair, current_time, current_ts, end_date
+            )
 
-        self.handle_left_open(LocalTrade.bt_trades_open_pp, data=data)
+        self._finish_backtest(data, indexes, start_date, end_date, checkpoint_saved, hooks)
         self.wallets.update()
+        if self.fast_math and self.fast_math_verify:
+            self.verify_fast_math(LocalTrade.bt_trades)
 
-        results = trade_list_to_dataframe(LocalTrade.bt_trades)
-        return {
-            "results": results,
+        bt_results: dict[str, Any] = {
             "config": self.strategy.config,
             "locks": PairLocks.get_all_locks(),
             "rejected_signals": self.rejected_trades,
@@ -1507,6 +2152,79 @@ class Backtesting:
             "replaced_entry_orders": self.replaced_entry_orders,
             "final_balance": self.wallets.get_total(self.strategy.config["stake_currency"]),
         }
+        hooks.finish(end_date, self.wallets, bt_results)
+        return bt_results
+
+    def verify_fast_math(self, trades: list[LocalTrade]) -> tuple[float, float]:
+        """
+        Re-calculate profits of closed trades using FtPrecise, and report the maximum
+        deviation of the float arithmetic used with fast math.
+        :param trades: Closed trades to verify
+        :return: Tuple of maximum absolute deviation of profit_abs and profit_ratio
+        """
+        max_abs_dev = 0.0
+        max_ratio_dev = 0.0
+        BacktestTrade.fast_math = False
+        try:
+            for trade in trades:
+                precise_trade = copy(trade)
+                precise_trade.recalc_trade_from_orders(is_closing=True)
+                max_abs_dev = max(
+                    max_abs_dev,
+                    abs((precise_trade.close_profit_abs or 0.0) - (trade.close_profit_abs or 0.0)),
+                )
+                max_ratio_dev = max(
+                    max_ratio_dev,
+                    abs((precise_trade.close_profit or 0.0) - (trade.close_profit or 0.0)),
+                )
+        finally:
+            BacktestTrade.fast_math = self.fast_math
+
+        msg = (
+            f"Fast math verification of {len(trades)} trades: maximum deviation "
+            f"{max_abs_dev:.2e} (profit_abs), {max_ratio_dev:.2e} (profit_ratio)."
+        )
+        if max(max_abs_dev, max_ratio_dev) > self.fast_math_tolerance:
+            logger.warning(f"{msg} Exceeds the tolerance of {self.fast_math_tolerance:.2e}.")
+        else:
+            logger.info(msg)
+        return max_abs_dev, max_ratio_dev
+
+    def _advise_all_indicators(
+        self, data: dict[str, DataFrame], timerange: TimeRange
+    ) -> dict[str, DataFrame]:
+        """
+        Populate indicators for all pairs.
+        With the indicator cache enabled, indicators are loaded from the cache if neither
+        the indicator code of the strategy nor the underlying data changed.
+        """
+        if not self.indicator_cache:
+            return self.strategy.advise_all_indicators(data)
+
+        cache_dir = self.config["user_data_dir"] / "backtest_results" / ".cache"
+        candle_type = self.config.get("candle_type_def", CandleType.SPOT)
+        pairs = [(pair, self.timeframe, candle_type) for pair in data]
+        pairs += self.strategy.gather_informative_pairs()
+        key = get_indicator_cache_key(
+            self.strategy,
+            timerange,
+            self.required_startup,
+            get_data_fingerprint(self.config, pairs),
+        )
+        strategy_name = self.strategy.get_strategy_name()
+        preprocessed = load_indicator_cache(cache_dir, key)
+        if preprocessed is not None and preprocessed.keys() == data.keys():
+            logger.info(f"Using cached indicators for {strategy_name}.")
+            return preprocessed
+
+        preprocessed = self.strategy.advise_all_indicators(data)
+        try:
+            store_indicator_cache(cache_dir, key, preprocessed)
+            prune_indicator_cache(cache_dir)
+        except Exception as e:
+            # Indicator columns which can't be stored in feather format (e.g. mixed types).
+            logger.warning(f"Could not cache indicators for {strategy_name}: {e}")
+        return preprocessed
 
     def backtest_one_strategy(
         self, strat: IStrategy, data: dict[str, DataFrame], timerange: TimeRange
@@ -1516,6 +2234,11 @@ class Backtesting:
         logger.info(f"Running backtesting for Strategy {strategy_name}")
         backtest_start_time = datetime.now(timezone.utc)
         self._set_strategy(strat)
+        if self._is_signals_only_strategy():
+            logger.info(
+                "Strategy only uses signals, ROI, stoploss and trailing settings - "
+                "using signals-only fast path."
+            )
 
         # Use max_open_trades in backtesting, except --disable-max-market-positions is set
         if not self.config.get("use_max_market_positions", True):
@@ -1524,35 +2247,65 @@ class Backtesting:
             self.config.update({"max_open_trades": self.strategy.max_open_trades})
 
         # need to reprocess data every time to populate signals
-        preprocessed = self.strategy.advise_all_indicators(data)
+        # In memory-bounded mode, pairs are analyzed one at a time right before the backtest.
+        preprocessed = {} if self.memory_bounded else self._advise_all_indicators(data, timerange)
+
+        if self.config.get("backtest_incremental", False):
+            checkpoint_id = get_strategy_run_id(strat, ignore_timerange_end=True)
+            self.checkpoint_file = (
+                self.config["user_data_dir"]
+                / "backtest_results"
+                / ".cache"
+                / f"checkpoint-{strategy_name}-{checkpoint_id}.pkl"
+            )
+        else:
+            self.checkpoint_file = None
 
-        # Trim startup period from analyzed dataframe
-        # This only used to determine if trimming would result in an empty dataframe
-        preprocessed_tmp = trim_dataframes(preprocessed, timerange, self.required_startup)
+        if self.memory_bounded:
+            preprocessed_tmp: dict[str, DataFrame] = {}
+            bt_timerange = self._get_trimmed_timerange(data, timerange)
+        else:
+            # Trim startup period from analyzed dataframe
+            # This only used to determine if trimming would result in an empty dataframe
+            preprocessed_tmp = trim_dataframes(preprocessed, timerange, self.required_startup)
+            # Use preprocessed_tmp for date generation (the trimmed dataframe).
+            # Backtesting will re-trim the dataframes after entry/exit signal generation.
+            bt_timerange = history.get_timerange(preprocessed_tmp) if preprocessed_tmp else None
 
-        if not preprocessed_tmp:
+        if not bt_timerange:
             raise OperationalException("No data left after adjusting for startup candles.")
 
-        # Use preprocessed_tmp for date generation (the trimmed dataframe).
-        # Backtesting will re-trim the dataframes after entry/exit signal generation.
-        min_date, max_date = history.get_timerange(preprocessed_tmp)
+        min_date, max_date = bt_timerange
         logger.info(
             f"Backtesting with data from {min_date.strftime(DATETIME_PRINT_FORMAT)} "
             f"up to {max_date.strftime(DATETIME_PRINT_FORMAT)} "
             f"({(max_date - min_date).days} days)."
         )
         # Execute backtest and store results
-        results = self.backtest(
-            processed=preprocessed,
-            start_date=min_date,
-            end_date=max_date,
-        )
+        if self.memory_bounded:
+            cache_dir = self.config["user_data_dir"] / "backtest_results" / ".cache"
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            with TemporaryDirectory(
+                prefix="memmap-", dir=cache_dir, ignore_cleanup_errors=True
+            ) as spill_dir:
+                results = self.backtest(
+                    processed=self._advise_pairs_memory_bounded(data, Path(spill_dir)),
+                    start_date=min_date,
+                    end_date=max_date,
+                )
+        else:
+            results = self.backtest(
+                processed=preprocessed,
+                start_date=min_date,
+                end_date=max_date,
+            )
         backtest_end_time = datetime.now(timezone.utc)
         results.update(
             {
                 "run_id": self.run_ids.get(strategy_name, ""),
                 "backtest_start_time": int(backtest_start_time.timestamp()),
                 "backtest_end_time": int(backtest_end_time.timestamp()),
+                "peak_memory": get_peak_memory_usage(),
             }
         )
         self.all_results[strategy_name] = results
@@ -1573,6 +2326,80 @@ class Backtesting:
 
         return min_date, max_date
 
+    def _backtest_strategy_worker(
+        self,
+        strat: IStrategy,
+        data: dict[str, DataFrame],
+        detail_data: dict[str, DataFrame],
+        timerange: TimeRange,
+    ) -> tuple:
+        """
+        Run backtest_one_strategy() in a worker process.
+        Returns the results of this strategy, to be merged in the main process.
+        """
+        self.detail_data = detail_data
+        strategy_name = strat.get_strategy_name()
+        min_date, max_date = self.backtest_one_strategy(strat, data, timerange)
+        return (
+            strategy_name,
+            min_date,
+            max_date,
+            self.all_results[strategy_name],
+            self.processed_dfs.get(strategy_name),
+            self.rejected_df.get(strategy_name),
+            self.exited_dfs.get(strategy_name),
+        )
+
+    def backtest_strategies_parallel(
+        self,
+        strategies: list[IStrategy],
+        data: dict[str, DataFrame],
+        timerange: TimeRange,
+        jobs: int,
+    ) -> tuple[datetime, datetime]:
+        """
+        Backtest multiple strategies, each in its own worker process.
+        Candle data is passed to the workers as arguments, so joblib memory-maps it once
+        and shares it between all workers instead of copying it for every strategy.
+        :return: min_date, max_date of the backtested data
+        """
+        for strat in strategies:
+            self.strategy_pickle_magic(strat.__class__.__bases__)
+        # We don't need the exchange instance anymore while running the backtests
+        self.detach_exchange()
+        # Detail data is shared as argument - and should not be pickled with this instance.
+        detail_data, self.detail_data = self.detail_data, {}
+        try:
+            with Parallel(n_jobs=jobs) as parallel:
+                logger.info(
+                    f"Backtesting {len(strategies)} strategies using "
+                    f"{parallel._effective_n_jobs()} parallel workers."
+                )
+                results = parallel(
+                    delayed(wrap_non_picklable_objects(self._backtest_strategy_worker))(
+                        strat, data, detail_data, timerange
+                    )
+                    for strat in strategies
+                )
+        finally:
+            self.detail_data = detail_data
+
+        for (
+            strategy_name,
+            min_date,
+            max_date,
+            strategy_results,
+            processed_df,
+            rejected_df,
+            exited_df,
+        ) in results:
+            self.all_results[strategy_name] = strategy_results
+            if processed_df is not None:
+                self.processed_dfs[strategy_name] = processed_df
+                self.rejected_df[strategy_name] = rejected_df
+                self.exited_dfs[strategy_name] = exited_df
+        return min_date, max_date
+
     def _get_min_cached_backtest_date(self):
         min_backtest_date = None
         backtest_cache_age = self.config.get("backtest_cache", constants.BACKTEST_CACHE_DEFAULT)
@@ -1612,12 +2439,22 @@ class Backtesting:
 
         self.load_prior_backtest()
 
+        strategies = []
         for strat in self.strategylist:
             if self.results and strat.get_strategy_name() in self.results["strategy"]:
                 # When previous result hash matches - reuse that result and skip backtesting.
                 logger.info(f"Reusing result of previous backtest for {strat.get_strategy_name()}")
                 continue
-            min_date, max_date = self.backtest_one_strategy(strat, data, timerange)
+            strategies.append(strat)
+
+        jobs = self.config.get("strategy_list_jobs", 1)
+        if len(strategies) > 1 and jobs != 1:
+            min_date, max_date = self.backtest_strategies_parallel(
+                strategies, data, timerange, jobs
+            )
+        else:
+            for strat in strategies:
+                min_date, max_date = self.backtest_one_strategy(strat, data, timerange)
 
         # Update old results with new ones.
         if len(self.all_results) > 0:
@@ -1638,6 +2475,7 @@ class Backtesting:
                     self.results,
                     dt_appendix,
                     market_change_data=combined_res,
+                    export_format=self.config.get("export_format", "json"),
                 )
 
             if (
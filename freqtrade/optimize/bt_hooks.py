@@ -0,0 +1,72 @@
+from datetime import datetime
+from typing import Any, Optional
+
+from freqtrade.data.btanalysis import trade_list_to_dataframe
+from freqtrade.optimize.bt_profiler import BacktestProfiler
+from freqtrade.optimize.bt_pruner import BacktestPruner
+from freqtrade.optimize.bt_stream import BacktestStream
+from freqtrade.persistence import LocalTrade
+
+
+class BacktestHooks:
+    """
+    Optional observers of a running backtest (callback profiler, trade stream and pruner).
+    Called before the candle loop, once per candle and after the loop.
+    """
+
+    def __init__(
+        self,
+        profiler: Optional[BacktestProfiler] = None,
+        stream: Optional[BacktestStream] = None,
+        pruner: Optional[BacktestPruner] = None,
+    ) -> None:
+        self.profiler = profiler
+        self.stream = stream
+        self.pruner = pruner
+
+    @property
+    def stopped(self) -> bool:
+        """
+        True if the pruner stopped the backtest.
+        """
+        return self.pruner is not None and self.pruner.loss is not None
+
+    def start(self, backtesting, start_date: datetime, end_date: datetime) -> None:
+        """
+        Reset all observers for a new backtest.
+        :param backtesting: Backtesting instance - with the strategy and wallets prepared.
+        """
+        if self.profiler:
+            self.profiler.start(backtesting)
+        if self.stream:
+            self.stream.start(
+                backtesting.strategy.get_strategy_name(),
+                backtesting.config["stake_currency"],
+                backtesting.progress,
+            )
+        if self.pruner:
+            self.pruner.start(start_date, end_date, backtesting.wallets.get_starting_balance())
+
+    def update(self, current_time: datetime, wallets) -> bool:
+        """
+        Called once per candle - keep it fast.
+        :return: True if the backtest should stop
+        """
+        if self.stream:
+            self.stream.update(current_time, LocalTrade.bt_trades, wallets)
+        return self.pruner is not None and self.pruner.update(current_time, LocalTrade.bt_trades)
+
+    def finish(self, end_date: datetime, wallets, bt_results: dict[str, Any]) -> None:
+        """
+        Add the results of the backtest - and of all observers - to bt_results.
+        """
+        if self.stream:
+            # Build results from the streamed trades, avoiding serializing trades twice.
+            self.stream.finish(end_date, LocalTrade.bt_trades, wallets)
+            bt_results["results"] = self.stream.results()
+        else:
+            bt_results["results"] = trade_list_to_dataframe(LocalTrade.bt_trades)
+        if self.pruner:
+            bt_results["pruned_loss"] = self.pruner.loss
+        if self.profiler:
+            bt_results["callback_profile"] = self.profiler.stop()
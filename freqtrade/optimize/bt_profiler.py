@@ -0,0 +1,147 @@
+from collections import defaultdict
+from functools import wraps
+from time import perf_counter_ns
+from typing import Any, Callable
+
+import numpy as np
+
+from freqtrade.persistence import PairLocks
+from freqtrade.resolvers.strategy_resolver import check_override
+from freqtrade.strategy.interface import IStrategy
+
+
+# Strategy callbacks - only profiled if implemented by the strategy.
+PROFILED_CALLBACKS = (
+    "bot_loop_start",
+    "custom_stake_amount",
+    "custom_entry_price",
+    "custom_exit_price",
+    "confirm_trade_entry",
+    "confirm_trade_exit",
+    "custom_exit",
+    "custom_sell",
+    "custom_stoploss",
+    "adjust_trade_position",
+    "adjust_entry_price",
+    "check_entry_timeout",
+    "check_exit_timeout",
+    "order_filled",
+    "leverage",
+)
+
+# Stages of the backtest loop (methods of Backtesting).
+PROFILED_STAGES = (
+    "_get_ohlcv_as_lists",
+    "_get_ohlcv_as_arrays",
+    "backtest_loop",
+    "_check_trade_exit",
+    "_enter_trade",
+    "manage_open_orders",
+    "run_protections",
+    "handle_left_open",
+)
+
+
+class BacktestProfiler:
+    """
+    Measures call counts and durations of strategy callbacks and backtest loop stages.
+    Functions are wrapped on the instances (or class, for PairLocks) while a backtest is running -
+    so there's no overhead if profiling is disabled.
+    Durations are inclusive - so the time of a callback is also part of the stage calling it.
+    """
+
+    def __init__(self) -> None:
+        self._timings: dict[str, list[int]] = defaultdict(list)
+        self._patched: list[tuple[Any, str, Any]] = []
+        self._start = 0
+
+    def _wrap(self, name: str, func: Callable) -> Callable:
+        timings = self._timings[name]
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                timings.append(perf_counter_ns() - start)
+
+        return wrapper
+
+    def _patch(self, obj: Any, attr: str, name: str, restore: Any = None) -> None:
+        self._patched.append((obj, attr, restore))
+        setattr(obj, attr, self._wrap(name, getattr(obj, attr)))
+
+    def start(self, backtesting) -> None:
+        """
+        Start profiling a backtest.
+        :param backtesting: Backtesting instance - with the strategy already set.
+        """
+        self.stop()
+        self._timings.clear()
+        strategy = backtesting.strategy
+        for callback in PROFILED_CALLBACKS:
+            # Only wrap implemented callbacks - the signals-only fast path
+            # and idle candle skipping depend on callbacks not being overridden.
+            if callback in vars(strategy) or check_override(strategy, IStrategy, callback):
+                self._patch(strategy, callback, callback, vars(strategy).get(callback))
+        for stage in PROFILED_STAGES:
+            self._patch(backtesting, stage, stage)
+        self._patch(backtesting.wallets, "update", "Wallets.update")
+        self._patch(
+            PairLocks,
+            "is_pair_locked",
+            "PairLocks.is_pair_locked",
+            vars(PairLocks)["is_pair_locked"],
+        )
+        self._start = perf_counter_ns()
+
+    def stop(self) -> list[dict[str, Any]]:
+        """
+        Stop profiling and restore all wrapped functions.
+        :return: List of statistics per profiled function, sorted by total time.
+        """
+        total = perf_counter_ns() - self._start
+        for obj, attr, restore in reversed(self._patched):
+            if restore is None:
+                delattr(obj, attr)
+            else:
+                setattr(obj, attr, restore)
+        self._patched.clear()
+        if not self._start:
+            return []
+        self._start = 0
+        return self.get_stats(total)
+
+    def get_stats(self, total_ns: int) -> list[dict[str, Any]]:
+        """
+        Statistics per profiled function, sorted by total time.
+        :param total_ns: Total duration of the backtest in nanoseconds, used for percentages.
+        """
+        stats = []
+        for name, timings in self._timings.items():
+            if not timings:
+                continue
+            values = np.array(timings, dtype=np.int64)
+            total = int(values.sum())
+            stats.append(
+                {
+                    "name": name,
+                    "calls": len(values),
+                    "total_ms": total / 1e6,
+                    "mean_us": float(values.mean()) / 1e3,
+                    "p99_us": float(np.percentile(values, 99)) / 1e3,
+                    "pct_of_loop": round(total / total_ns * 100, 2) if total_ns else 0.0,
+                }
+            )
+        stats.append(
+            {
+                "name": "backtest",
+                "calls": 1,
+                "total_ms": total_ns / 1e6,
+                "mean_us": total_ns / 1e3,
+                "p99_us": total_ns / 1e3,
+                "pct_of_loop": 100.0,
+            }
+        )
+        return sorted(stats, key=lambda s: s["total_ms"], reverse=True)
@@ -0,0 +1,102 @@
+from datetime import datetime, timedelta
+from math import inf
+from typing import Any, Callable, Optional
+
+from freqtrade.persistence import LocalTrade
+
+
+# Number of checks during the backtest timerange.
+PRUNE_CHECKPOINTS = 20
+
+
+class BacktestPruner:
+    """
+    Reports interim metrics of a running backtest to a bound function in regular intervals.
+    The backtest is stopped as soon as the bound shows that the final loss can't be better
+    than the best loss so far.
+    """
+
+    def __init__(
+        self,
+        bound: Callable[..., Optional[float]],
+        *,
+        checkpoints: int = PRUNE_CHECKPOINTS,
+    ) -> None:
+        """
+        :param bound: Called with the interim metrics (as keyword arguments) - returns a lower
+            bound of the final loss, or None if no bound is known yet.
+        :param checkpoints: Number of checks during the backtest timerange
+        """
+        self._bound = bound
+        self._checkpoints = checkpoints
+        # Loss to beat - updated before every backtest.
+        self.best_loss = inf
+        self.start(datetime.min, datetime.min, 0)
+
+    def start(self, start_date: datetime, end_date: datetime, starting_balance: float) -> None:
+        """
+        Reset the pruner for a new backtest.
+        """
+        self._start_date = start_date
+        self._end_date = end_date
+        self._interval = max((end_date - start_date) / self._checkpoints, timedelta(seconds=1))
+        self._next_check = start_date + self._interval
+        self._starting_balance = starting_balance
+        self._trade_count = 0
+        self._profit_abs = 0.0
+        self._high_value: Optional[float] = None
+        self._max_drawdown_abs = 0.0
+        self._max_drawdown_relative = 0.0
+        # Bound which stopped the backtest - None while it's running.
+        self.loss: Optional[float] = None
+
+    def _sync(self, trades: list[LocalTrade]) -> None:
+        # Same drawdown calculation as calculate_max_drawdown() - so the interim values
+        # can only grow until the end of the backtest.
+        for trade in trades[self._trade_count :]:
+            self._profit_abs += trade.close_profit_abs or 0.0
+            if self._high_value is None or self._profit_abs > self._high_value:
+                self._high_value = self._profit_abs
+            drawdown = self._high_value - self._profit_abs
+            self._max_drawdown_abs = max(self._max_drawdown_abs, drawdown)
+            if self._starting_balance:
+                self._max_drawdown_relative = max(
+                    self._max_drawdown_relative,
+                    drawdown / (self._starting_balance + self._high_value),
+                )
+        self._trade_count = len(trades)
+
+    def interim_metrics(self, current_time: datetime) -> dict[str, Any]:
+        duration = (self._end_date - self._start_date).total_seconds()
+        return {
+            "current_time": current_time,
+            "min_date": self._start_date,
+            "max_date": self._end_date,
+            "progress": (
+                (current_time - self._start_date).total_seconds() / duration if duration else 1.0
+            ),
+            "trade_count": self._trade_count,
+            "profit_abs": self._profit_abs,
+            "starting_balance": self._starting_balance,
+            "max_drawdown_abs": self._max_drawdown_abs,
+            "max_drawdown_relative": self._max_drawdown_relative,
+        }
+
+    def update(self, current_time: datetime, trades: list[LocalTrade]) -> bool:
+        """
+        Check the bound if a checkpoint was reached.
+        Called once per candle - keep it fast.
+        :param current_time: Current backtest time
+        :param trades: Closed trades (in closing order)
+        :return: True if the backtest should stop
+        """
+        if current_time < self._next_check:
+            return False
+        while self._next_check <= current_time:
+            self._next_check += self._interval
+        self._sync(trades)
+        bound = self._bound(**self.interim_metrics(current_time))
+        if bound is not None and bound >= self.best_loss:
+            self.loss = bound
+            return True
+        return False
@@ -0,0 +1,97 @@
+from collections import defaultdict
+from typing import Any, Callable
+
+import pandas as pd
+from pandas import DataFrame
+
+from freqtrade.strategy.interface import IStrategy
+from freqtrade.strategy.parameters import BaseParameter, track_parameter_reads
+
+
+# Number of signal variants kept per pair - for entry and exit signals each.
+SIGNAL_CACHE_SIZE = 8
+
+# Values of the parameters read while calculating the signals - and the added or changed columns.
+_CachedSignals = tuple[tuple[tuple[BaseParameter, Any], ...], DataFrame]
+
+
+class SignalCache:
+    """
+    Caches the columns added or changed by advise_entry() and advise_exit() per pair.
+    The strategy parameters read while calculating the signals are recorded - cached columns
+    are reused as long as all of these parameters have the same value.
+    Only valid while the dataframes passed in don't change between calls (indicators are not
+    recalculated). Exit signals may use columns added by populate_entry_trend() - they are
+    cached per entry signal variant.
+    """
+
+    def __init__(self, size: int = SIGNAL_CACHE_SIZE) -> None:
+        """
+        :param size: Number of signal variants kept per pair and side
+        """
+        self._size = size
+        self._entry: dict[str, list[_CachedSignals]] = defaultdict(list)
+        self._exit: dict[str, list[_CachedSignals]] = defaultdict(list)
+
+    def _advise(
+        self,
+        cached: list[_CachedSignals],
+        advise: Callable[[DataFrame, dict], DataFrame],
+        dataframe: DataFrame,
+        metadata: dict,
+        depends_on: tuple[tuple[BaseParameter, Any], ...] = (),
+    ) -> tuple[DataFrame, tuple[tuple[BaseParameter, Any], ...]]:
+        """
+        :param depends_on: Key of signals the dataframe already contains - part of the new key
+        :return: DataFrame with the added or changed columns, and the key they are cached with
+        """
+        for i, (values, columns) in enumerate(cached):
+            if all(param.value == value for param, value in values):
+                # Keep the most recently used variant first
+                cached.insert(0, cached.pop(i))
+                return self._apply(dataframe, columns), values
+
+        before = dataframe.copy()
+        with track_parameter_reads() as reads:
+            dataframe = advise(dataframe, metadata)
+        values = depends_on + tuple((param, param.value) for param in reads)
+        if not before.columns.isin(dataframe.columns).all():
+            # Removed columns can't be restored from the cache.
+            return dataframe, values
+        changed = [
+            col
+            for col in dataframe.columns
+            if col not in before.columns or not dataframe[col].equals(before[col])
+        ]
+        cached.insert(0, (values, dataframe[changed].copy()))
+        del cached[self._size :]
+        return dataframe, values
+
+    @staticmethod
+    def _apply(dataframe: DataFrame, columns: DataFrame) -> DataFrame:
+        """
+        Add the cached columns to the dataframe - replacing columns with the same name,
+        while keeping the column order of the uncached result.
+        """
+        replaced = dataframe.columns.intersection(columns.columns)
+        if replaced.empty:
+            return pd.concat([dataframe, columns], axis=1)
+        order = [*dataframe.columns, *columns.columns.difference(replaced, sort=False)]
+        return pd.concat([dataframe.drop(columns=replaced), columns], axis=1)[order]
+
+    def advise_signals(self, strategy: IStrategy, pair: str, dataframe: DataFrame) -> DataFrame:
+        """
+        Equivalent to strategy.ft_advise_signals() - reusing cached signals where possible.
+        :param strategy: Strategy to calculate signals with
+        :param pair: Pair the dataframe belongs to
+        :param dataframe: Analyzed dataframe without signals - modified in place on cache misses
+        :return: DataFrame with entry and exit signals
+        """
+        metadata = {"pair": pair}
+        dataframe, entry_values = self._advise(
+            self._entry[pair], strategy.advise_entry, dataframe, metadata
+        )
+        dataframe, _ = self._advise(
+            self._exit[pair], strategy.advise_exit, dataframe, metadata, entry_values
+        )
+        return dataframe
@@ -0,0 +1,136 @@
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Optional
+
+from pandas import DataFrame
+
+from freqtrade.data.btanalysis import trade_records_to_dataframe
+from freqtrade.enums import RPCMessageType
+from freqtrade.optimize.bt_progress import BTProgress
+from freqtrade.persistence import LocalTrade
+from freqtrade.util import dt_ts
+from freqtrade.wallets import Wallets
+
+
+# Send a chunk once this many closed trades are pending - or after this many seconds.
+STREAM_CHUNK_SIZE = 100
+STREAM_INTERVAL = 1.0
+# Distance (in backtest time) between equity snapshots.
+STREAM_EQUITY_INTERVAL = timedelta(days=1)
+
+
+class BacktestStream:
+    """
+    Streams closed trades and equity snapshots of a running backtest in chunks.
+    Trades are serialized once, when they're first seen as closed - the results dataframe
+    of the backtest is built from the same records.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[dict[str, Any]], None],
+        *,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        interval: float = STREAM_INTERVAL,
+        equity_interval: timedelta = STREAM_EQUITY_INTERVAL,
+    ) -> None:
+        """
+        :param callback: Called with each chunk (an RPC message) - must not block for long,
+            as it's called from within the backtest loop.
+        :param chunk_size: Number of closed trades triggering a chunk
+        :param interval: Maximum number of seconds between chunks
+        :param equity_interval: Backtest time between two equity snapshots
+        """
+        self._callback = callback
+        self._chunk_size = chunk_size
+        self._interval = interval
+        self._equity_interval = equity_interval
+        self.start("", "")
+
+    def start(
+        self, strategy: str, stake_currency: str, progress: Optional[BTProgress] = None
+    ) -> None:
+        """
+        Reset the stream for a new backtest.
+        """
+        self._strategy = strategy
+        self._stake_currency = stake_currency
+        self._progress = progress
+        self.records: list[dict[str, Any]] = []
+        self._source: Optional[list[LocalTrade]] = None
+        self._sent = 0
+        self._equity: list[dict[str, Any]] = []
+        self._next_equity: Optional[datetime] = None
+        self._last_flush = time.monotonic()
+
+    def _sync(self, trades: list[LocalTrade]) -> None:
+        if self._source is not trades or len(self.records) > len(trades):
+            # Different list of trades - start over.
+            self._source = trades
+            self.records = []
+            self._sent = 0
+        for trade in trades[len(self.records) :]:
+            self.records.append(trade.to_json(True))
+
+    def _snapshot(self, date: datetime, wallets: Wallets) -> None:
+        self._equity.append(
+            {
+                "date": date.isoformat(),
+                "timestamp": dt_ts(date),
+                "balance": wallets.get_total(self._stake_currency),
+                "free": wallets.get_free(self._stake_currency),
+                "open_trades": len(LocalTrade.bt_trades_open),
+            }
+        )
+        self._next_equity = date + self._equity_interval
+
+    def update(self, current_time: datetime, trades: list[LocalTrade], wallets: Wallets) -> None:
+        """
+        Collect newly closed trades and send a chunk if one is due.
+        Called once per candle - keep it fast.
+        :param current_time: Current backtest time
+        :param trades: Closed trades (in closing order)
+        :param wallets: Wallets of the backtest, used for equity snapshots
+        """
+        if len(trades) != len(self.records) or self._source is not trades:
+            self._sync(trades)
+        if self._next_equity is None or current_time >= self._next_equity:
+            self._snapshot(current_time, wallets)
+        if len(self.records) - self._sent >= self._chunk_size or (
+            time.monotonic() - self._last_flush >= self._interval
+            and (self._equity or self._sent < len(self.records))
+        ):
+            self.flush()
+
+    def finish(self, end_date: datetime, trades: list[LocalTrade], wallets: Wallets) -> None:
+        """
+        Send the remaining trades and the final equity snapshot.
+        """
+        self._sync(trades)
+        self._snapshot(end_date, wallets)
+        self.flush(finished=True)
+
+    def flush(self, finished: bool = False) -> None:
+        trades = self.records[self._sent :]
+        self._callback(
+            {
+                "type": RPCMessageType.BACKTEST,
+                "data": {
+                    "strategy": self._strategy,
+                    "trades": trades,
+                    "equity": self._equity,
+                    "trade_count": len(self.records),
+                    "progress": self._progress.progress if self._progress else 0,
+                    "finished": finished,
+                },
+            }
+        )
+        self._sent = len(self.records)
+        self._equity = []
+        self._last_flush = time.monotonic()
+
+    def results(self) -> DataFrame:
+        """
+        Dataframe with the streamed trades - equivalent to `trade_list_to_dataframe()`.
+        """
+        return trade_records_to_dataframe(self.records)
@@ -6,16 +6,17 @@ This module contains the hyperopt logic
 
 import logging
 import random
-import sys
 import warnings
+from collections.abc import Iterable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 from datetime import datetime, timezone
-from math import ceil
+from functools import partial
+from math import inf
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import rapidjson
-from joblib import Parallel, cpu_count, delayed, dump, load, wrap_non_picklable_objects
-from joblib.externals import cloudpickle
+from joblib import cpu_count, dump, effective_n_jobs, load
 from pandas import DataFrame
 from rich.console import Console
 
@@ -25,20 +26,26 @@ from freqtrade.data.history import get_timerange
 from freqtrade.data.metrics import calculate_market_change
 from freqtrade.enums import HyperoptState
 from freqtrade.exceptions import OperationalException
+from freqtrade.exchange import Exchange, timeframe_to_prev_date
 from freqtrade.misc import deep_merge_dicts, file_dump_json, plural
 from freqtrade.optimize.backtesting import Backtesting
+from freqtrade.optimize.bt_pruner import BacktestPruner
+from freqtrade.optimize.bt_signal_cache import SignalCache
 
 # Import IHyperOpt and IHyperOptLoss to allow unpickling classes from these modules
 from freqtrade.optimize.hyperopt_auto import HyperOptAuto
 from freqtrade.optimize.hyperopt_loss_interface import IHyperOptLoss
 from freqtrade.optimize.hyperopt_output import HyperoptOutput
+from freqtrade.optimize.hyperopt_pool import HyperoptPool
 from freqtrade.optimize.hyperopt_tools import (
     HyperoptStateContainer,
     HyperoptTools,
     hyperopt_serializer,
 )
-from freqtrade.optimize.optimize_reports import generate_strategy_stats
+from freqtrade.optimize.optimize_reports import complete_strategy_stats, generate_strategy_stats
 from freqtrade.resolvers.hyperopt_resolver import HyperOptLossResolver
+from freqtrade.resolvers.strategy_resolver import check_override
+from freqtrade.strategy.indicator_cache import IndicatorCache
 from freqtrade.util import get_progress_tracker
 
 
@@ -59,6 +66,13 @@ SKOPT_MODEL_QUEUE_SIZE = 10
 
 MAX_LOSS = 100000  # just a big enough number to be bad result in loss optimization
 
+# Successive halving: Default number of timerange parts candidates are evaluated on - and the
+# factor by which the part grows (and the number of candidates shrinks) from one to the next.
+HALVING_RUNGS = 3
+HALVING_ETA = 3
+# Number of discarded candidates remembered - so they are not asked for again.
+HALVING_DISCARDED_SIZE = 10000
+
 
 class Hyperopt:
     """
@@ -69,7 +83,7 @@ class Hyperopt:
     hyperopt.start()
     """
 
-    def __init__(self, config: Config) -> None:
+    def __init__(self, config: Config, exchange: Optional[Exchange] = None) -> None:
         self.buy_space: list[Dimension] = []
         self.sell_space: list[Dimension] = []
         self.protection_space: list[Dimension] = []
@@ -85,10 +99,15 @@ class Hyperopt:
         self.min_date: datetime
         self.max_date: datetime
 
-        self.backtesting = Backtesting(self.config)
+        self.backtesting = Backtesting(self.config, exchange)
         self.pairlist = self.backtesting.pairlists.whitelist
         self.custom_hyperopt: HyperOptAuto
         self.analyze_per_epoch = self.config.get("analyze_per_epoch", False)
+        self.successive_halving = self.config.get("hyperopt_successive_halving", False)
+        self.halving_rungs: int = self.config.get("hyperopt_halving_rungs", HALVING_RUNGS)
+        self.halving_eta: int = self.config.get("hyperopt_halving_eta", HALVING_ETA)
+        if self.successive_halving and self.halving_eta < 2:
+            raise OperationalException("Successive halving requires an eta of at least 2.")
         HyperoptStateContainer.set_state(HyperoptState.STARTUP)
 
         if not self.config.get("hyperopt"):
@@ -102,11 +121,16 @@ class Hyperopt:
         self.backtesting._set_strategy(self.backtesting.strategylist[0])
         self.custom_hyperopt.strategy = self.backtesting.strategy
 
-        self.hyperopt_pickle_magic(self.backtesting.strategy.__class__.__bases__)
+        Backtesting.strategy_pickle_magic(self.backtesting.strategy.__class__.__bases__)
         self.custom_hyperoptloss: IHyperOptLoss = HyperOptLossResolver.load_hyperoptloss(
             self.config
         )
         self.calculate_loss = self.custom_hyperoptloss.hyperopt_loss_function
+        if check_override(self.custom_hyperoptloss, IHyperOptLoss, "hyperopt_loss_bound"):
+            logger.info("Loss function defines a bound - stopping hopeless epochs early.")
+            self.backtesting.pruner = BacktestPruner(
+                partial(self.custom_hyperoptloss.hyperopt_loss_bound, config=self.config)
+            )
         time_now = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         strategy = str(self.config["strategy"])
         self.results_file: Path = (
@@ -117,9 +141,11 @@ class Hyperopt:
         self.data_pickle_file = (
             self.config["user_data_dir"] / "hyperopt_results" / "hyperopt_tickerdata.pkl"
         )
+        # Hyperopt data, loaded once per process by load_hyperopt_data()
+        self._processed: Optional[dict[str, DataFrame]] = None
         self.total_epochs = config.get("epochs", 0)
 
-        self.current_best_loss = 100
+        self.current_best_loss: float = 100
 
         self.clean_hyperopt()
 
@@ -137,11 +163,30 @@ class Hyperopt:
             # Make sure use_exit_signal is enabled
             self.config["use_exit_signal"] = True
 
+        # Signals only change if strategy parameters are optimized - otherwise, calculate them
+        # in the first epoch only.
+        self.backtesting.reuse_signals = not self.analyze_per_epoch and not any(
+            HyperoptTools.has_space(self.config, space) for space in ("buy", "sell", "protection")
+        )
+        if self.analyze_per_epoch:
+            # Indicators are calculated every epoch - reuse those whose parameters didn't change.
+            self.backtesting.strategy.ft_indicator_cache = IndicatorCache()
+        elif not self.backtesting.reuse_signals:
+            # Signals are only recalculated if a parameter they read changed.
+            self.backtesting.signal_cache = SignalCache()
+
         self.print_all = self.config.get("print_all", False)
         self.hyperopt_table_header = 0
         self.print_colorized = self.config.get("print_colorized", False)
         self.print_json = self.config.get("print_json", False)
 
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        # Worker processes load the data themselves - and don't need the optimizer.
+        state["_processed"] = None
+        state.pop("opt", None)
+        return state
+
     @staticmethod
     def get_lock_filename(config: Config) -> str:
         return str(config["user_data_dir"] / "hyperopt.lock")
@@ -156,17 +201,6 @@ class Hyperopt:
                 logger.info(f"Removing `{p}`.")
                 p.unlink()
 
-    def hyperopt_pickle_magic(self, bases) -> None:
-        """
-        Hyperopt magic to allow strategy inheritance across files.
-        For this to properly work, we need to register the module of the imported class
-        to pickle as value.
-        """
-        for modules in bases:
-            if modules.__name__ != "IStrategy":
-                cloudpickle.register_pickle_by_value(sys.modules[modules.__module__])
-                self.hyperopt_pickle_magic(modules.__bases__)
-
     def _get_params_dict(
         self, dimensions: list[Dimension], raw_params: list[Any]
     ) -> dict[str, Any]:
@@ -327,11 +361,12 @@ class Hyperopt:
                 # noinspection PyProtectedMember
                 attr.value = params_dict[attr_name]
 
-    def generate_optimizer(self, raw_params: list[Any]) -> dict[str, Any]:
+    def generate_optimizer(self, raw_params: list[Any], fidelity: float = 1.0) -> dict[str, Any]:
         """
         Used Optimize function.
         Called once per epoch to optimize whatever is configured.
         Keep this function as optimized as possible!
+        :param fidelity: Part of the timerange to backtest, starting at the timerange start.
         """
         HyperoptStateContainer.set_state(HyperoptState.OPTIMIZE)
         backtest_start_time = datetime.now(timezone.utc)
@@ -383,15 +418,20 @@ class Hyperopt:
 
             self.backtesting.strategy.max_open_trades = updated_max_open_trades
 
-        with self.data_pickle_file.open("rb") as f:
-            processed = load(f, mmap_mode="r")
-            if self.analyze_per_epoch:
-                # Data is not yet analyzed, rerun populate_indicators.
-                processed = self.advise_and_trim(processed)
+        if self.analyze_per_epoch:
+            # Data is not yet analyzed, rerun populate_indicators.
+            processed = self.advise_and_trim(self.load_hyperopt_data())
+        else:
+            # backtest() replaces the dataframes in this dict - the loaded data remains unchanged.
+            processed = dict(self.load_hyperopt_data())
 
+        max_date = self._prepare_part(fidelity)
         bt_results = self.backtesting.backtest(
-            processed=processed, start_date=self.min_date, end_date=self.max_date
+            processed=processed, start_date=self.min_date, end_date=max_date
         )
+        if self.backtesting.reuse_signals:
+            # Later epochs reuse the signals - and the analyzed dataframes of this epoch.
+            self._processed = processed
         backtest_end_time = datetime.now(timezone.utc)
         bt_results.update(
             {
@@ -401,7 +441,23 @@ class Hyperopt:
         )
 
         return self._get_results_dict(
-            bt_results, self.min_date, self.max_date, params_dict, processed=processed
+            bt_results, self.min_date, max_date, params_dict, processed=processed, fidelity=fidelity
+        )
+
+    def _prepare_part(self, fidelity: float) -> datetime:
+        """
+        Prepare backtesting of the first part of the timerange.
+        :param fidelity: Part of the timerange to backtest, starting at the timerange start.
+        :return: End date of the part
+        """
+        if self.backtesting.pruner:
+            # Losses of parts of the timerange can't be compared to the best loss.
+            self.backtesting.pruner.best_loss = self.current_best_loss if fidelity >= 1 else inf
+        if fidelity >= 1:
+            return self.max_date
+        return timeframe_to_prev_date(
+            self.backtesting.timeframe,
+            self.min_date + (self.max_date - self.min_date) * fidelity,
         )
 
     def _get_results_dict(
@@ -411,6 +467,7 @@ class Hyperopt:
         max_date: datetime,
         params_dict: dict[str, Any],
         processed: dict[str, DataFrame],
+        fidelity: float = 1.0,
     ) -> dict[str, Any]:
         params_details = self._get_params_details(params_dict)
 
@@ -422,6 +479,7 @@ class Hyperopt:
             max_date,
             market_change=self.market_change,
             is_hyperopt=True,
+            metrics=self.custom_hyperoptloss.required_metrics,
         )
         results_explanation = HyperoptTools.format_results_explanation_string(
             strat_stats, self.config["stake_currency"]
@@ -437,8 +495,13 @@ class Hyperopt:
         # interesting -- consider it as 'bad' (assigned max. loss value)
         # in order to cast this hyperspace point away from optimization
         # path. We do not want to optimize 'hodl' strategies.
+        # Parts of the timerange require a proportional amount of trades.
+        pruned_loss = backtesting_results.get("pruned_loss")
         loss: float = MAX_LOSS
-        if trade_count >= self.config["hyperopt_min_trades"]:
+        if pruned_loss is not None:
+            # Stopped early - the bound is the best loss this epoch could have reached.
+            loss = pruned_loss
+        elif trade_count >= self.config["hyperopt_min_trades"] * fidelity:
             loss = self.calculate_loss(
                 results=backtesting_results["results"],
                 trade_count=trade_count,
@@ -456,6 +519,7 @@ class Hyperopt:
             "results_metrics": strat_stats,
             "results_explanation": results_explanation,
             "total_profit": total_profit,
+            "is_pruned": pruned_loss is not None,
         }
 
     def get_optimizer(self, dimensions: list[Dimension], cpu_count) -> Optimizer:
@@ -479,11 +543,101 @@ class Hyperopt:
             model_queue_size=SKOPT_MODEL_QUEUE_SIZE,
         )
 
-    def run_optimizer_parallel(self, parallel: Parallel, asked: list[list]) -> list[dict[str, Any]]:
-        """Start optimizer in a parallel way"""
-        return parallel(
-            delayed(wrap_non_picklable_objects(self.generate_optimizer))(v) for v in asked
-        )
+    def run_optimizer_parallel(
+        self, pool: HyperoptPool, first_epoch: int, advance: Callable[[], None]
+    ) -> None:
+        """
+        Run the remaining epochs on the pool, keeping all workers busy.
+        A worker gets a new point as soon as it's done - results are told to the optimizer
+        as they arrive, but evaluated in the order the points were asked. Epoch numbers and
+        best epochs therefore don't depend on the duration of the individual epochs.
+        :param pool: Pool to run epochs with
+        :param first_epoch: Number of the first epoch to run (starting from 1)
+        :param advance: Called once per evaluated epoch
+        """
+        pending: dict[Future, int] = {}
+        points: dict[int, tuple[list[Any], bool]] = {}
+        results: dict[int, dict[str, Any]] = {}
+        next_epoch = next_eval = first_epoch
+        while next_eval <= self.total_epochs:
+            n_points = min(pool.jobs - len(pending), self.total_epochs - next_epoch + 1)
+            if n_points > 0:
+                asked, is_random = self.get_asked_points(
+                    n_points, pending=[points[epoch][0] for epoch in pending.values()]
+                )
+                for x, rand in zip(asked, is_random):
+                    points[next_epoch] = (x, rand)
+                    pending[pool.submit(x, self.current_best_loss)] = next_epoch
+                    next_epoch += 1
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            done_epochs = []
+            for future in done:
+                epoch = pending.pop(future)
+                results[epoch] = future.result()
+                done_epochs.append(epoch)
+            done_epochs.sort()
+            self.opt.tell(
+                [points[epoch][0] for epoch in done_epochs],
+                [results[epoch]["loss"] for epoch in done_epochs],
+            )
+
+            while next_eval in results:
+                _, rand = points.pop(next_eval)
+                self.evaluate_result(results.pop(next_eval), next_eval, rand)
+                advance()
+                next_eval += 1
+
+    def run_optimizer_halving(
+        self, pool: HyperoptPool, first_epoch: int, advance: Callable[[], None]
+    ) -> None:
+        """
+        Run the remaining epochs using successive halving.
+        Candidates are backtested on the first part of the timerange - only the best
+        1/eta of them are promoted to the next, eta times longer part.
+        Only candidates reaching the full timerange become epochs - told to the optimizer,
+        evaluated and saved. Recently discarded candidates are not asked for again.
+        All candidates of a part are awaited before promoting - so the promoted candidates
+        don't depend on backtest durations, at the cost of idle workers while the slowest
+        backtest of a part finishes.
+        :param pool: Pool to run epochs with
+        :param first_epoch: Number of the first epoch to run (starting from 1)
+        :param advance: Called once per evaluated epoch
+        """
+        eta, rungs = self.halving_eta, self.halving_rungs
+        fidelities = [eta ** (rung + 1 - rungs) for rung in range(rungs)]
+        # Insertion ordered - the oldest discarded candidates are forgotten first.
+        discarded: dict[tuple, None] = {}
+        epoch = first_epoch
+        while epoch <= self.total_epochs:
+            n_final = min(pool.jobs, self.total_epochs - epoch + 1)
+            asked, is_random = self.get_asked_points(
+                n_final * eta ** (rungs - 1), pending=discarded
+            )
+            candidates = list(zip(asked, is_random))
+            for fidelity in fidelities:
+                futures = [pool.submit(x, self.current_best_loss, fidelity) for x, _ in candidates]
+                results = [future.result() for future in futures]
+                if fidelity < 1:
+                    ranked = sorted(range(len(candidates)), key=lambda i: results[i]["loss"])
+                    keep = max(len(candidates) // eta, 1)
+                    discarded.update((tuple(candidates[i][0]), None) for i in ranked[keep:])
+                    while len(discarded) > HALVING_DISCARDED_SIZE:
+                        del discarded[next(iter(discarded))]
+                    # Promoted candidates keep the order they were asked in.
+                    candidates = [candidates[i] for i in sorted(ranked[:keep])]
+                    logger.debug(
+                        f"Promoting {keep} of {len(ranked)} candidates "
+                        f"(evaluated on {fidelity:.0%} of the timerange)."
+                    )
+
+            self.opt.tell([x for x, _ in candidates], [result["loss"] for result in results])
+            for (_, rand), result in zip(candidates, results):
+                self.evaluate_result(result, epoch, rand)
+                advance()
+                epoch += 1
 
     def _set_random_state(self, random_state: Optional[int]) -> int:
         return random_state or random.randint(1, 2**16 - 1)  # noqa: S311
@@ -502,6 +656,16 @@ class Hyperopt:
         # Real trimming will happen as part of backtesting.
         return preprocessed
 
+    def load_hyperopt_data(self) -> dict[str, DataFrame]:
+        """
+        Load the data stored by prepare_hyperopt_data().
+        Loaded once per process - and kept for all following epochs.
+        """
+        if self._processed is None:
+            with self.data_pickle_file.open("rb") as f:
+                self._processed = load(f, mmap_mode="r")
+        return self._processed
+
     def prepare_hyperopt_data(self) -> None:
         HyperoptStateContainer.set_state(HyperoptState.DATALOAD)
         data, self.timerange = self.backtesting.load_bt_data()
@@ -524,9 +688,12 @@ class Hyperopt:
         else:
             dump(data, self.data_pickle_file)
 
-    def get_asked_points(self, n_points: int) -> tuple[list[list[Any]], list[bool]]:
+    def get_asked_points(
+        self, n_points: int, pending: Optional[Iterable[Sequence[Any]]] = None
+    ) -> tuple[list[list[Any]], list[bool]]:
         """
         Enforce points returned from `self.opt.ask` have not been already evaluated
+        (or are not currently being evaluated - `pending`)
 
         Steps:
         1. Try to get points using `self.opt.ask` first
@@ -544,6 +711,7 @@ class Hyperopt:
                     new_list.append(item)
             return new_list
 
+        pending_keys = {tuple(x) for x in pending or []}
         i = 0
         asked_non_tried: list[list[Any]] = []
         is_random_non_tried: list[bool] = []
@@ -558,10 +726,16 @@ class Hyperopt:
             is_random_non_tried += [
                 rand
                 for x, rand in zip(asked, is_random)
-                if x not in self.opt.Xi and x not in asked_non_tried
+                if x not in self.opt.Xi
+                and tuple(x) not in pending_keys
+                and x not in asked_non_tried
             ]
             asked_non_tried += [
-                x for x in asked if x not in self.opt.Xi and x not in asked_non_tried
+                x
+                for x in asked
+                if x not in self.opt.Xi
+                and tuple(x) not in pending_keys
+                and x not in asked_non_tried
             ]
             i += 1
 
@@ -592,6 +766,8 @@ class Hyperopt:
         self.print_results(val)
 
         if is_best:
+            # Best epochs store the full report
+            complete_strategy_stats(val["results_metrics"])
             self.current_best_loss = val["loss"]
             self.current_best_epoch = val
 
@@ -607,14 +783,7 @@ class Hyperopt:
         self.prepare_hyperopt_data()
 
         # We don't need exchange instance anymore while running hyperopt
-        self.backtesting.exchange.close()
-        self.backtesting.exchange._api = None
-        self.backtesting.exchange._api_async = None
-        self.backtesting.exchange.loop = None  # type: ignore
-        self.backtesting.exchange._loop_lock = None  # type: ignore
-        self.backtesting.exchange._cache_lock = None  # type: ignore
-        # self.backtesting.exchange = None  # type: ignore
-        self.backtesting.pairlists = None  # type: ignore
+        self.backtesting.detach_exchange()
 
         cpus = cpu_count()
         logger.info(f"Found {cpus} CPU cores. Let's make them scream!")
@@ -623,50 +792,39 @@ class Hyperopt:
 
         self.opt = self.get_optimizer(self.dimensions, config_jobs)
 
+        jobs = effective_n_jobs(config_jobs)
+        logger.info(f"Effective number of parallel workers used: {jobs}")
         try:
-            with Parallel(n_jobs=config_jobs) as parallel:
-                jobs = parallel._effective_n_jobs()
-                logger.info(f"Effective number of parallel workers used: {jobs}")
-                console = Console(
-                    color_system="auto" if self.print_colorized else None,
-                )
+            console = Console(
+                color_system="auto" if self.print_colorized else None,
+            )
 
-                # Define progressbar
-                with get_progress_tracker(
-                    console=console,
-                    cust_callables=[self._hyper_out],
-                ) as pbar:
-                    task = pbar.add_task("Epochs", total=self.total_epochs)
-
-                    start = 0
-
-                    if self.analyze_per_epoch:
-                        # First analysis not in parallel mode when using --analyze-per-epoch.
-                        # This allows dataprovider to load it's informative cache.
-                        asked, is_random = self.get_asked_points(n_points=1)
-                        f_val0 = self.generate_optimizer(asked[0])
-                        self.opt.tell(asked, [f_val0["loss"]])
-                        self.evaluate_result(f_val0, 1, is_random[0])
-                        pbar.update(task, advance=1)
-                        start += 1
-
-                    evals = ceil((self.total_epochs - start) / jobs)
-                    for i in range(evals):
-                        # Correct the number of epochs to be processed for the last
-                        # iteration (should not exceed self.total_epochs in total)
-                        n_rest = (i + 1) * jobs - (self.total_epochs - start)
-                        current_jobs = jobs - n_rest if n_rest > 0 else jobs
-
-                        asked, is_random = self.get_asked_points(n_points=current_jobs)
-                        f_val = self.run_optimizer_parallel(parallel, asked)
-                        self.opt.tell(asked, [v["loss"] for v in f_val])
-
-                        for j, val in enumerate(f_val):
-                            # Use human-friendly indexes here (starting from 1)
-                            current = i * jobs + j + 1 + start
-
-                            self.evaluate_result(val, current, is_random[j])
-                            pbar.update(task, advance=1)
+            # Define progressbar
+            with get_progress_tracker(
+                console=console,
+                cust_callables=[self._hyper_out],
+            ) as pbar:
+                task = pbar.add_task("Epochs", total=self.total_epochs)
+
+                start = 0
+
+                if self.analyze_per_epoch:
+                    # First analysis not in parallel mode when using --analyze-per-epoch.
+                    # This allows dataprovider to load it's informative cache.
+                    asked, is_random = self.get_asked_points(n_points=1)
+                    f_val0 = self.generate_optimizer(asked[0])
+                    self.opt.tell(asked, [f_val0["loss"]])
+                    self.evaluate_result(f_val0, 1, is_random[0])
+                    pbar.update(task, advance=1)
+                    start += 1
+
+                # Workers are started after the first analysis, so they receive the cache.
+                with HyperoptPool(self, jobs) as pool:
+                    advance = partial(pbar.update, task, advance=1)
+                    if self.successive_halving:
+                        self.run_optimizer_halving(pool, start + 1, advance)
+                    else:
+                        self.run_optimizer_parallel(pool, start + 1, advance)
 
         except KeyboardInterrupt:
             print("User interrupted..")
@@ -21,6 +21,8 @@ class CalmarHyperOptLoss(IHyperOptLoss):
     This implementation uses the Calmar Ratio calculation.
     """
 
+    required_metrics = []
+
     @staticmethod
     def hyperopt_loss_function(
         results: DataFrame,
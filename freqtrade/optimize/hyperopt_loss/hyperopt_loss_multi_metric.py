@@ -53,6 +53,8 @@ WINRATE_CONST = 1.2
 
 
 class MultiMetricHyperOptLoss(IHyperOptLoss):
+    required_metrics = []
+
     @staticmethod
     def hyperopt_loss_function(
         results: DataFrame,
@@ -17,6 +17,8 @@ class OnlyProfitHyperOptLoss(IHyperOptLoss):
     This implementation takes only absolute profit into account, not looking at any other indicator.
     """
 
+    required_metrics = []
+
     @staticmethod
     def hyperopt_loss_function(results: DataFrame, trade_count: int, *args, **kwargs) -> float:
         """
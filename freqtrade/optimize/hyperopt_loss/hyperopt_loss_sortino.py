@@ -21,6 +21,8 @@ class SortinoHyperOptLoss(IHyperOptLoss):
     This implementation uses the Sortino Ratio calculation.
     """
 
+    required_metrics = []
+
     @staticmethod
     def hyperopt_loss_function(
         results: DataFrame,
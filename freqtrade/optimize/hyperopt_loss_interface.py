@@ -5,7 +5,7 @@ This module defines the interface for the loss-function for hyperopt
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any
+from typing import Any, Optional
 
 from pandas import DataFrame
 
@@ -19,6 +19,10 @@ class IHyperOptLoss(ABC):
     """
 
     timeframe: str
+    # Metrics of `backtest_stats` used by the loss function.
+    # Metrics which are expensive to calculate (LAZY_METRICS in optimize_reports) are only
+    # calculated if listed here. None calculates all metrics.
+    required_metrics: Optional[list[str]] = None
 
     @staticmethod
     @abstractmethod
@@ -36,3 +40,23 @@ class IHyperOptLoss(ABC):
         """
         Objective function, returns smaller number for better results
         """
+
+    @staticmethod
+    def hyperopt_loss_bound(
+        *,
+        progress: float,
+        trade_count: int,
+        profit_abs: float,
+        max_drawdown_abs: float,
+        max_drawdown_relative: float,
+        config: Config,
+        **kwargs,
+    ) -> Optional[float]:
+        """
+        Optional - lower bound of the final loss of a running epoch, based on interim metrics.
+        Called in regular intervals during every epoch. The epoch is stopped early if the
+        returned bound is not better than the best loss so far.
+        Must never be larger than the loss the completed epoch would result in.
+        :return: Lower bound of the final loss, or None if no bound is known
+        """
+        return None
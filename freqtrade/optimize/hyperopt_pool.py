@@ -0,0 +1,93 @@
+"""
+Persistent worker processes for hyperopt
+"""
+
+import logging
+import signal
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import TYPE_CHECKING, Any, Optional
+
+from joblib.externals import cloudpickle
+
+
+if TYPE_CHECKING:
+    from freqtrade.optimize.hyperopt import Hyperopt
+
+logger = logging.getLogger(__name__)
+
+# Hyperopt instance of the current worker process - set once by the pool initializer.
+_worker_hyperopt: Optional["Hyperopt"] = None
+
+
+def _init_worker(hyperopt: bytes) -> None:
+    global _worker_hyperopt
+    # Interrupts are handled by the main process, which shuts the pool down.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    worker_hyperopt: Hyperopt = cloudpickle.loads(hyperopt)
+    worker_hyperopt.load_hyperopt_data()
+    _worker_hyperopt = worker_hyperopt
+
+
+def _run_epoch(raw_params: list[Any], best_loss: float, fidelity: float) -> dict[str, Any]:
+    if _worker_hyperopt is None:
+        raise RuntimeError("Hyperopt worker has not been initialized.")
+    _worker_hyperopt.current_best_loss = best_loss
+    return _worker_hyperopt.generate_optimizer(raw_params, fidelity)
+
+
+class HyperoptPool:
+    """
+    Long-lived worker processes running hyperopt epochs.
+    Every worker receives the Hyperopt instance (including the strategy) once at startup and
+    loads the hyperopt data once - per epoch, only the parameter vector is sent to the worker.
+    With a single job, epochs run in the main process.
+    """
+
+    def __init__(self, hyperopt: "Hyperopt", jobs: int) -> None:
+        """
+        :param hyperopt: Hyperopt instance - sent to the workers in its current state
+        :param jobs: Number of worker processes
+        """
+        self.jobs = jobs
+        self._hyperopt = hyperopt
+        self._executor: Optional[ProcessPoolExecutor] = None
+        if jobs > 1:
+            logger.info(f"Starting {jobs} hyperopt worker processes.")
+            self._executor = ProcessPoolExecutor(
+                max_workers=jobs,
+                mp_context=get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(cloudpickle.dumps(hyperopt),),
+            )
+
+    def __enter__(self) -> "HyperoptPool":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """
+        Stop the worker processes. Epochs which did not start yet are cancelled.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def submit(
+        self, raw_params: list[Any], best_loss: float, fidelity: float = 1.0
+    ) -> "Future[dict[str, Any]]":
+        """
+        Schedule one epoch on the next free worker.
+        Without workers, the epoch runs immediately - and the returned future is already done.
+        :param raw_params: Raw parameter vector, as returned by the optimizer
+        :param best_loss: Best loss so far - used to stop hopeless epochs early
+        :param fidelity: Part of the timerange to backtest
+        :return: Future with the result of generate_optimizer()
+        """
+        if self._executor is None:
+            future: Future[dict[str, Any]] = Future()
+            future.set_result(self._hyperopt.generate_optimizer(raw_params, fidelity))
+            return future
+        return self._executor.submit(_run_epoch, raw_params, best_loss, fidelity)
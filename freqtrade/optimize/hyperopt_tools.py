@@ -14,6 +14,7 @@ from freqtrade.enums import HyperoptState
 from freqtrade.exceptions import OperationalException
 from freqtrade.misc import deep_merge_dicts, round_dict, safe_value_fallback2
 from freqtrade.optimize.hyperopt_epoch_filters import hyperopt_filter_epochs
+from freqtrade.optimize.optimize_reports import text_table_callback_profile
 
 
 logger = logging.getLogger(__name__)
@@ -234,6 +235,8 @@ class HyperoptTools:
             HyperoptTools._params_pretty_print(
                 params, "max_open_trades", "Max Open Trades:", non_optimized
             )
+            if callback_profile := results.get("results_metrics", {}).get("callback_profile"):
+                text_table_callback_profile(callback_profile)
 
     @staticmethod
     def _params_update_for_json(result_dict, params, non_optimized, space: str) -> None:
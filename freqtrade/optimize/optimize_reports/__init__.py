@@ -7,6 +7,7 @@ from freqtrade.optimize.optimize_reports.bt_output import (
     show_sorted_pairlist,
     text_table_add_metrics,
     text_table_bt_results,
+    text_table_callback_profile,
     text_table_periodic_breakdown,
     text_table_strategy,
     text_table_tags,
@@ -16,6 +17,8 @@ from freqtrade.optimize.optimize_reports.bt_storage import (
     store_backtest_stats,
 )
 from freqtrade.optimize.optimize_reports.optimize_reports import (
+    LAZY_METRICS,
+    complete_strategy_stats,
     generate_all_periodic_breakdown_stats,
     generate_backtest_stats,
     generate_daily_stats,
@@ -150,6 +150,26 @@ def text_table_periodic_breakdown(
     print_rich_table(output, headers, summary=f"{period.upper()} BREAKDOWN")
 
 
+def text_table_callback_profile(callback_profile: list[dict[str, Any]]) -> None:
+    """
+    Print table with call counts and durations of strategy callbacks and backtest loop stages
+    :param callback_profile: Profile as generated by BacktestProfiler
+    """
+    headers = ["Function", "Calls", "Total ms", "Mean us", "P99 us", "% of loop"]
+    output = [
+        [
+            p["name"],
+            p["calls"],
+            f"{p['total_ms']:.2f}",
+            f"{p['mean_us']:.2f}",
+            f"{p['p99_us']:.2f}",
+            f"{p['pct_of_loop']:.2f}",
+        ]
+        for p in callback_profile
+    ]
+    print_rich_table(output, headers, summary="CALLBACK PROFILE")
+
+
 def text_table_strategy(strategy_results, stake_currency: str, title: str):
     """
     Generate summary table per strategy
@@ -282,6 +302,15 @@ def text_table_add_metrics(strat_results: dict) -> None:
             else []
         )
 
+        memory_metrics = (
+            [
+                ("", ""),  # Empty line to improve readability
+                ("Peak memory usage", f"{strat_results['peak_memory'] / 1024**2:,.0f} MiB"),
+            ]
+            if "peak_memory" in strat_results
+            else []
+        )
+
         # Newly added fields should be ignored if they are missing in strat_results. hyperopt-show
         # command stores these results and newer version of freqtrade must be able to handle old
         # results with missing new fields.
@@ -392,6 +421,7 @@ def text_table_add_metrics(strat_results: dict) -> None:
             ("Max balance", fmt_coin(strat_results["csum_max"], strat_results["stake_currency"])),
             *drawdown_metrics,
             ("Market change", f"{strat_results['market_change']:.2%}"),
+            *memory_metrics,
         ]
         print_rich_table(metrics, ["Metric", "Value"], summary="SUMMARY METRICS", justify="left")
 
@@ -455,6 +485,9 @@ def show_backtest_result(
 
     text_table_add_metrics(results)
 
+    if callback_profile := results.get("callback_profile"):
+        text_table_callback_profile(callback_profile)
+
     print()
 
 
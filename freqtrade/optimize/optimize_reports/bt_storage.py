@@ -2,12 +2,17 @@ import logging
 from pathlib import Path
 from typing import Optional
 
-from pandas import DataFrame
+import rapidjson
+from pandas import DataFrame, concat
 
 from freqtrade.constants import LAST_BT_RESULT_FN
 from freqtrade.ft_types import BacktestResultType
 from freqtrade.misc import file_dump_joblib, file_dump_json
-from freqtrade.optimize.backtest_caching import get_backtest_metadata_filename
+from freqtrade.optimize.backtest_caching import (
+    get_backtest_metadata_filename,
+    get_backtest_trades_filename,
+    update_backtest_index,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -30,12 +35,33 @@ def _generate_filename(recordfilename: Path, appendix: str, suffix: str) -> Path
     return filename
 
 
+def _store_backtest_trades(filename: Path, stats: BacktestResultType) -> None:
+    """
+    Stores trades of all strategies in one feather file (columnar format).
+    Orders are stored as json strings.
+    :param filename: Backtest result filename - the trades filename is derived from it.
+    :param stats: Backtest statistics containing the trades
+    """
+    trades = concat(
+        [DataFrame(s["trades"]).assign(strategy=name) for name, s in stats["strategy"].items()],
+        ignore_index=True,
+    )
+    if "orders" in trades.columns:
+        trades["orders"] = trades["orders"].map(
+            lambda orders: rapidjson.dumps(orders, default=str, number_mode=rapidjson.NM_NATIVE)
+        )
+    trades.to_feather(
+        get_backtest_trades_filename(filename), compression_level=9, compression="lz4"
+    )
+
+
 def store_backtest_stats(
     recordfilename: Path,
     stats: BacktestResultType,
     dtappendix: str,
     *,
     market_change_data: Optional[DataFrame] = None,
+    export_format: str = "json",
 ) -> Path:
     """
     Stores backtest results
@@ -44,16 +70,24 @@ def store_backtest_stats(
         while for directories, <directory>/backtest-result-<datetime>.json will be used as filename
     :param stats: Dataframe containing the backtesting statistics
     :param dtappendix: Datetime to use for the filename
+    :param export_format: "json" or "columnar" - columnar stores trades in a separate
+        feather file, and the statistics without trades.
     """
     filename = _generate_filename(recordfilename, dtappendix, ".json")
 
     # Store metadata separately.
     file_dump_json(get_backtest_metadata_filename(filename), stats["metadata"])
+    update_backtest_index(filename, stats["metadata"])
     # Don't mutate the original stats dict.
     stats_copy = {
         "strategy": stats["strategy"],
         "strategy_comparison": stats["strategy_comparison"],
     }
+    if export_format == "columnar" and stats["strategy"]:
+        _store_backtest_trades(filename, stats)
+        stats_copy["strategy"] = {
+            name: {**strat_stats, "trades": []} for name, strat_stats in stats["strategy"].items()
+        }
 
     file_dump_json(filename, stats_copy)
 
@@ -1,7 +1,8 @@
 import logging
+from collections.abc import Collection
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
-from typing import Any, Literal, Union
+from typing import Any, Literal, Optional, Union
 
 import numpy as np
 from pandas import DataFrame, Series, concat, to_datetime
@@ -69,7 +70,7 @@ def generate_rejected_signals(
 
 
 def _generate_result_line(
-    result: DataFrame, starting_balance: int, first_column: Union[str, list[str]]
+    result: DataFrame, starting_balance: float, first_column: Union[str, list[str]]
 ) -> dict:
     """
     Generate one result dict, with "first_column" as key.
@@ -111,7 +112,7 @@ def _generate_result_line(
 def generate_pair_metrics(
     pairlist: list[str],
     stake_currency: str,
-    starting_balance: int,
+    starting_balance: float,
     results: DataFrame,
     skip_nan: bool = False,
 ) -> list[dict]:
@@ -144,7 +145,7 @@ def generate_pair_metrics(
 
 def generate_tag_metrics(
     tag_type: Union[Literal["enter_tag", "exit_reason"], list[Literal["enter_tag", "exit_reason"]]],
-    starting_balance: int,
+    starting_balance: float,
     results: DataFrame,
     skip_nan: bool = False,
 ) -> list[dict]:
@@ -349,6 +350,101 @@ def generate_daily_stats(results: DataFrame) -> dict[str, Any]:
     }
 
 
+# Metrics of generate_strategy_stats() which are only calculated if required.
+# Maps the name of each group of metrics to the metrics it contains.
+LAZY_METRICS: dict[str, tuple[str, ...]] = {
+    "results_per_pair": ("results_per_pair", "best_pair", "worst_pair", "left_open_trades"),
+    "tag_metrics": ("results_per_enter_tag", "exit_reason_summary", "mix_tag_stats"),
+    "daily_stats": (
+        "backtest_best_day",
+        "backtest_worst_day",
+        "backtest_best_day_abs",
+        "backtest_worst_day_abs",
+        "winning_days",
+        "draw_days",
+        "losing_days",
+        "daily_profit",
+        "daily_profit_list",
+    ),
+    "sortino": ("sortino",),
+    "sharpe": ("sharpe",),
+    "calmar": ("calmar",),
+}
+
+
+def _generate_lazy_metrics(
+    group: str,
+    pairlist: list[str],
+    stake_currency: str,
+    start_balance: float,
+    results: DataFrame,
+    min_date: datetime,
+    max_date: datetime,
+) -> dict[str, Any]:
+    """
+    Calculate one group of LAZY_METRICS
+    """
+    if group == "results_per_pair":
+        pair_results = generate_pair_metrics(
+            pairlist,
+            stake_currency=stake_currency,
+            starting_balance=start_balance,
+            results=results,
+            skip_nan=False,
+        )
+        pairs = [pair for pair in pair_results if pair["key"] != "TOTAL"]
+        return {
+            "best_pair": (
+                max(pairs, key=lambda x: x["profit_sum"]) if len(pair_results) > 1 else None
+            ),
+            "worst_pair": (
+                min(pairs, key=lambda x: x["profit_sum"]) if len(pair_results) > 1 else None
+            ),
+            "results_per_pair": pair_results,
+            "left_open_trades": generate_pair_metrics(
+                pairlist,
+                stake_currency=stake_currency,
+                starting_balance=start_balance,
+                results=results.loc[results["exit_reason"] == "force_exit"],
+                skip_nan=True,
+            ),
+        }
+    if group == "tag_metrics":
+        return {
+            "results_per_enter_tag": generate_tag_metrics(
+                "enter_tag", starting_balance=start_balance, results=results, skip_nan=False
+            ),
+            "exit_reason_summary": generate_tag_metrics(
+                "exit_reason", starting_balance=start_balance, results=results, skip_nan=False
+            ),
+            "mix_tag_stats": generate_tag_metrics(
+                ["enter_tag", "exit_reason"],
+                starting_balance=start_balance,
+                results=results,
+                skip_nan=False,
+            ),
+        }
+    if group == "daily_stats":
+        return generate_daily_stats(results)
+    if group == "sortino":
+        return {"sortino": calculate_sortino(results, min_date, max_date, start_balance)}
+    if group == "sharpe":
+        return {"sharpe": calculate_sharpe(results, min_date, max_date, start_balance)}
+    if group == "calmar":
+        return {"calmar": calculate_calmar(results, min_date, max_date, start_balance)}
+    raise ValueError(f"Unknown metric group {group}.")
+
+
+def get_lazy_metric_groups(metrics: Optional[Collection[str]]) -> list[str]:
+    """
+    Groups of LAZY_METRICS which are not needed to provide `metrics`.
+    :param metrics: Required metrics - None requires all metrics
+    """
+    if metrics is None:
+        return []
+    return [group for group, keys in LAZY_METRICS.items() if not set(keys) & set(metrics)]
+
+
 def generate_strategy_stats(
     pairlist: list[str],
     strategy: str,
@@ -357,6 +453,7 @@ def generate_strategy_stats(
     max_date: datetime,
     market_change: float,
     is_hyperopt: bool = False,
+    metrics: Optional[Collection[str]] = None,
 ) -> dict[str, Any]:
     """
     :param pairlist: List of pairs to backtest
@@ -366,6 +463,9 @@ def generate_strategy_stats(
     :param min_date: Backtest start date
     :param max_date: Backtest end date
     :param market_change: float indicating the market change
+    :param metrics: Metrics to calculate - None calculates all metrics.
+        Metrics of LAZY_METRICS which are not required are skipped, and listed (by group)
+        in `lazy_metrics`. They can be calculated later using `complete_strategy_stats()`.
     :return: Dictionary containing results per strategy and a strategy summary.
     """
     results: dict[str, DataFrame] = content["results"]
@@ -376,55 +476,21 @@ def generate_strategy_stats(
     start_balance = config["dry_run_wallet"]
     stake_currency = config["stake_currency"]
 
-    pair_results = generate_pair_metrics(
-        pairlist,
-        stake_currency=stake_currency,
-        starting_balance=start_balance,
-        results=results,
-        skip_nan=False,
-    )
-
-    enter_tag_stats = generate_tag_metrics(
-        "enter_tag", starting_balance=start_balance, results=results, skip_nan=False
-    )
-    exit_reason_stats = generate_tag_metrics(
-        "exit_reason", starting_balance=start_balance, results=results, skip_nan=False
-    )
-    mix_tag_stats = generate_tag_metrics(
-        ["enter_tag", "exit_reason"],
-        starting_balance=start_balance,
-        results=results,
-        skip_nan=False,
-    )
-    left_open_results = generate_pair_metrics(
-        pairlist,
-        stake_currency=stake_currency,
-        starting_balance=start_balance,
-        results=results.loc[results["exit_reason"] == "force_exit"],
-        skip_nan=True,
-    )
-
-    daily_stats = generate_daily_stats(results)
+    lazy_groups = get_lazy_metric_groups(metrics)
+    lazy_stats: dict[str, Any] = {}
+    for group in LAZY_METRICS:
+        if group not in lazy_groups:
+            lazy_stats.update(
+                _generate_lazy_metrics(
+                    group, pairlist, stake_currency, start_balance, results, min_date, max_date
+                )
+            )
     trade_stats = generate_trading_stats(results)
 
     periodic_breakdown = {}
     if not is_hyperopt:
         periodic_breakdown = {"periodic_breakdown": generate_all_periodic_breakdown_stats(results)}
 
-    best_pair = (
-        max(
-            [pair for pair in pair_results if pair["key"] != "TOTAL"], key=lambda x: x["profit_sum"]
-        )
-        if len(pair_results) > 1
-        else None
-    )
-    worst_pair = (
-        min(
-            [pair for pair in pair_results if pair["key"] != "TOTAL"], key=lambda x: x["profit_sum"]
-        )
-        if len(pair_results) > 1
-        else None
-    )
     winning_profit = results.loc[results["profit_abs"] > 0, "profit_abs"].sum()
     losing_profit = results.loc[results["profit_abs"] < 0, "profit_abs"].sum()
     profit_factor = winning_profit / abs(losing_profit) if losing_profit else 0.0
@@ -434,13 +500,6 @@ def generate_strategy_stats(
     strat_stats = {
         "trades": results.to_dict(orient="records"),
         "locks": [lock.to_json() for lock in content["locks"]],
-        "best_pair": best_pair,
-        "worst_pair": worst_pair,
-        "results_per_pair": pair_results,
-        "results_per_enter_tag": enter_tag_stats,
-        "exit_reason_summary": exit_reason_stats,
-        "mix_tag_stats": mix_tag_stats,
-        "left_open_trades": left_open_results,
         "total_trades": len(results),
         "trade_count_long": len(results.loc[~results["is_short"]]),
         "trade_count_short": len(results.loc[results["is_short"]]),
@@ -457,9 +516,6 @@ def generate_strategy_stats(
         "cagr": calculate_cagr(backtest_days, start_balance, content["final_balance"]),
         "expectancy": expectancy,
         "expectancy_ratio": expectancy_ratio,
-        "sortino": calculate_sortino(results, min_date, max_date, start_balance),
-        "sharpe": calculate_sharpe(results, min_date, max_date, start_balance),
-        "calmar": calculate_calmar(results, min_date, max_date, start_balance),
         "profit_factor": profit_factor,
         "backtest_start": min_date.strftime(DATETIME_PRINT_FORMAT),
         "backtest_start_ts": int(min_date.timestamp() * 1000),
@@ -507,9 +563,15 @@ def generate_strategy_stats(
         "trading_mode": config["trading_mode"],
         "margin_mode": config["margin_mode"],
         **periodic_breakdown,
-        **daily_stats,
+        **lazy_stats,
         **trade_stats,
     }
+    if lazy_groups:
+        strat_stats["lazy_metrics"] = lazy_groups
+    if "callback_profile" in content:
+        strat_stats["callback_profile"] = content["callback_profile"]
+    if content.get("peak_memory") is not None:
+        strat_stats["peak_memory"] = content["peak_memory"]
 
     try:
         drawdown = calculate_max_drawdown(
@@ -557,6 +619,38 @@ def generate_strategy_stats(
     return strat_stats
 
 
+def complete_strategy_stats(strat_stats: dict[str, Any]) -> dict[str, Any]:
+    """
+    Calculate the metrics skipped by `generate_strategy_stats()` (listed in `lazy_metrics`)
+    from the trades of the result.
+    :param strat_stats: Result of `generate_strategy_stats()` - updated in place
+    :return: strat_stats, containing all metrics
+    """
+    from freqtrade.data.btanalysis import BT_DATA_COLUMNS
+
+    lazy_groups = strat_stats.pop("lazy_metrics", None)
+    if not lazy_groups:
+        return strat_stats
+    results = DataFrame.from_records(strat_stats["trades"], columns=BT_DATA_COLUMNS)
+    results["open_date"] = to_datetime(results["open_date"], utc=True)
+    results["close_date"] = to_datetime(results["close_date"], utc=True)
+    min_date = datetime.fromtimestamp(strat_stats["backtest_start_ts"] / 1000, tz=timezone.utc)
+    max_date = datetime.fromtimestamp(strat_stats["backtest_end_ts"] / 1000, tz=timezone.utc)
+    for group in lazy_groups:
+        strat_stats.update(
+            _generate_lazy_metrics(
+                group,
+                strat_stats["pairlist"],
+                strat_stats["stake_currency"],
+                strat_stats["starting_balance"],
+                results,
+                min_date,
+                max_date,
+            )
+        )
+    return strat_stats
+
+
 def generate_backtest_stats(
     btdata: dict[str, DataFrame],
     all_results: dict[str, dict[str, Union[DataFrame, dict]]],
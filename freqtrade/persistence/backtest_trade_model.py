@@ -0,0 +1,239 @@
+"""
+Lightweight trade and order models used in backtesting
+"""
+
+from datetime import datetime
+from typing import ClassVar, Optional
+
+from freqtrade.enums import TradingMode
+from freqtrade.persistence.trade_model import LocalTrade, Order
+
+
+class BacktestOrder:
+    """
+    Order object used in backtesting.
+    Mirrors the Order model (and reuses its logic) - but uses __slots__ instead of the
+    SQLAlchemy instrumentation, making creation and attribute access considerably cheaper.
+    Must be aligned to Order model!
+    """
+
+    __slots__ = (
+        "id",
+        "ft_trade_id",
+        "ft_order_side",
+        "ft_pair",
+        "ft_is_open",
+        "ft_amount",
+        "ft_price",
+        "ft_cancel_reason",
+        "order_id",
+        "status",
+        "symbol",
+        "order_type",
+        "side",
+        "price",
+        "average",
+        "amount",
+        "filled",
+        "remaining",
+        "cost",
+        "stop_price",
+        "order_date",
+        "order_filled_date",
+        "order_update_date",
+        "funding_fee",
+        "ft_fee_base",
+        "ft_order_tag",
+        "_trade_bt",
+    )
+
+    # Same types as the Order columns.
+    id: int
+    ft_trade_id: int
+    ft_order_side: str
+    ft_pair: str
+    ft_is_open: bool
+    ft_amount: float
+    ft_price: float
+    ft_cancel_reason: Optional[str]
+    order_id: str
+    status: Optional[str]
+    symbol: Optional[str]
+    order_type: Optional[str]
+    side: str
+    price: Optional[float]
+    average: Optional[float]
+    amount: Optional[float]
+    filled: Optional[float]
+    remaining: Optional[float]
+    cost: Optional[float]
+    stop_price: Optional[float]
+    order_date: datetime
+    order_filled_date: Optional[datetime]
+    order_update_date: Optional[datetime]
+    funding_fee: Optional[float]
+    ft_fee_base: Optional[float]
+    ft_order_tag: Optional[str]
+    _trade_bt: "BacktestTrade"
+
+    def __init__(self, **kwargs):
+        for key in self.__slots__:
+            setattr(self, key, None)
+        self.ft_is_open = True
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+    order_date_utc = Order.order_date_utc
+    order_filled_utc = Order.order_filled_utc
+    safe_placement_price = Order.safe_placement_price
+    safe_price = Order.safe_price
+    safe_filled = Order.safe_filled
+    safe_cost = Order.safe_cost
+    safe_remaining = Order.safe_remaining
+    safe_fee_base = Order.safe_fee_base
+    safe_amount_after_fee = Order.safe_amount_after_fee
+    stake_amount = Order.stake_amount
+    to_ccxt_object = Order.to_ccxt_object
+    to_json = Order.to_json
+    __repr__ = Order.__repr__
+
+    @property
+    def safe_amount(self) -> float:
+        return self.amount or self.ft_amount
+
+    @property
+    def trade(self) -> "BacktestTrade":
+        return self._trade_bt
+
+    def close_bt_order(self, close_date: datetime, trade: LocalTrade):
+        # Update the order index first, as closing recalculates the trade from its orders.
+        self._trade_bt.bt_order_filled(self)
+        Order.close_bt_order(self, close_date, trade)  # type: ignore[arg-type]
+
+
+class BacktestTrade(LocalTrade):
+    """
+    Trade object used in backtesting.
+    Keeps indexes of open and filled orders, so order lookups done on every candle
+    don't have to scan all orders of the trade (which can be thousands for strategies
+    using position adjustment).
+    Only valid as long as orders are added and removed via add_bt_order() / remove_bt_order()
+    and filled via close_bt_order().
+    """
+
+    # Use float arithmetic instead of FtPrecise for trade value and profit calculations.
+    fast_math: ClassVar[bool] = False
+
+    def __init__(self, **kwargs):
+        self._bt_open_orders: list[BacktestOrder] = []
+        self._bt_filled_orders: list[BacktestOrder] = []
+        super().__init__(**kwargs)
+
+    def add_bt_order(self, order: BacktestOrder) -> None:  # type: ignore[override]
+        super().add_bt_order(order)  # type: ignore[arg-type]
+        if order.ft_is_open:
+            self._bt_open_orders.append(order)
+
+    def remove_bt_order(self, order: BacktestOrder) -> None:  # type: ignore[override]
+        super().remove_bt_order(order)  # type: ignore[arg-type]
+        if order in self._bt_open_orders:
+            self._bt_open_orders.remove(order)
+
+    def bt_order_filled(self, order: BacktestOrder) -> None:
+        """
+        Move order from the open to the filled orders index.
+        Filled orders are kept in the same sequence as in self.orders.
+        """
+        if order in self._bt_open_orders:
+            self._bt_open_orders.remove(order)
+        LocalTrade.bt_changed_trades[self.id] = self
+        if order.amount:
+            self._bt_filled_orders.append(order)
+            if len(self._bt_filled_orders) > 1 and self._bt_filled_orders[-2].id > order.id:
+                self._bt_filled_orders.sort(key=lambda o: o.id)
+
+    @property
+    def open_orders(self) -> list[Order]:
+        return [o for o in self._bt_open_orders if o.ft_order_side != "stoploss"]  # type: ignore
+
+    @property
+    def has_open_orders(self) -> bool:
+        return any(o.ft_order_side != "stoploss" for o in self._bt_open_orders)
+
+    @property
+    def open_sl_orders(self) -> list[Order]:
+        return [o for o in self._bt_open_orders if o.ft_order_side == "stoploss"]  # type: ignore
+
+    @property
+    def has_open_sl_orders(self) -> bool:
+        return any(o.ft_order_side == "stoploss" for o in self._bt_open_orders)
+
+    def select_order(
+        self,
+        order_side: Optional[str] = None,
+        is_open: Optional[bool] = None,
+        only_filled: bool = False,
+    ) -> Optional[Order]:
+        if is_open is True:
+            for o in reversed(self._bt_open_orders):
+                if not order_side or o.ft_order_side == order_side:
+                    return o  # type: ignore[return-value]
+            return None
+        return super().select_order(order_side, is_open, only_filled)
+
+    def select_filled_orders(self, order_side: Optional[str] = None) -> list[Order]:
+        return [
+            o  # type: ignore[misc]
+            for o in self._bt_filled_orders
+            if order_side is None or o.ft_order_side == order_side
+        ]
+
+    def _calc_open_trade_value(self, amount: float, open_rate: float) -> float:
+        if not BacktestTrade.fast_math:
+            return super()._calc_open_trade_value(amount, open_rate)
+        # recalc_trade_from_orders() passes FtPrecise values.
+        open_trade = float(amount) * float(open_rate)
+        fees = open_trade * self.fee_open
+        if self.is_short:
+            return open_trade - fees
+        else:
+            return open_trade + fees
+
+    def calc_close_trade_value(self, rate: float, amount: Optional[float] = None) -> float:
+        trading_mode = self.trading_mode or TradingMode.SPOT
+        if (
+            not BacktestTrade.fast_math
+            or rate is None
+            or trading_mode not in (TradingMode.SPOT, TradingMode.FUTURES)
+        ):
+            return super().calc_close_trade_value(rate, amount)
+
+        close_trade = (amount or self.amount) * rate
+        fees = close_trade * (self.fee_close or 0.0)
+        # Positive funding_fees -> Trade has gained from fees.
+        funding_fees = (self.funding_fees or 0.0) if trading_mode == TradingMode.FUTURES else 0.0
+        if self.is_short:
+            return close_trade + fees - funding_fees
+        else:
+            return close_trade - fees + funding_fees
+
+    def calc_profit_ratio(
+        self, rate: float, amount: Optional[float] = None, open_rate: Optional[float] = None
+    ) -> float:
+        if not BacktestTrade.fast_math:
+            return super().calc_profit_ratio(rate, amount, open_rate)
+        close_trade_value = self.calc_close_trade_value(rate, amount)
+
+        if amount is None or open_rate is None:
+            open_trade_value = self.open_trade_value
+        else:
+            open_trade_value = self._calc_open_trade_value(amount, open_rate)
+
+        if open_trade_value == 0.0:
+            return 0.0
+        if self.is_short:
+            profit_ratio = (1 - (close_trade_value / open_trade_value)) * self.leverage
+        else:
+            profit_ratio = ((close_trade_value / open_trade_value) - 1) * self.leverage
+        # Identical to float(f"{profit_ratio:.8f}") - but without the string conversion.
+        return round(profit_ratio, 8)
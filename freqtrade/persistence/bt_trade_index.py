@@ -0,0 +1,117 @@
+"""
+Date indexes for backtesting trades
+"""
+
+from bisect import bisect_right
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+
+
+if TYPE_CHECKING:
+    from freqtrade.persistence.trade_model import LocalTrade
+
+
+class _TradeGroup:
+    """
+    Trades sorted by date. Trades with identical dates keep their insertion order.
+    """
+
+    __slots__ = ("dates", "seqs", "trades", "ordered")
+
+    def __init__(self) -> None:
+        self.dates: list[datetime] = []
+        self.seqs: list[int] = []
+        self.trades: list[LocalTrade] = []
+        # Date order equals insertion order
+        self.ordered = True
+
+    def add(self, date: datetime, seq: int, trade: "LocalTrade") -> None:
+        if not self.dates or self.dates[-1] <= date:
+            self.dates.append(date)
+            self.seqs.append(seq)
+            self.trades.append(trade)
+        else:
+            idx = bisect_right(self.dates, date)
+            self.dates.insert(idx, date)
+            self.seqs.insert(idx, seq)
+            self.trades.insert(idx, trade)
+            self.ordered = False
+
+    def since(self, date: datetime) -> list["LocalTrade"]:
+        """
+        Trades with a date after `date` - in insertion order.
+        """
+        idx = bisect_right(self.dates, date)
+        if self.ordered or idx == len(self.dates):
+            return self.trades[idx:]
+        trades = sorted(zip(self.seqs[idx:], self.trades[idx:]), key=lambda x: x[0])
+        return [t for _, t in trades]
+
+
+class BacktestTradeIndex:
+    """
+    Index of backtesting trades, per pair and for all pairs, sorted by a date attribute.
+    Allows getting trades of a pair, or trades with a date after a given date,
+    without scanning all trades.
+    Results are in the same order as the trades were added - so results are identical to
+    filtering the list of trades.
+    """
+
+    def __init__(self, date_attr: str) -> None:
+        self._date_attr = date_attr
+        self._groups: dict[Optional[str], _TradeGroup] = {}
+        self._pair_trades: dict[str, list[LocalTrade]] = {}
+        self._seq = 0
+        # List of trades this index was built from - and the number of indexed trades.
+        self._source: Optional[list[LocalTrade]] = None
+        self._count = 0
+
+    def clear(self) -> None:
+        self._groups = {}
+        self._pair_trades = {}
+        self._seq = 0
+        self._source = None
+        self._count = 0
+
+    def add(self, trade: "LocalTrade") -> None:
+        date = getattr(trade, self._date_attr)
+        self._seq += 1
+        self._pair_trades.setdefault(trade.pair, []).append(trade)
+        if date is None:
+            return
+        for key in (None, trade.pair):
+            group = self._groups.get(key)
+            if group is None:
+                group = self._groups[key] = _TradeGroup()
+            group.add(date, self._seq, trade)
+
+    def sync(self, trades: list["LocalTrade"]) -> None:
+        """
+        Add trades appended to `trades` since the last call to the index.
+        Rebuilds the index if a different list (or a shorter one) is passed.
+        :param trades: List of trades (in insertion order) to index
+        """
+        if self._source is not trades or self._count > len(trades):
+            self.clear()
+            self._source = trades
+        if self._count < len(trades):
+            for trade in trades[self._count :]:
+                self.add(trade)
+            self._count = len(trades)
+
+    def since(self, pair: Optional[str], date: datetime) -> list["LocalTrade"]:
+        """
+        Get trades with a date after `date`.
+        :param pair: Pair to get trades for - or None for all pairs
+        :param date: Exclusive lower bound for the trade date
+        """
+        group = self._groups.get(pair)
+        if group is None:
+            return []
+        return group.since(date)
+
+    def pair_trades(self, pair: str) -> list["LocalTrade"]:
+        """
+        Get all trades for this pair - in insertion order.
+        """
+        return list(self._pair_trades.get(pair, []))
@@ -1,4 +1,5 @@
 import logging
+from bisect import bisect_left, bisect_right
 from collections.abc import Sequence
 from datetime import datetime, timezone
 from typing import Optional
@@ -24,6 +25,13 @@ class PairLocks:
 
     timeframe: str = ""
 
+    # Backtesting: Index of locks per pair ("*" for global locks), sorted by lock end time.
+    # Only contains locks which did not expire before _index_expired_before.
+    _lock_index: dict[str, tuple[list[datetime], list[PairLock]]] = {}
+    _indexed_locks: list[PairLock] = []
+    _indexed_count: int = 0
+    _index_expired_before: Optional[datetime] = None
+
     @staticmethod
     def reset_locks() -> None:
         """
@@ -31,6 +39,65 @@ class PairLocks:
         """
         if not PairLocks.use_db:
             PairLocks.locks = []
+            PairLocks._sync_index()
+
+    @staticmethod
+    def _sync_index() -> None:
+        """
+        Backtesting: Update the lock index with locks added to PairLocks.locks.
+        Rebuilds the index if PairLocks.locks has been replaced (e.g. when resuming a backtest).
+        """
+        all_locks = PairLocks.locks
+        if PairLocks._indexed_locks is not all_locks or PairLocks._indexed_count > len(all_locks):
+            PairLocks._lock_index = {}
+            PairLocks._indexed_locks = all_locks
+            PairLocks._indexed_count = 0
+            PairLocks._index_expired_before = None
+        if PairLocks._indexed_count < len(all_locks):
+            for lock in all_locks[PairLocks._indexed_count :]:
+                ends, locks = PairLocks._lock_index.setdefault(lock.pair, ([], []))
+                idx = bisect_right(ends, lock.lock_end_time)
+                ends.insert(idx, lock.lock_end_time)
+                locks.insert(idx, lock)
+            PairLocks._indexed_count = len(all_locks)
+
+    @staticmethod
+    def expire_locks(now: datetime) -> None:
+        """
+        Backtesting: Advance the simulated time.
+        Locks that ended before `now` are purged from the lock index (lazily, on the next lookup
+        for the pair) - they remain available via get_all_locks().
+        Lookups for an earlier point in time fall back to scanning all locks.
+        :param now: Current (simulated) time
+        """
+        if not PairLocks.use_db:
+            PairLocks._sync_index()
+            PairLocks._index_expired_before = now
+
+    @staticmethod
+    def _get_indexed_locks(pair: Optional[str], now: datetime) -> Optional[list[PairLock]]:
+        """
+        Backtesting: Get locks for this pair which did not end before `now` from the lock index.
+        :param pair: Pair to check for. Returns locks for all pairs if pair is empty
+        :return: List of locks - or None if the index can't be used for this point in time.
+        """
+        PairLocks._sync_index()
+        expired_before = PairLocks._index_expired_before
+        if expired_before is not None and now < expired_before:
+            return None
+        result: list[PairLock] = []
+        for bucket_pair in [pair] if pair else list(PairLocks._lock_index):
+            bucket = PairLocks._lock_index.get(bucket_pair)
+            if not bucket:
+                continue
+            ends, locks = bucket
+            if expired_before is not None:
+                purge = bisect_left(ends, expired_before)
+                if purge:
+                    del ends[:purge]
+                    del locks[:purge]
+            result.extend(locks[bisect_left(ends, now) :])
+        return result
 
     @staticmethod
     def lock_pair(
@@ -82,9 +149,12 @@ class PairLocks:
         if PairLocks.use_db:
             return PairLock.query_pair_locks(pair, now, side).all()
         else:
+            candidates = PairLocks._get_indexed_locks(pair, now)
+            if candidates is None:
+                candidates = PairLocks.locks
             locks = [
                 lock
-                for lock in PairLocks.locks
+                for lock in candidates
                 if (
                     lock.lock_end_time >= now
                     and lock.active is True
@@ -46,6 +46,7 @@ from freqtrade.exchange import (
 from freqtrade.leverage import interest
 from freqtrade.misc import safe_value_fallback
 from freqtrade.persistence.base import ModelBase, SessionType
+from freqtrade.persistence.bt_trade_index import BacktestTradeIndex
 from freqtrade.persistence.custom_data import CustomDataWrapper, _CustomData
 from freqtrade.util import FtPrecise, dt_from_ts, dt_now, dt_ts, dt_ts_none
 
@@ -380,6 +381,11 @@ class LocalTrade:
     bt_trades_open_pp: dict[str, list["LocalTrade"]] = defaultdict(list)
     bt_open_open_trade_count: int = 0
     bt_total_profit: float = 0
+    # Trades with changes relevant to wallets since the last wallet update - by trade id
+    bt_changed_trades: dict[int, "LocalTrade"] = {}
+    # Closed trades (bt_trades) indexed by pair and close / open date - for get_trades_proxy
+    bt_trades_closed_index: BacktestTradeIndex = BacktestTradeIndex("close_date")
+    bt_trades_open_date_index: BacktestTradeIndex = BacktestTradeIndex("open_date")
     realized_profit: float = 0
 
     id: int = 0
@@ -748,6 +754,9 @@ class LocalTrade:
         LocalTrade.bt_trades_open_pp = defaultdict(list)
         LocalTrade.bt_open_open_trade_count = 0
         LocalTrade.bt_total_profit = 0
+        LocalTrade.bt_changed_trades.clear()
+        LocalTrade.bt_trades_closed_index.clear()
+        LocalTrade.bt_trades_open_date_index.clear()
 
     def adjust_min_max_rates(self, current_price: float, current_price_low: float) -> None:
         """
@@ -1416,27 +1425,63 @@ class LocalTrade:
         """
 
         # Offline mode - without database
-        if is_open is not None:
-            if is_open:
-                sel_trades = LocalTrade.bt_trades_open
-            else:
-                sel_trades = LocalTrade.bt_trades
-
-        else:
+        if is_open is None:
             # Not used during backtesting, but might be used by a strategy
-            sel_trades = list(LocalTrade.bt_trades + LocalTrade.bt_trades_open)
+            return LocalTrade.get_trades_proxy(
+                pair=pair, is_open=False, open_date=open_date, close_date=close_date
+            ) + LocalTrade.get_trades_proxy(
+                pair=pair, is_open=True, open_date=open_date, close_date=close_date
+            )
 
-        if pair:
-            sel_trades = [trade for trade in sel_trades if trade.pair == pair]
-        if open_date:
-            sel_trades = [trade for trade in sel_trades if trade.open_date > open_date]
+        if is_open:
+            # Few open trades - filter them directly.
+            if pair:
+                sel_trades = list(LocalTrade.bt_trades_open_pp.get(pair, []))
+            else:
+                sel_trades = LocalTrade.bt_trades_open
+            if open_date:
+                sel_trades = [trade for trade in sel_trades if trade.open_date > open_date]
+            if close_date:
+                sel_trades = [
+                    trade
+                    for trade in sel_trades
+                    if trade.close_date and trade.close_date > close_date
+                ]
+            return sel_trades
+
+        # Closed trades - use the indexes on bt_trades, so strategies / protections
+        # looking at recent history don't have to scan all closed trades.
         if close_date:
-            sel_trades = [
-                trade for trade in sel_trades if trade.close_date and trade.close_date > close_date
-            ]
+            LocalTrade.bt_trades_closed_index.sync(LocalTrade.bt_trades)
+            sel_trades = LocalTrade.bt_trades_closed_index.since(pair, close_date)
+            if open_date:
+                sel_trades = [trade for trade in sel_trades if trade.open_date > open_date]
+        elif open_date:
+            LocalTrade.bt_trades_open_date_index.sync(LocalTrade.bt_trades)
+            sel_trades = LocalTrade.bt_trades_open_date_index.since(pair, open_date)
+        elif pair:
+            LocalTrade.bt_trades_closed_index.sync(LocalTrade.bt_trades)
+            sel_trades = LocalTrade.bt_trades_closed_index.pair_trades(pair)
+        else:
+            sel_trades = LocalTrade.bt_trades
 
         return sel_trades
 
+    def add_bt_order(self, order: Order) -> None:
+        """
+        Add an order to this trade - backtesting only.
+        """
+        order._trade_bt = self
+        self.orders.append(order)
+        LocalTrade.bt_changed_trades[self.id] = self
+
+    def remove_bt_order(self, order: Order) -> None:
+        """
+        Remove an (open) order from this trade - backtesting only.
+        """
+        self.orders.remove(order)
+        LocalTrade.bt_changed_trades[self.id] = self
+
     @staticmethod
     def close_bt_trade(trade):
         LocalTrade.bt_trades_open.remove(trade)
@@ -1444,6 +1489,7 @@ class LocalTrade:
         LocalTrade.bt_open_open_trade_count -= 1
         LocalTrade.bt_trades.append(trade)
         LocalTrade.bt_total_profit += trade.close_profit_abs
+        LocalTrade.bt_changed_trades[trade.id] = trade
 
     @staticmethod
     def add_bt_trade(trade):
@@ -1451,6 +1497,7 @@ class LocalTrade:
             LocalTrade.bt_trades_open.append(trade)
             LocalTrade.bt_trades_open_pp[trade.pair].append(trade)
             LocalTrade.bt_open_open_trade_count += 1
+            LocalTrade.bt_changed_trades[trade.id] = trade
         else:
             LocalTrade.bt_trades.append(trade)
 
@@ -1459,6 +1506,7 @@ class LocalTrade:
         LocalTrade.bt_trades_open.remove(trade)
         LocalTrade.bt_trades_open_pp[trade.pair].remove(trade)
         LocalTrade.bt_open_open_trade_count -= 1
+        LocalTrade.bt_changed_trades[trade.id] = trade
 
     @staticmethod
     def get_open_trades() -> list[Any]:
@@ -30,7 +30,7 @@ from freqtrade.rpc.api_server.api_schemas import (
     BacktestRequest,
     BacktestResponse,
 )
-from freqtrade.rpc.api_server.deps import get_config
+from freqtrade.rpc.api_server.deps import get_config, get_message_stream
 from freqtrade.rpc.api_server.webserver_bgwork import ApiBG
 from freqtrade.rpc.rpc import RPCException
 
@@ -43,6 +43,7 @@ router = APIRouter()
 
 def __run_backtest_bg(btconfig: Config):
     from freqtrade.data.metrics import combined_dataframes_with_rel_mean
+    from freqtrade.optimize.bt_stream import BacktestStream
     from freqtrade.optimize.optimize_reports import generate_backtest_stats, store_backtest_stats
     from freqtrade.resolvers import StrategyResolver
 
@@ -86,6 +87,9 @@ def __run_backtest_bg(btconfig: Config):
         ApiBG.bt["bt"].load_prior_backtest()
 
         ApiBG.bt["bt"].abort = False
+        if message_stream := get_message_stream():
+            # Stream closed trades to websocket consumers while backtesting.
+            ApiBG.bt["bt"].stream = BacktestStream(message_stream.publish_threadsafe)
         strategy_name = strat.get_strategy_name()
         if ApiBG.bt["bt"].results and strategy_name in ApiBG.bt["bt"].results["strategy"]:
             # When previous result hash matches - reuse that result and skip backtesting.
@@ -106,6 +110,7 @@ def __run_backtest_bg(btconfig: Config):
                 ApiBG.bt["bt"].results,
                 datetime.now().strftime("%Y-%m-%d_%H-%M-%S"),
                 market_change_data=combined_res,
+                export_format=btconfig.get("export_format", "json"),
             )
             ApiBG.bt["bt"].results["metadata"][strategy_name]["filename"] = str(fn.stem)
             ApiBG.bt["bt"].results["metadata"][strategy_name]["strategy"] = strategy_name
@@ -119,9 +124,24 @@ def __run_backtest_bg(btconfig: Config):
         logger.exception(f"Backtesting caused an error: {e}")
         ApiBG.bt["bt_error"] = str(e)
     finally:
+        if ApiBG.bt["bt"]:
+            ApiBG.bt["bt"].stream = None
         ApiBG.bgtask_running = False
 
 
+def _strip_backtest_trades(results: dict[str, Any]) -> dict[str, Any]:
+    """
+    Copy of the backtest result, without the trades of each strategy.
+    """
+    return {
+        **results,
+        "strategy": {
+            name: {k: v for k, v in stats.items() if k != "trades"}
+            for name, stats in results.get("strategy", {}).items()
+        },
+    }
+
+
 @router.post("/backtest", response_model=BacktestResponse, tags=["webserver", "backtest"])
 async def api_start_backtest(
     bt_settings: BacktestRequest, background_tasks: BackgroundTasks, config=Depends(get_config)
@@ -166,10 +186,12 @@ async def api_start_backtest(
 
 
 @router.get("/backtest", response_model=BacktestResponse, tags=["webserver", "backtest"])
-def api_get_backtest():
+def api_get_backtest(include_trades: bool = True):
     """
     Get backtesting result.
     Returns Result after backtesting has been ran.
+    :param include_trades: Include the trades in the result. Websocket consumers already
+        received them while the backtest was running.
     """
     from freqtrade.persistence import LocalTrade
 
@@ -208,7 +230,11 @@ def api_get_backtest():
         "status_msg": "Backtest ended",
         "step": "finished",
         "progress": 1,
-        "backtest_result": ApiBG.bt["bt"].results,
+        "backtest_result": (
+            ApiBG.bt["bt"].results
+            if include_trades
+            else _strip_backtest_trades(ApiBG.bt["bt"].results)
+        ),
     }
 
 
@@ -1,6 +1,6 @@
 import logging
 import time
-from typing import Any
+from typing import Any, Optional
 
 from fastapi import APIRouter, Depends
 from fastapi.websockets import WebSocket
@@ -9,7 +9,7 @@ from pydantic import ValidationError
 from freqtrade.enums import RPCMessageType, RPCRequestType
 from freqtrade.exceptions import FreqtradeException
 from freqtrade.rpc.api_server.api_auth import validate_ws_token
-from freqtrade.rpc.api_server.deps import get_message_stream, get_rpc
+from freqtrade.rpc.api_server.deps import get_message_stream, get_rpc_or_webserver
 from freqtrade.rpc.api_server.ws.channel import WebSocketChannel, create_channel
 from freqtrade.rpc.api_server.ws.message_stream import MessageStream
 from freqtrade.rpc.api_server.ws_schemas import (
@@ -28,7 +28,7 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-async def channel_reader(channel: WebSocketChannel, rpc: RPC):
+async def channel_reader(channel: WebSocketChannel, rpc: Optional[RPC]):
     """
     Iterate over the messages from the channel and process the request
     """
@@ -61,7 +61,9 @@ async def channel_broadcaster(channel: WebSocketChannel, message_stream: Message
             await channel.send(message, use_timeout=True)
 
 
-async def _process_consumer_request(request: dict[str, Any], channel: WebSocketChannel, rpc: RPC):
+async def _process_consumer_request(
+    request: dict[str, Any], channel: WebSocketChannel, rpc: Optional[RPC]
+):
     """
     Validate and handle a request from a websocket consumer
     """
@@ -90,7 +92,13 @@ async def _process_consumer_request(request: dict[str, Any], channel: WebSocketC
         # We don't send a response for subscriptions
         return
 
-    elif type_ == RPCRequestType.WHITELIST:
+    if rpc is None:
+        # Webserver mode - there's no bot to answer requests
+        response = WSErrorMessage(data="Bot is not in the correct state")
+        await channel.send(response.model_dump(exclude_none=True))
+        return
+
+    if type_ == RPCRequestType.WHITELIST:
         # Get whitelist
         whitelist = rpc._ws_request_whitelist()
 
@@ -114,7 +122,7 @@ async def _process_consumer_request(request: dict[str, Any], channel: WebSocketC
 async def message_endpoint(
     websocket: WebSocket,
     token: str = Depends(validate_ws_token),
-    rpc: RPC = Depends(get_rpc),
+    rpc: Optional[RPC] = Depends(get_rpc_or_webserver),
     message_stream: MessageStream = Depends(get_message_stream),
 ):
     if token:
@@ -1,4 +1,5 @@
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
 from typing import Any, Optional
 from uuid import uuid4
 
@@ -20,17 +21,23 @@ def get_rpc_optional() -> Optional[RPC]:
     return None
 
 
+@contextmanager
+def _rpc_request_context(_rpc: RPC) -> Iterator[RPC]:
+    request_id = str(uuid4())
+    ctx_token = _request_id_ctx_var.set(request_id)
+    Trade.rollback()
+    try:
+        yield _rpc
+    finally:
+        Trade.session.remove()
+        _request_id_ctx_var.reset(ctx_token)
+
+
 async def get_rpc() -> Optional[AsyncIterator[RPC]]:
     _rpc = get_rpc_optional()
     if _rpc:
-        request_id = str(uuid4())
-        ctx_token = _request_id_ctx_var.set(request_id)
-        Trade.rollback()
-        try:
-            yield _rpc
-        finally:
-            Trade.session.remove()
-            _request_id_ctx_var.reset(ctx_token)
+        with _rpc_request_context(_rpc) as rpc:
+            yield rpc
 
     else:
         raise RPCException("Bot is not in the correct state")
@@ -44,6 +51,20 @@ def get_api_config() -> dict[str, Any]:
     return ApiServer._config["api_server"]
 
 
+async def get_rpc_or_webserver(config=Depends(get_config)) -> AsyncIterator[Optional[RPC]]:
+    """
+    Like get_rpc - but yields None in webserver mode, where no bot is running.
+    """
+    if config["runmode"] == RunMode.WEBSERVER:
+        yield None
+        return
+    _rpc = get_rpc_optional()
+    if not _rpc:
+        raise RPCException("Bot is not in the correct state")
+    with _rpc_request_context(_rpc) as rpc:
+        yield rpc
+
+
 def _generate_exchange_key(config: Config) -> str:
     """
     Exchange key - used for caching the exchange object.
@@ -21,6 +21,14 @@ class MessageStream:
         waiter, self._waiter = self._waiter, self._loop.create_future()
         waiter.set_result((message, time.time(), self._waiter))
 
+    def publish_threadsafe(self, message):
+        """
+        Publish a message to this MessageStream from a thread other than the event loop's
+
+        :param message: The message to publish
+        """
+        self._loop.call_soon_threadsafe(self.publish, message)
+
     async def __aiter__(self):
         """
         Iterate over the messages in the message stream
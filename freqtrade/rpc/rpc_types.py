@@ -122,6 +122,13 @@ class RPCNewCandleMsg(RPCSendMsgBase):
     data: PairWithTimeframe
 
 
+class RPCBacktestMsg(RPCSendMsgBase):
+    """Chunk of a running backtest - closed trades and equity snapshots"""
+
+    type: Literal[RPCMessageType.BACKTEST]
+    data: dict[str, Any]
+
+
 RPCOrderMsg = Union[RPCEntryMsg, RPCExitMsg, RPCExitCancelMsg, RPCCancelMsg]
 
 
@@ -136,4 +143,5 @@ RPCSendMsg = Union[
     RPCExitCancelMsg,
     RPCAnalyzedDFMsg,
     RPCNewCandleMsg,
+    RPCBacktestMsg,
 ]
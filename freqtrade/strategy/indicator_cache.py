@@ -0,0 +1,62 @@
+from collections import defaultdict
+from collections.abc import Sequence
+from typing import Any, Callable, TypeVar
+
+import numpy as np
+from pandas import DataFrame, Series
+
+from freqtrade.strategy.parameters import BaseParameter, track_parameter_reads
+
+
+# Number of parameter combinations kept per indicator and pair.
+INDICATOR_CACHE_SIZE = 32
+
+# Types an indicator may have - all of them support copy().
+IndicatorT = TypeVar("IndicatorT", Series, DataFrame, np.ndarray)
+
+# Values of the parameters the indicator depends on - and the indicator.
+_CachedIndicator = tuple[tuple[tuple[BaseParameter, Any], ...], Any]
+
+
+class IndicatorCache:
+    """
+    Caches indicators calculated with IStrategy.cached_indicator(), keyed by the values of the
+    parameters they depend on.
+    Only valid while the candle data passed to populate_indicators() doesn't change - which is
+    the case for hyperopt with --analyze-per-epoch.
+    """
+
+    def __init__(self, size: int = INDICATOR_CACHE_SIZE) -> None:
+        """
+        :param size: Number of parameter combinations kept per indicator and pair
+        """
+        self._size = size
+        self._cache: dict[tuple, list[_CachedIndicator]] = defaultdict(list)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Cached indicators are not sent to hyperopt worker processes.
+        return {"_size": self._size, "_cache": defaultdict(list)}
+
+    def get(
+        self, key: tuple, func: Callable[[], IndicatorT], depends_on: Sequence[BaseParameter]
+    ) -> IndicatorT:
+        """
+        Return a copy of the cached indicator - or calculate and cache it.
+        :param key: Identifies the indicator (including pair and timeframe)
+        :param func: Calculates the indicator - parameters read by it are recorded
+        :param depends_on: Further parameters the indicator depends on
+        :return: Indicator - a Series, DataFrame or numpy array
+        """
+        cached = self._cache[key]
+        for i, (values, indicator) in enumerate(cached):
+            if all(param.value == value for param, value in values):
+                # Keep the most recently used combination first
+                cached.insert(0, cached.pop(i))
+                return indicator.copy()
+
+        with track_parameter_reads() as reads:
+            indicator = func()
+        reads.update(depends_on)
+        cached.insert(0, (tuple((param, param.value) for param in reads), indicator.copy()))
+        del cached[self._size :]
+        return indicator
@@ -6,9 +6,10 @@ This module defines the interface to apply for strategies
 import logging
 from abc import ABC, abstractmethod
 from collections import OrderedDict
+from collections.abc import Sequence
 from datetime import datetime, timedelta, timezone
 from math import isinf, isnan
-from typing import Optional, Union
+from typing import Callable, Optional, Union
 
 from pandas import DataFrame
 
@@ -31,12 +32,14 @@ from freqtrade.exchange import timeframe_to_minutes, timeframe_to_next_date, tim
 from freqtrade.misc import remove_entry_exit_signals
 from freqtrade.persistence import Order, PairLocks, Trade
 from freqtrade.strategy.hyper import HyperStrategyMixin
+from freqtrade.strategy.indicator_cache import IndicatorCache, IndicatorT
 from freqtrade.strategy.informative_decorator import (
     InformativeData,
     PopulateIndicators,
     _create_and_merge_informative_pair,
     _format_pair_name,
 )
+from freqtrade.strategy.parameters import BaseParameter
 from freqtrade.strategy.strategy_wrapper import strategy_safe_wrapper
 from freqtrade.util import dt_now
 from freqtrade.wallets import Wallets
@@ -119,6 +122,10 @@ class IStrategy(ABC, HyperStrategyMixin):
     # Disable checking the dataframe (converts the error into a warning message)
     disable_dataframe_checks: bool = False
 
+    # Allow backtesting to skip bot_loop_start() calls for candles without entry signal
+    # while no trade is open. Only used by the columnar backtest engine.
+    skip_idle_bot_loop_start: bool = False
+
     # Count of candles the strategy requires before producing valid signals
     startup_candle_count: int = 0
 
@@ -150,6 +157,8 @@ class IStrategy(ABC, HyperStrategyMixin):
         self.config = config
         # Dict to determine if analysis is necessary
         self._last_candle_seen_per_pair: dict[str, datetime] = {}
+        # Set by hyperopt with --analyze-per-epoch - see cached_indicator().
+        self.ft_indicator_cache: Optional[IndicatorCache] = None
         super().__init__(config)
 
         # Gather informative pairs from @informative-decorated methods.
@@ -1623,6 +1632,32 @@ class IStrategy(ABC, HyperStrategyMixin):
 
             logger.debug("Populated dataframe with trades.")
 
+    def cached_indicator(
+        self,
+        dataframe: DataFrame,
+        metadata: dict,
+        name: str,
+        func: Callable[[DataFrame], IndicatorT],
+        depends_on: Sequence[BaseParameter] = (),
+    ) -> IndicatorT:
+        """
+        Calculate an indicator within populate_indicators().
+        When hyperopting with --analyze-per-epoch, the result is cached per value of the
+        parameters it depends on - and only recalculated once one of them changes.
+        Parameters read by func are detected automatically.
+        :param dataframe: Dataframe passed to populate_indicators()
+        :param metadata: Metadata passed to populate_indicators()
+        :param name: Name of the indicator - unique within populate_indicators()
+        :param func: Calculates the indicator from the dataframe. Columns used by func must not
+            depend on parameters - unless these parameters are part of depends_on.
+        :param depends_on: Parameters the result depends on, which func doesn't read itself
+        :return: Result of func - a Series, DataFrame or numpy array
+        """
+        if self.ft_indicator_cache is None:
+            return func(dataframe)
+        key = (metadata.get("pair"), metadata.get("timeframe", self.timeframe), name)
+        return self.ft_indicator_cache.get(key, lambda: func(dataframe), depends_on)
+
     def advise_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         """
         Populate indicators that will be used in the Buy, Sell, short, exit_short strategy
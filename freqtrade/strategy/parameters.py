@@ -5,8 +5,8 @@ This module defines a base class for auto-hyperoptable strategies.
 
 import logging
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
-from contextlib import suppress
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager, suppress
 from typing import Any, Optional, Union
 
 from freqtrade.enums import HyperoptState
@@ -23,6 +23,28 @@ from freqtrade.exceptions import OperationalException
 
 logger = logging.getLogger(__name__)
 
+# Parameters read while tracking is active - see track_parameter_reads().
+_parameter_reads: Optional[set["BaseParameter"]] = None
+
+
+@contextmanager
+def track_parameter_reads() -> Iterator[set["BaseParameter"]]:
+    """
+    Record all parameters whose value is read within this context.
+    Nested contexts also report their reads to the outer context.
+    :return: Set of parameters read - complete once the context is left
+    """
+    global _parameter_reads
+    outer = _parameter_reads
+    reads: set[BaseParameter] = set()
+    _parameter_reads = reads
+    try:
+        yield reads
+    finally:
+        _parameter_reads = outer
+        if outer is not None:
+            outer.update(reads)
+
 
 class BaseParameter(ABC):
     """
@@ -31,7 +53,6 @@ class BaseParameter(ABC):
 
     category: Optional[str]
     default: Any
-    value: Any
     in_space: bool = False
     name: str
 
@@ -66,6 +87,16 @@ class BaseParameter(ABC):
     def __repr__(self):
         return f"{self.__class__.__name__}({self.value})"
 
+    @property
+    def value(self) -> Any:
+        if _parameter_reads is not None:
+            _parameter_reads.add(self)
+        return self._value
+
+    @value.setter
+    def value(self, value: Any) -> None:
+        self._value = value
+
     @abstractmethod
     def get_space(self, name: str) -> Union["Integer", "Real", "SKDecimal", "Categorical"]:
         """
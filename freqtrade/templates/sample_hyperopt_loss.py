@@ -33,6 +33,10 @@ class SampleHyperOptLoss(IHyperOptLoss):
     results.
     """
 
+    # Metrics of `backtest_stats` this loss function uses - e.g. ["sharpe", "results_per_pair"].
+    # Keeping this list short speeds up hyperopt. None calculates all metrics.
+    required_metrics = []
+
     @staticmethod
     def hyperopt_loss_function(
         results: DataFrame,
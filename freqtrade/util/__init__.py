@@ -14,6 +14,7 @@ from freqtrade.util.datetime_helpers import (
 from freqtrade.util.formatters import decimals_per_coin, fmt_coin, round_value
 from freqtrade.util.ft_precise import FtPrecise
 from freqtrade.util.measure_time import MeasureTime
+from freqtrade.util.memory_usage import get_peak_memory_usage
 from freqtrade.util.periodic_cache import PeriodicCache
 from freqtrade.util.progress_tracker import get_progress_tracker  # noqa F401
 from freqtrade.util.rich_progress import CustomProgress
@@ -39,6 +40,7 @@ __all__ = [
     "round_value",
     "fmt_coin",
     "MeasureTime",
+    "get_peak_memory_usage",
     "print_rich_table",
     "print_df_rich_table",
     "CustomProgress",
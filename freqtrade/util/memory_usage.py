@@ -0,0 +1,19 @@
+import sys
+from typing import Optional
+
+import psutil
+
+
+def get_peak_memory_usage() -> Optional[int]:
+    """
+    Peak resident set size (RSS) of the current process.
+    :return: Peak RSS in bytes - or None if not available on this platform.
+    """
+    try:
+        import resource
+    except ImportError:
+        # Windows
+        return getattr(psutil.Process().memory_info(), "peak_wset", None)
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS, in kilobytes on other platforms.
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
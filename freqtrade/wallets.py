@@ -4,6 +4,7 @@
 import logging
 from copy import deepcopy
 from datetime import datetime, timedelta
+from math import isclose
 from typing import NamedTuple, Optional
 
 from freqtrade.constants import UNLIMITED_STAKE_AMOUNT, Config, IntOrInf
@@ -34,6 +35,17 @@ class PositionWallet(NamedTuple):
     side: str = "long"
 
 
+class LedgerEntry(NamedTuple):
+    """Contribution of one open trade to the wallets"""
+
+    realized_profit: float
+    stake_amount: float
+    # Stake of open entry orders - spot only
+    used_stake: float
+    wallet: Optional[Wallet]
+    position: Optional[PositionWallet]
+
+
 class Wallets:
     def __init__(self, config: Config, exchange: Exchange, is_backtest: bool = False) -> None:
         self._config = config
@@ -43,6 +55,18 @@ class Wallets:
         self._positions: dict[str, PositionWallet] = {}
         self.start_cap = config["dry_run_wallet"]
         self._last_wallet_refresh: Optional[datetime] = None
+        # Wallet ledger - backtesting only.
+        # Applies the changes of individual trades instead of recomputing all wallets.
+        self._use_ledger = is_backtest and config.get("backtest_wallet_ledger", False)
+        self._check_ledger = self._use_ledger and config.get("backtest_wallet_ledger_check", False)
+        self._ledger: dict[int, LedgerEntry] = {}
+        self._ledger_trades_open: Optional[list[LocalTrade]] = None
+        # Entries per currency / pair, keyed by trade id - the latest trade owns the wallet.
+        self._ledger_wallets: dict[str, dict[int, Wallet]] = {}
+        self._ledger_positions: dict[str, dict[int, PositionWallet]] = {}
+        self._ledger_realized_profit = 0.0
+        self._ledger_stake_amount = 0.0
+        self._ledger_used_stake = 0.0
         self.update()
 
     def get_free(self, currency: str) -> float:
@@ -142,6 +166,166 @@ class Wallets:
         self._wallets = _wallets
         self._positions = _positions
 
+    def _ledger_entry(self, trade: LocalTrade) -> LedgerEntry:
+        """
+        Calculate the contribution of one open trade to the wallets.
+        Must be aligned to _update_dry()!
+        """
+        if self._config.get("trading_mode", "spot") != TradingMode.FUTURES:
+            curr = self._exchange.get_pair_base_currency(trade.pair)
+            used_stake = sum(
+                o.stake_amount for o in trade.open_orders if o.ft_order_side == trade.entry_side
+            )
+            pending = sum(
+                o.amount
+                for o in trade.open_orders
+                if o.amount and o.ft_order_side == trade.exit_side
+            )
+            return LedgerEntry(
+                realized_profit=trade.realized_profit,
+                stake_amount=trade.stake_amount,
+                used_stake=used_stake,
+                wallet=Wallet(curr, trade.amount - pending, pending, trade.amount),
+                position=None,
+            )
+        return LedgerEntry(
+            realized_profit=trade.realized_profit,
+            stake_amount=trade.stake_amount,
+            used_stake=0.0,
+            wallet=None,
+            position=PositionWallet(
+                trade.pair,
+                position=trade.amount,
+                leverage=trade.leverage,
+                collateral=trade.stake_amount,
+                side=trade.trade_direction,
+            ),
+        )
+
+    def _ledger_apply(self, trade_id: int, entry: LedgerEntry, sign: int) -> None:
+        """
+        Add (sign=1) or remove (sign=-1) the contribution of a trade.
+        """
+        self._ledger_realized_profit += sign * entry.realized_profit
+        self._ledger_stake_amount += sign * entry.stake_amount
+        self._ledger_used_stake += sign * entry.used_stake
+        if entry.wallet:
+            self._ledger_set(
+                self._ledger_wallets,
+                self._wallets,
+                entry.wallet.currency,
+                trade_id,
+                entry.wallet if sign > 0 else None,
+            )
+        if entry.position:
+            self._ledger_set(
+                self._ledger_positions,
+                self._positions,
+                entry.position.symbol,
+                trade_id,
+                entry.position if sign > 0 else None,
+            )
+
+    @staticmethod
+    def _ledger_set(ledger: dict, target: dict, key: str, trade_id: int, value) -> None:
+        """
+        Set (or remove, if value is None) the entry of a trade for a currency / pair.
+        Like the full recomputation, the latest trade determines the wallet.
+        """
+        entries = ledger.setdefault(key, {})
+        if value is not None:
+            entries[trade_id] = value
+        else:
+            entries.pop(trade_id, None)
+        if entries:
+            target[key] = entries[max(entries)]
+        else:
+            del ledger[key]
+            target.pop(key, None)
+
+    def _ledger_reset(self) -> None:
+        """
+        Rebuild the ledger from all open trades.
+        """
+        self._ledger = {}
+        self._ledger_wallets = {}
+        self._ledger_positions = {}
+        self._ledger_realized_profit = 0.0
+        self._ledger_stake_amount = 0.0
+        self._ledger_used_stake = 0.0
+        self._wallets = {}
+        self._positions = {}
+        for trade in LocalTrade.bt_trades_open:
+            self._ledger[trade.id] = self._ledger_entry(trade)
+            self._ledger_apply(trade.id, self._ledger[trade.id], 1)
+        self._ledger_update_stake()
+
+    def _ledger_update_stake(self) -> None:
+        if not self._ledger:
+            # Avoid accumulating rounding errors once all trades are closed.
+            self._ledger_realized_profit = 0.0
+            self._ledger_stake_amount = 0.0
+            self._ledger_used_stake = 0.0
+        tot_profit = LocalTrade.bt_total_profit + self._ledger_realized_profit
+        current_stake = self.start_cap + tot_profit - self._ledger_stake_amount
+        if self._config.get("trading_mode", "spot") != TradingMode.FUTURES:
+            used_stake = self._ledger_used_stake
+        else:
+            used_stake = self._ledger_stake_amount
+        self._wallets[self._config["stake_currency"]] = Wallet(
+            currency=self._config["stake_currency"],
+            free=current_stake,
+            used=used_stake,
+            total=current_stake + used_stake,
+        )
+
+    def _update_ledger(self) -> None:
+        """
+        Update wallets in backtesting by applying the changes of trades which changed
+        (order placed, filled or canceled, trade closed) since the last update.
+        """
+        if self._ledger_trades_open is not LocalTrade.bt_trades_open:
+            # Trades were reset (new backtest) or restored - rebuild from scratch.
+            self._ledger_trades_open = LocalTrade.bt_trades_open
+            self._ledger_reset()
+        else:
+            for trade_id, trade in LocalTrade.bt_changed_trades.items():
+                if old := self._ledger.pop(trade_id, None):
+                    self._ledger_apply(trade_id, old, -1)
+                if trade in LocalTrade.bt_trades_open_pp[trade.pair]:
+                    self._ledger[trade_id] = self._ledger_entry(trade)
+                    self._ledger_apply(trade_id, self._ledger[trade_id], 1)
+            self._ledger_update_stake()
+        if self._check_ledger:
+            self._verify_ledger()
+
+    def _verify_ledger(self) -> None:
+        """
+        Debug check - compare the ledger against a full recomputation of all wallets.
+        """
+        ledger_wallets, ledger_positions = self._wallets, self._positions
+        self._update_dry()
+        full_wallets, full_positions = self._wallets, self._positions
+        self._wallets, self._positions = ledger_wallets, ledger_positions
+
+        def _differs(a: Optional[tuple], b: Optional[tuple]) -> bool:
+            if a is None or b is None:
+                return a is not b
+            return any(
+                not isclose(x, y, rel_tol=1e-9, abs_tol=1e-9)
+                if isinstance(x, (int, float)) and isinstance(y, (int, float))
+                else x != y
+                for x, y in zip(a, b)
+            )
+
+        for ledger, full in ((ledger_wallets, full_wallets), (ledger_positions, full_positions)):
+            for key in ledger.keys() | full.keys():
+                if _differs(ledger.get(key), full.get(key)):
+                    logger.warning(
+                        f"Wallet ledger inconsistent for {key}: "
+                        f"{ledger.get(key)} != {full.get(key)} (full recomputation)."
+                    )
+
     def _update_live(self) -> None:
         balances = self._exchange.get_balances()
 
@@ -193,8 +377,12 @@ class Wallets:
         ):
             if not self._config["dry_run"] or self._config.get("runmode") == RunMode.LIVE:
                 self._update_live()
+            elif self._use_ledger:
+                self._update_ledger()
             else:
                 self._update_dry()
+            if self._is_backtest:
+                LocalTrade.bt_changed_trades.clear()
             if not self._is_backtest:
                 logger.info("Wallets synced.")
             self._last_wallet_refresh = dt_now()
@@ -247,6 +435,14 @@ class Wallets:
             available_balance = self.get_free(self._config["stake_currency"])
             return available_balance - tot_profit + open_stakes
 
+    def _get_open_trades_stakes(self) -> float:
+        """
+        Total stake amount of open trades - taken from the wallet ledger if enabled.
+        """
+        if self._use_ledger:
+            return self._ledger_stake_amount
+        return Trade.total_open_trades_stakes()
+
     def get_total_stake_amount(self):
         """
         Return the total currently available balance in stake currency, including tied up stake and
@@ -254,7 +450,7 @@ class Wallets:
         Calculated as
         (<open_trade stakes> + free amount) * tradable_balance_ratio
         """
-        val_tied_up = Trade.total_open_trades_stakes()
+        val_tied_up = self._get_open_trades_stakes()
         if "available_capital" in self._config:
             starting_balance = self._config["available_capital"]
             tot_profit = Trade.get_total_closed_profit()
@@ -278,7 +474,7 @@ class Wallets:
         """
 
         free = self.get_free(self._config["stake_currency"])
-        return min(self.get_total_stake_amount() - Trade.total_open_trades_stakes(), free)
+        return min(self.get_total_stake_amount() - self._get_open_trades_stakes(), free)
 
     def _calculate_unlimited_stake_amount(
         self, available_amount: float, val_tied_up: float, max_open_trades: IntOrInf
@@ -330,7 +526,7 @@ class Wallets:
         # Ensure wallets are up-to-date.
         if update:
             self.update()
-        val_tied_up = Trade.total_open_trades_stakes()
+        val_tied_up = self._get_open_trades_stakes()
         available_amount = self.get_available_stake_amount()
 
         if edge:
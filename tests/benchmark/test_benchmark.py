@@ -0,0 +1,142 @@
+from datetime import timedelta
+
+import pytest
+
+from freqtrade.benchmark import (
+    SyntheticExchange,
+    generate_ohlcv,
+    generate_trades,
+    run_benchmarks,
+    store_synthetic_data,
+    synthetic_markets,
+)
+from freqtrade.benchmark.benchmark import BENCHMARK_END, BENCHMARKS
+from freqtrade.constants import BENCHMARK_CASES
+from freqtrade.data.history import get_datahandler
+from freqtrade.enums import CandleType, RunMode, TradingMode
+from freqtrade.persistence import PairLocks, Trade
+from freqtrade.util import dt_utc
+
+
+def test_generate_ohlcv():
+    start = dt_utc(2024, 1, 1)
+    end = dt_utc(2024, 1, 3)
+    df = generate_ohlcv("SYN000/USDT", "1m", start, end)
+    assert len(df) == 2 * 1440
+    assert df.iloc[0]["date"] == start
+    assert (df["high"] >= df[["open", "close"]].max(axis=1)).all()
+    assert (df["low"] <= df[["open", "close"]].min(axis=1)).all()
+    assert (df["low"] > 0).all()
+    # Deterministic
+    assert df.equals(generate_ohlcv("SYN000/USDT", "1m", start, end))
+    assert not df.equals(generate_ohlcv("SYN001/USDT", "1m", start, end))
+    assert not df.equals(generate_ohlcv("SYN000/USDT", "1m", start, end, seed=1))
+
+    # Larger timeframes are consistent with 1m candles
+    df_1h = generate_ohlcv("SYN000/USDT", "1h", start, end)
+    assert len(df_1h) == 48
+    first_hour = df.iloc[:60]
+    assert df_1h.iloc[0]["open"] == first_hour.iloc[0]["open"]
+    assert df_1h.iloc[0]["high"] == first_hour["high"].max()
+    assert df_1h.iloc[0]["low"] == first_hour["low"].min()
+    assert df_1h.iloc[0]["close"] == first_hour.iloc[-1]["close"]
+    assert pytest.approx(df_1h.iloc[0]["volume"]) == first_hour["volume"].sum()
+
+    with pytest.raises(ValueError, match=r"Timeframe 1s is not supported.*"):
+        generate_ohlcv("SYN000/USDT", "1s", start, end)
+
+
+def test_generate_trades():
+    start = dt_utc(2024, 1, 1)
+    end = dt_utc(2024, 1, 1, 1)
+    trades = generate_trades("SYN000/USDT", start, end, trades_per_minute=10)
+    candles = generate_ohlcv("SYN000/USDT", "1m", start, end)
+    assert 400 < len(trades) < 800
+    assert trades["timestamp"].is_monotonic_increasing
+    assert trades["date"].min() >= start
+    assert trades["date"].max() < end
+    assert trades["price"].min() >= candles["low"].min()
+    assert trades["price"].max() <= candles["high"].max()
+    assert set(trades["side"].unique()) == {"buy", "sell"}
+    assert trades.equals(generate_trades("SYN000/USDT", start, end, trades_per_minute=10))
+
+
+@pytest.mark.parametrize("trading_mode", [TradingMode.SPOT, TradingMode.FUTURES])
+def test_store_synthetic_data(tmp_path, trading_mode):
+    pair = "SYN000/USDT:USDT" if trading_mode == TradingMode.FUTURES else "SYN000/USDT"
+    store_synthetic_data(
+        tmp_path,
+        [pair],
+        ["5m", "1h"],
+        dt_utc(2024, 1, 1),
+        dt_utc(2024, 1, 2),
+        trading_mode=trading_mode,
+    )
+    dh = get_datahandler(tmp_path, "feather")
+    candle_type = CandleType.FUTURES if trading_mode == TradingMode.FUTURES else CandleType.SPOT
+    assert len(dh.ohlcv_load(pair, "5m", candle_type=candle_type)) == 288
+    assert len(dh.ohlcv_load(pair, "1h", candle_type=candle_type)) == 24
+    funding = dh.ohlcv_load(pair, "8h", candle_type=CandleType.FUNDING_RATE)
+    assert len(funding) == (6 if trading_mode == TradingMode.FUTURES else 0)
+
+    markets = synthetic_markets([pair], trading_mode)
+    assert markets[pair]["swap"] is (trading_mode == TradingMode.FUTURES)
+    assert markets[pair]["spot"] is (trading_mode == TradingMode.SPOT)
+
+
+def test_synthetic_exchange(default_conf_usdt):
+    default_conf_usdt["exchange"]["pair_whitelist"] = ["SYN000/USDT", "SYN001/USDT"]
+    exchange = SyntheticExchange(default_conf_usdt, latency=0.01, end=BENCHMARK_END)
+    assert list(exchange.markets) == ["SYN000/USDT", "SYN001/USDT"]
+    assert exchange.get_min_pair_stake_amount("SYN000/USDT", 1.0, -0.1) > 5
+
+    pair_list = [
+        ("SYN000/USDT", "5m", CandleType.SPOT),
+        ("SYN001/USDT", "5m", CandleType.SPOT),
+        ("SYN001/USDT", "1h", CandleType.SPOT),
+    ]
+    requests = exchange._api_async.requests
+    res = exchange.refresh_latest_ohlcv(pair_list, cache=False)
+    assert exchange._api_async.requests == requests + 3
+    assert len(res) == 3
+    df = res[("SYN001/USDT", "1h", CandleType.SPOT)]
+    # Last (incomplete) candle is dropped
+    assert len(df) == 499
+    assert df.iloc[-1]["date"] == BENCHMARK_END - timedelta(hours=2)
+    res = exchange.refresh_latest_ohlcv(pair_list, cache=False)
+    assert df.equals(res[("SYN001/USDT", "1h", CandleType.SPOT)])
+
+
+def test_synthetic_exchange_futures(default_conf_usdt):
+    default_conf_usdt["runmode"] = RunMode.BACKTEST
+    default_conf_usdt["trading_mode"] = "futures"
+    default_conf_usdt["margin_mode"] = "isolated"
+    default_conf_usdt["exchange"]["pair_whitelist"] = ["SYN000/USDT:USDT"]
+    exchange = SyntheticExchange(default_conf_usdt, load_leverage_tiers=True)
+    assert exchange.get_max_leverage("SYN000/USDT:USDT", 100) == 20
+    assert exchange.get_max_leverage("SYN000/USDT:USDT", 10_000) == 10
+    assert exchange.get_maintenance_ratio_and_amt("SYN000/USDT:USDT", 200_000) == (0.01, 500)
+
+
+def test_run_benchmarks(tmp_path):
+    assert set(BENCHMARKS) == set(BENCHMARK_CASES)
+    cases = ["trades_to_ohlcv", "backtest_signals", "dataprovider", "ohlcv_to_dataframe"]
+    results = run_benchmarks(
+        {"cases": cases, "pairs": 2, "days": 2, "repeat": 2, "latency_ms": 0}, isolate=False
+    )
+    assert results["settings"]["cases"] == [
+        "backtest_signals",
+        "dataprovider",
+        "ohlcv_to_dataframe",
+        "trades_to_ohlcv",
+    ]
+    assert results["settings"]["seed"] == 42
+    assert set(results["results"]) == set(cases)
+    # Database use is restored after in-process backtests
+    assert Trade.use_db is True
+    assert PairLocks.use_db is True
+    for result in results["results"].values():
+        assert len(result["timings"]) == 2
+        assert result["min"] <= result["median"] <= max(result["timings"])
+        assert result["mean"] > 0
+        assert result["peak_memory"] is None or result["peak_memory"] > 0
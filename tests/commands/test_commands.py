@@ -10,6 +10,7 @@ import pytest
 
 from freqtrade.commands import (
     start_backtesting_show,
+    start_benchmark,
     start_convert_data,
     start_convert_db,
     start_convert_trades,
@@ -40,6 +41,7 @@ from freqtrade.commands.deploy_ui import (
     read_ui_version,
 )
 from freqtrade.configuration import setup_utils_configuration
+from freqtrade.constants import BENCHMARK_CASES
 from freqtrade.enums import RunMode
 from freqtrade.exceptions import OperationalException
 from freqtrade.persistence.models import init_db
@@ -1904,3 +1906,29 @@ def test_start_show_config(capsys, caplog):
     assert '"max_open_trades":' in captured.out
     assert '"secret": "REDACTED"' not in captured.out
     assert log_has_re(r"Sensitive information will be shown in the upcoming output.*", caplog)
+
+
+def test_start_benchmark(mocker, capsys, caplog, tmp_path):
+    run_mock = mocker.patch(
+        "freqtrade.benchmark.run_benchmarks",
+        return_value={"results": {"backtest_signals": {"median": 0.5}}},
+    )
+    args = ["benchmark", "--cases", "backtest_signals", "--pair-count", "3", "--latency", "0"]
+    start_benchmark(get_args(args))
+    assert run_mock.call_count == 1
+    assert run_mock.call_args[0][0] == {
+        "cases": ["backtest_signals"],
+        "repeat": 3,
+        "pairs": 3,
+        "days": 30,
+        "latency_ms": 0,
+        "seed": 42,
+    }
+    captured = capsys.readouterr()
+    assert json.loads(captured.out) == {"results": {"backtest_signals": {"median": 0.5}}}
+
+    output = tmp_path / "benchmark.json"
+    start_benchmark(get_args(["benchmark", "--output", str(output)]))
+    assert run_mock.call_args[0][0]["cases"] == BENCHMARK_CASES
+    assert json.loads(output.read_text()) == {"results": {"backtest_signals": {"median": 0.5}}}
+    assert log_has(f"Benchmark results written to {output}.", caplog)
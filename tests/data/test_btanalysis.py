@@ -4,17 +4,21 @@ from unittest.mock import MagicMock
 
 import pytest
 from pandas import DataFrame, DateOffset, Timestamp, to_datetime
+from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration import TimeRange
-from freqtrade.constants import LAST_BT_RESULT_FN
+from freqtrade.constants import BT_RESULT_INDEX_FN, LAST_BT_RESULT_FN
 from freqtrade.data.btanalysis import (
     BT_DATA_COLUMNS,
     analyze_trade_parallelism,
+    delete_backtest_result,
     extract_trades_of_period,
+    get_backtest_resultlist,
     get_latest_backtest_filename,
     get_latest_hyperopt_file,
     load_backtest_data,
     load_backtest_metadata,
+    load_backtest_stats,
     load_trades,
     load_trades_from_db,
 )
@@ -34,6 +38,8 @@ from freqtrade.data.metrics import (
     create_cum_profit,
 )
 from freqtrade.exceptions import OperationalException
+from freqtrade.optimize.backtest_caching import get_backtest_trades_filename, load_backtest_index
+from freqtrade.optimize.optimize_reports import store_backtest_stats
 from freqtrade.util import dt_utc
 from tests.conftest import CURRENT_TEST_STRATEGY, create_mock_trades
 from tests.conftest_trades import MOCK_TRADE_COUNT
@@ -141,6 +147,68 @@ def test_load_backtest_data_multi(testdatadir):
         load_backtest_data(filename)
 
 
+def test_load_backtest_data_columnar(testdatadir, tmp_path):
+    filename_json = testdatadir / "backtest_results/backtest-result_multistrat.json"
+    stats = load_backtest_stats(filename_json)
+    filename = store_backtest_stats(
+        tmp_path, stats, "2024-01-01_15-05-13", export_format="columnar"
+    )
+    assert get_backtest_trades_filename(filename).is_file()
+
+    # Statistics only
+    stats_only = load_backtest_stats(filename, include_trades=False)
+    assert stats_only["metadata"] == stats["metadata"]
+    for strategy, strat_stats in stats_only["strategy"].items():
+        assert strat_stats["trades"] == []
+        assert strat_stats["total_trades"] == stats["strategy"][strategy]["total_trades"]
+
+    stats_full = load_backtest_stats(filename)
+    for strategy in ("StrategyTestV2", "TestStrategy"):
+        assert stats_full["strategy"][strategy]["trades"] == stats["strategy"][strategy]["trades"]
+
+        # Trades only
+        bt_data = load_backtest_data(filename, strategy=strategy)
+        assert set(bt_data.columns) == set(BT_DATA_COLUMNS)
+        assert len(bt_data) == 179
+        expected = load_backtest_data(filename_json, strategy=strategy)
+        assert_frame_equal(bt_data[BT_DATA_COLUMNS], expected[BT_DATA_COLUMNS])
+
+    with pytest.raises(ValueError, match=r"Strategy XYZ not available in the backtest result\."):
+        load_backtest_data(filename, strategy="XYZ")
+
+    with pytest.raises(ValueError, match=r"Detected backtest result with more than one strategy.*"):
+        load_backtest_data(filename)
+
+
+def test_get_backtest_resultlist_index(testdatadir, tmp_path, mocker):
+    stats = load_backtest_stats(testdatadir / "backtest_results/backtest-result_multistrat.json")
+    fn1 = store_backtest_stats(tmp_path, stats, "2024-01-01_15-05-13")
+    fn2 = store_backtest_stats(tmp_path, stats, "2024-01-02_15-05-13", export_format="columnar")
+    assert set(load_backtest_index(tmp_path)) == {fn1.stem, fn2.stem}
+
+    # Indexed results don't require reading metadata files
+    load_meta_mock = mocker.patch(
+        "freqtrade.data.btanalysis.load_backtest_metadata", side_effect=OSError()
+    )
+    results = get_backtest_resultlist(tmp_path)
+    assert load_meta_mock.call_count == 0
+    assert len(results) == 4
+    # Newest first
+    assert results[0]["filename"] == fn2.stem
+    assert results[2]["filename"] == fn1.stem
+    mocker.stopall()
+
+    # Results missing in the index are added to it
+    (tmp_path / BT_RESULT_INDEX_FN).unlink()
+    assert get_backtest_resultlist(tmp_path) == results
+    assert set(load_backtest_index(tmp_path)) == {fn1.stem, fn2.stem}
+
+    delete_backtest_result(fn2)
+    assert not get_backtest_trades_filename(fn2).is_file()
+    assert set(load_backtest_index(tmp_path)) == {fn1.stem}
+    assert len(get_backtest_resultlist(tmp_path)) == 2
+
+
 @pytest.mark.usefixtures("init_persistence")
 @pytest.mark.parametrize("is_short", [False, True])
 def test_load_trades_from_db(default_conf, fee, is_short, mocker):
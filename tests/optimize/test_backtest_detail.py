@@ -8,7 +8,7 @@ from freqtrade.data.history import get_timerange
 from freqtrade.enums import ExitType, TradingMode
 from freqtrade.optimize.backtesting import Backtesting
 from freqtrade.persistence.trade_model import LocalTrade
-from tests.conftest import EXMS, patch_exchange
+from tests.conftest import CURRENT_TEST_STRATEGY, EXMS, patch_exchange
 from tests.optimize import (
     BTContainer,
     BTrade,
@@ -1180,10 +1180,23 @@ TESTS = [
 
 
 @pytest.mark.parametrize("data", TESTS)
-def test_backtest_results(default_conf, mocker, caplog, data: BTContainer) -> None:
+@pytest.mark.parametrize(
+    "engine,strategy",
+    [
+        ("legacy", CURRENT_TEST_STRATEGY),
+        ("columnar", CURRENT_TEST_STRATEGY),
+        # Doesn't implement callbacks - uses the signals-only fast path where possible
+        ("columnar", "StrategyTestV2"),
+    ],
+)
+def test_backtest_results(
+    default_conf, mocker, caplog, data: BTContainer, engine, strategy
+) -> None:
     """
     run functional tests
     """
+    default_conf["backtest_engine"] = engine
+    default_conf["strategy"] = strategy
     default_conf["stoploss"] = data.stop_loss
     default_conf["minimal_roi"] = data.roi
     default_conf["timeframe"] = tests_timeframe
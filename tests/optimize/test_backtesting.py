@@ -1,5 +1,6 @@
 # pragma pylint: disable=missing-docstring, W0212, line-too-long, C0103, unused-argument
 
+import os
 import random
 from collections import defaultdict
 from copy import deepcopy
@@ -19,13 +20,29 @@ from freqtrade.data.btanalysis import BT_DATA_COLUMNS, evaluate_result_multi
 from freqtrade.data.converter import clean_ohlcv_dataframe, ohlcv_fill_up_missing_data
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.data.history import get_timerange
-from freqtrade.enums import CandleType, ExitType, RunMode
+from freqtrade.enums import CandleType, ExitType, RPCMessageType, RunMode
 from freqtrade.exceptions import DependencyException, OperationalException
 from freqtrade.exchange import timeframe_to_next_date, timeframe_to_prev_date
-from freqtrade.optimize.backtest_caching import get_backtest_metadata_filename, get_strategy_run_id
+from freqtrade.optimize.backtest_caching import (
+    get_backtest_metadata_filename,
+    get_data_fingerprint,
+    get_indicator_cache_key,
+    get_strategy_run_id,
+    prune_indicator_cache,
+)
+from freqtrade.optimize.backtest_columnar import (
+    DetailPairData,
+    dataframe_to_columnar,
+    spill_columnar,
+    spill_dataframe,
+)
 from freqtrade.optimize.backtesting import Backtesting
-from freqtrade.persistence import LocalTrade, Trade
+from freqtrade.optimize.bt_pruner import BacktestPruner
+from freqtrade.optimize.bt_signal_cache import SignalCache
+from freqtrade.optimize.bt_stream import BacktestStream
+from freqtrade.persistence import BacktestTrade, LocalTrade, PairLocks, Trade
 from freqtrade.resolvers import StrategyResolver
+from freqtrade.strategy import IntParameter
 from freqtrade.util.datetime_helpers import dt_utc
 from tests.conftest import (
     CURRENT_TEST_STRATEGY,
@@ -196,6 +213,8 @@ def test_setup_bt_configuration_with_arguments(mocker, default_conf, caplog) ->
         "foo_bar.json",
         "--fee",
         "0",
+        "--backtest-engine",
+        "columnar",
     ]
 
     config = setup_optimize_configuration(get_args(args), RunMode.BACKTEST)
@@ -229,6 +248,9 @@ def test_setup_bt_configuration_with_arguments(mocker, default_conf, caplog) ->
     assert "fee" in config
     assert log_has("Parameter --fee detected, setting fee to: {} ...".format(config["fee"]), caplog)
 
+    assert config["backtest_engine"] == "columnar"
+    assert log_has("Using backtest engine: columnar ...", caplog)
+
 
 def test_setup_optimize_configuration_stake_amount(mocker, default_conf, caplog) -> None:
     patched_configuration_load_config_file(mocker, default_conf)
@@ -353,6 +375,406 @@ def test_data_to_dataframe_bt(default_conf, mocker, testdatadir) -> None:
     assert processed["UNITTEST/BTC"].equals(processed2["UNITTEST/BTC"])
 
 
+def test_advise_all_indicators_cached(default_conf, mocker, testdatadir, tmp_path, caplog) -> None:
+    patch_exchange(mocker)
+    default_conf.update({"user_data_dir": tmp_path, "backtest_indicator_cache": True})
+    timerange = TimeRange.parse_timerange("1510694220-1510700340")
+    data = history.load_data(
+        testdatadir, "1m", ["UNITTEST/BTC"], timerange=timerange, fill_up_missing=True
+    )
+    backtesting = Backtesting(default_conf)
+    assert backtesting.indicator_cache is True
+    backtesting._set_strategy(backtesting.strategylist[0])
+    advise_mock = mocker.spy(backtesting.strategy, "advise_all_indicators")
+
+    processed = backtesting._advise_all_indicators(data, timerange)
+    assert advise_mock.call_count == 1
+    cache_entries = list((tmp_path / "backtest_results" / ".cache").iterdir())
+    assert len(cache_entries) == 1
+    assert (cache_entries[0] / "index.json").is_file()
+    assert (cache_entries[0] / "UNITTEST_BTC.feather").is_file()
+
+    processed2 = backtesting._advise_all_indicators(data, timerange)
+    assert advise_mock.call_count == 1
+    assert log_has(f"Using cached indicators for {CURRENT_TEST_STRATEGY}.", caplog)
+    pd.testing.assert_frame_equal(processed["UNITTEST/BTC"], processed2["UNITTEST/BTC"])
+
+    # Different timerange - indicators are recalculated
+    timerange2 = TimeRange.parse_timerange("1510694220-1510700280")
+    backtesting._advise_all_indicators(data, timerange2)
+    assert advise_mock.call_count == 2
+
+    # Disabled cache
+    backtesting.indicator_cache = False
+    backtesting._advise_all_indicators(data, timerange)
+    assert advise_mock.call_count == 3
+
+
+def test_get_indicator_cache_key(default_conf, mocker, testdatadir) -> None:
+    default_conf.update({"strategy": "HyperoptableStrategy"})
+    strategy = StrategyResolver.load_strategy(default_conf)
+    strategy.ft_bot_start()
+    timerange = TimeRange.parse_timerange("1510694220-1510700340")
+    pairs = [("UNITTEST/BTC", "1m", CandleType.SPOT), ("NOPAIR/BTC", "1m", CandleType.SPOT)]
+    fingerprint = get_data_fingerprint(default_conf, pairs)
+    assert len(fingerprint) == 2
+    assert fingerprint[0][0] == "NOPAIR_BTC-1m.feather"
+    assert fingerprint[0][1] is None
+    assert fingerprint[1][0] == "UNITTEST_BTC-1m.feather"
+    assert fingerprint[1][1] > 0
+
+    key = get_indicator_cache_key(strategy, timerange, 20, fingerprint)
+    assert key == get_indicator_cache_key(strategy, timerange, 20, fingerprint)
+    # Result-only options don't affect indicators
+    strategy.config["backtest_profile_callbacks"] = True
+    assert key == get_indicator_cache_key(strategy, timerange, 20, fingerprint)
+
+    assert key != get_indicator_cache_key(strategy, timerange, 30, fingerprint)
+    assert key != get_indicator_cache_key(strategy, timerange, 20, fingerprint[1:])
+    # Any configuration value may be read by populate_indicators()
+    strategy.config["custom_setting"] = 5
+    key2 = get_indicator_cache_key(strategy, timerange, 20, fingerprint)
+    assert key2 != key
+    strategy.buy_rsi.value = 12
+    assert key2 != get_indicator_cache_key(strategy, timerange, 20, fingerprint)
+    mocker.patch(
+        "freqtrade.optimize.backtest_caching.get_strategy_run_id", return_value="changed_file"
+    )
+    assert key2 != get_indicator_cache_key(strategy, timerange, 20, fingerprint)
+
+
+def test_prune_indicator_cache(tmp_path) -> None:
+    entries = [f"{i:040x}" for i in range(4)]
+    for i, name in enumerate(entries):
+        (tmp_path / name).mkdir()
+        os.utime(tmp_path / name, ns=(i * 10**9, i * 10**9))
+    (tmp_path / "checkpoint-Strategy-abc.pkl").touch()
+    (tmp_path / "memmap-abc").mkdir()
+
+    prune_indicator_cache(tmp_path, keep=2)
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        *entries[2:],
+        "checkpoint-Strategy-abc.pkl",
+        "memmap-abc",
+    ]
+
+
+def test_get_ohlcv_as_arrays(default_conf, mocker, testdatadir) -> None:
+    patch_exchange(mocker)
+    pairs = ["ADA/BTC", "ETH/BTC", "UNITTEST/BTC"]
+    data = history.load_data(datadir=testdatadir, timeframe="5m", pairs=pairs)
+    data = trim_dictlist(data, -500)
+
+    def advise_entry(df, metadata):
+        df["enter_long"] = np.where(df.index % 7 == 0, 1, 0)
+        df["enter_short"] = np.where(df.index % 11 == 0, 1, np.nan)
+        df.loc[df.index % 14 == 0, "enter_tag"] = "tag_" + metadata["pair"]
+        return df
+
+    def advise_exit(df, metadata):
+        df["exit_long"] = np.where(df.index % 5 == 0, 1, 0)
+        df["exit_tag"] = None
+        df.loc[df.index % 10 == 0, "exit_tag"] = "exit_10"
+        return df
+
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    backtesting.strategy.advise_entry = advise_entry
+    backtesting.strategy.advise_exit = advise_exit
+    processed = backtesting.strategy.advise_all_indicators(data)
+
+    lists = backtesting._get_ohlcv_as_lists(deepcopy(processed))
+    arrays = backtesting._get_ohlcv_as_arrays(deepcopy(processed))
+    assert list(lists.keys()) == list(arrays.keys())
+    for pair in pairs:
+        assert len(lists[pair]) == len(arrays[pair]) == 479
+        for idx, row in enumerate(lists[pair]):
+            assert row == arrays[pair][idx]
+            assert arrays[pair].has_entry_signal(idx, False) == (row[5] == 1)
+            assert arrays[pair].has_entry_signal(idx, True) == (row[5] == 1 or row[7] == 1)
+        assert lists[pair][-1] == arrays[pair][-1]
+        assert arrays[pair].nbytes < 479 * 64
+    with pytest.raises(IndexError):
+        arrays[pairs[0]][479]
+
+    # Empty dataframes result in empty arrays
+    assert len(dataframe_to_columnar(processed["ADA/BTC"].iloc[:0])) == 0
+    assert len(dataframe_to_columnar(processed["ADA/BTC"].iloc[:1])) == 0
+
+
+def test_detail_pair_data() -> None:
+    candles_1m = generate_test_data("1m", 60, "2022-01-03 12:00:00+00:00")
+    # Gap in the detail data - between 12:10 and 12:20
+    candles_1m = candles_1m[
+        (candles_1m["date"].dt.minute < 10) | (candles_1m["date"].dt.minute >= 20)
+    ]
+    main_dates = (
+        pd.date_range("2022-01-03 11:55:00", periods=14, freq="5min", tz="UTC").as_unit("ns").asi8
+    )
+    detail = DetailPairData(candles_1m, main_dates, 300 * 1_000_000_000)
+    assert len(detail) == 50
+    signals = (1, 0, 0, 0, "tag", None)
+    # No detail data before the start
+    assert detail.rows(0, signals) == []
+    rows = detail.rows(1, signals)
+    assert len(rows) == 5
+    assert rows[0][0] == pd.Timestamp("2022-01-03 12:00:00+00:00")
+    assert rows[-1][0] == pd.Timestamp("2022-01-03 12:04:00+00:00")
+    assert rows[0][1:5] == tuple(candles_1m.iloc[0][["open", "high", "low", "close"]])
+    assert rows[2][5:] == signals
+    assert detail.rows(3, signals) == []
+    assert detail.rows(4, signals) == []
+    assert len(detail.rows(5, signals)) == 5
+    assert len(detail.rows(12, signals)) == 5
+    assert detail.rows(13, signals) == []
+
+
+@pytest.mark.parametrize(
+    "strategy,tres,trailing,signals_only",
+    [
+        ("StrategyTestV3", 0, {}, False),
+        ("StrategyTestV3", 30, {}, False),
+        ("StrategyTestV2", 0, {}, True),
+        ("StrategyTestV2", 30, {"trailing_stop": True}, True),
+        (
+            "StrategyTestV2",
+            0,
+            {
+                "trailing_stop": True,
+                "trailing_stop_positive": 0.01,
+                "trailing_stop_positive_offset": 0.015,
+                "trailing_only_offset_is_reached": True,
+            },
+            True,
+        ),
+        # trailing_stop_positive > stoploss disables the signals-only fast path
+        ("StrategyTestV2", 0, {"trailing_stop": True, "trailing_stop_positive": 0.2}, False),
+    ],
+)
+def test_backtest_engines_identical(
+    default_conf, fee, mocker, testdatadir, strategy, tres, trailing, signals_only
+) -> None:
+    default_conf["max_open_trades"] = 3
+    default_conf["strategy"] = strategy
+    default_conf.update(trailing)
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    patch_exchange(mocker)
+    pairs = ["ADA/BTC", "DASH/BTC", "ETH/BTC", "LTC/BTC", "NXT/BTC"]
+    data = history.load_data(datadir=testdatadir, timeframe="5m", pairs=pairs)
+    data = trim_dictlist(data, -1000)
+    if tres > 0:
+        data["LTC/BTC"] = data["LTC/BTC"][tres:].reset_index()
+
+    results = {}
+    for engine in constants.BACKTEST_ENGINES:
+        default_conf["backtest_engine"] = engine
+        backtesting = Backtesting(default_conf)
+        backtesting._set_strategy(backtesting.strategylist[0])
+        backtesting.strategy.bot_loop_start = MagicMock()
+        processed = backtesting.strategy.advise_all_indicators(data)
+        min_date, max_date = get_timerange(processed)
+        results[engine] = backtesting.backtest(
+            processed=deepcopy(processed), start_date=min_date, end_date=max_date
+        )
+        assert backtesting.strategy.bot_loop_start.call_count == 999
+        assert backtesting._signals_only is (signals_only and engine == "columnar")
+        backtesting.cleanup()
+
+    assert len(results["legacy"]["results"]) > 10
+    pd.testing.assert_frame_equal(results["legacy"]["results"], results["columnar"]["results"])
+    assert results["legacy"]["final_balance"] == results["columnar"]["final_balance"]
+    assert results["legacy"]["rejected_signals"] == results["columnar"]["rejected_signals"]
+
+
+@pytest.mark.parametrize("strategy", ["StrategyTestV3", "StrategyTestV2"])
+def test_backtest_memory_bounded(
+    default_conf, fee, mocker, testdatadir, tmp_path, caplog, strategy
+) -> None:
+    default_conf.update(
+        {
+            "max_open_trades": 3,
+            "strategy": strategy,
+            "user_data_dir": tmp_path,
+            "backtest_indicator_cache": True,
+        }
+    )
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    patch_exchange(mocker)
+    pairs = ["ADA/BTC", "DASH/BTC", "ETH/BTC", "LTC/BTC", "NXT/BTC"]
+    data = history.load_data(datadir=testdatadir, timeframe="5m", pairs=pairs)
+    data = trim_dictlist(data, -1000)
+    timerange = TimeRange.parse_timerange(None)
+
+    spill_mock = mocker.patch(
+        "freqtrade.optimize.backtesting.spill_columnar", side_effect=spill_columnar
+    )
+
+    results = {}
+    for memory_bounded in (False, True):
+        default_conf["backtest_memory_bounded"] = memory_bounded
+        backtesting = Backtesting(default_conf)
+        assert backtesting.memory_bounded is memory_bounded
+        backtesting.indicator_cache = False
+        backtesting.backtest_one_strategy(backtesting.strategylist[0], data, timerange)
+        results[memory_bounded] = backtesting.all_results[strategy]
+        assert spill_mock.call_count == (len(pairs) if memory_bounded else 0)
+        backtesting.cleanup()
+
+    assert log_has("Memory-bounded mode requires the columnar backtest engine. Using it.", caplog)
+    # Only StrategyTestV3 implements callbacks
+    keeps_analyzed = log_has_re(r"Strategy implements callbacks - keeping analyzed.*", caplog)
+    assert keeps_analyzed is (strategy == "StrategyTestV3")
+    assert log_has(
+        "Indicator cache is not supported in memory-bounded mode. Disabling indicator cache.",
+        caplog,
+    )
+    # Raw data is not modified
+    assert all(len(df) == 1000 for df in data.values())
+    # Memory-mapped files are removed after the backtest
+    assert list((tmp_path / "backtest_results" / ".cache").iterdir()) == []
+    assert len(results[False]["results"]) > 10
+    pd.testing.assert_frame_equal(results[False]["results"], results[True]["results"])
+    assert results[False]["final_balance"] == results[True]["final_balance"]
+    assert results[True]["peak_memory"] > 0
+
+    # Signals can't be exported without analyzed dataframes
+    default_conf["export"] = "signals"
+    backtesting = Backtesting(default_conf)
+    assert backtesting.memory_bounded is False
+    assert log_has_re(r"Memory-bounded mode does not keep analyzed dataframes.*", caplog)
+
+
+def test_spill_columnar(default_conf, mocker, testdatadir, tmp_path) -> None:
+    patch_exchange(mocker)
+    data = history.load_data(datadir=testdatadir, timeframe="5m", pairs=["UNITTEST/BTC"])
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    processed = backtesting.strategy.advise_all_indicators(data)
+    arrays = backtesting._get_ohlcv_as_arrays(processed)["UNITTEST/BTC"]
+
+    spilled = spill_columnar(arrays, tmp_path / "0")
+    assert (tmp_path / "0" / "close.npy").is_file()
+    assert isinstance(spilled.close, np.memmap)
+    assert len(spilled) == len(arrays) > 0
+    assert spilled.tags == arrays.tags
+    for idx in (0, 10, len(arrays) - 1):
+        assert spilled[idx] == arrays[idx]
+    with pytest.raises(ValueError):
+        # Memory-mapped arrays are read-only
+        spilled.close[0] = 1.0
+
+    # Empty arrays are not spilled
+    empty = spill_columnar(dataframe_to_columnar(processed["UNITTEST/BTC"].iloc[:0]), tmp_path)
+    assert len(empty) == 0
+    assert not (tmp_path / "date.npy").exists()
+
+
+def test_spill_dataframe(default_conf, mocker, testdatadir, tmp_path) -> None:
+    patch_exchange(mocker)
+    data = history.load_data(datadir=testdatadir, timeframe="5m", pairs=["UNITTEST/BTC"])
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    df = backtesting.strategy.advise_all_indicators(data)["UNITTEST/BTC"]
+    df["tag"] = "a"
+
+    spilled = spill_dataframe(df, tmp_path / "analyzed")
+    pd.testing.assert_frame_equal(spilled, df)
+    # Numeric columns are memory-mapped - dates and strings remain in memory
+    assert isinstance(spilled["close"].values.base, np.memmap)
+    assert not (tmp_path / "analyzed" / f"{df.columns.get_loc('date')}.npy").exists()
+    assert not (tmp_path / "analyzed" / f"{df.columns.get_loc('tag')}.npy").exists()
+    # Copy-on-write - changes don't reach the original or the files
+    close = df["close"].iloc[0]
+    spilled.loc[0, "close"] = 0.0
+    assert df["close"].iloc[0] == close
+    assert np.load(tmp_path / "analyzed" / f"{df.columns.get_loc('close')}.npy")[0] == close
+
+
+@pytest.mark.parametrize("strategy", ["StrategyTestV3", "StrategyTestV2"])
+def test_backtest_skip_idle_candles(default_conf, fee, mocker, testdatadir, strategy) -> None:
+    default_conf["max_open_trades"] = 3
+    default_conf["strategy"] = strategy
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    mocker.patch(f"{EXMS}.get_fee", fee)
+    patch_exchange(mocker)
+    pairs = ["ADA/BTC", "DASH/BTC", "ETH/BTC", "LTC/BTC", "NXT/BTC"]
+    data = history.load_data(datadir=testdatadir, timeframe="5m", pairs=pairs)
+    data = trim_dictlist(data, -1000)
+    data["LTC/BTC"] = data["LTC/BTC"][30:].reset_index()
+
+    def run_backtest(engine, skip_bot_loop_start=None):
+        default_conf["backtest_engine"] = engine
+        backtesting = Backtesting(default_conf)
+        backtesting._set_strategy(backtesting.strategylist[0])
+        if skip_bot_loop_start is not None:
+            backtesting.strategy.skip_idle_bot_loop_start = skip_bot_loop_start
+            backtesting.strategy.bot_loop_start = MagicMock()
+        processed = backtesting.strategy.advise_all_indicators(data)
+        min_date, max_date = get_timerange(processed)
+        result = backtesting.backtest(
+            processed=deepcopy(processed), start_date=min_date, end_date=max_date
+        )
+        assert backtesting.progress.progress == 1
+        bot_loop_start = backtesting.strategy.bot_loop_start
+        backtesting.cleanup()
+        return result, bot_loop_start
+
+    legacy, _ = run_backtest("legacy")
+    assert len(legacy["results"]) > 10
+    # bot_loop_start isn't implemented - idle candles are skipped
+    columnar, _ = run_backtest("columnar")
+    pd.testing.assert_frame_equal(legacy["results"], columnar["results"])
+    assert legacy["final_balance"] == columnar["final_balance"]
+
+    # bot_loop_start is implemented - all candles are visited
+    columnar, bot_loop_start = run_backtest("columnar", False)
+    pd.testing.assert_frame_equal(legacy["results"], columnar["results"])
+    assert bot_loop_start.call_count == 999
+
+    # Strategy allows skipping bot_loop_start
+    columnar, bot_loop_start = run_backtest("columnar", True)
+    pd.testing.assert_frame_equal(legacy["results"], columnar["results"])
+    assert legacy["final_balance"] == columnar["final_balance"]
+    assert 0 < bot_loop_start.call_count < 999
+
+
+def test_is_signals_only_strategy(default_conf, mocker) -> None:
+    patch_exchange(mocker)
+    default_conf["strategy"] = "StrategyTestV2"
+    default_conf["backtest_engine"] = "columnar"
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    assert backtesting._is_signals_only_strategy()
+
+    backtesting.backtest_engine = "legacy"
+    assert not backtesting._is_signals_only_strategy()
+    backtesting.backtest_engine = "columnar"
+
+    backtesting.timeframe_detail = "1m"
+    assert not backtesting._is_signals_only_strategy()
+    backtesting.timeframe_detail = ""
+
+    backtesting.strategy.use_custom_stoploss = True
+    assert not backtesting._is_signals_only_strategy()
+    backtesting.strategy.use_custom_stoploss = False
+
+    backtesting.strategy.custom_exit = MagicMock()
+    assert not backtesting._is_signals_only_strategy()
+    del backtesting.strategy.custom_exit
+    assert backtesting._is_signals_only_strategy()
+
+    # StrategyTestV3 implements adjust_trade_position
+    default_conf["strategy"] = CURRENT_TEST_STRATEGY
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    assert not backtesting._is_signals_only_strategy()
+
+
 def test_backtest_abort(default_conf, mocker, testdatadir) -> None:
     patch_exchange(mocker)
     backtesting = Backtesting(default_conf)
@@ -848,6 +1270,455 @@ def test_backtest_one(default_conf, mocker, testdatadir) -> None:
         ) < round(t["close_rate"], 6) < round(ln1.iloc[0]["high"], 6)
 
 
+@pytest.mark.parametrize("engine", ["legacy", "columnar"])
+def test_backtest_incremental(default_conf, mocker, testdatadir, tmp_path, caplog, engine) -> None:
+    default_conf["max_open_trades"] = 10
+    default_conf["backtest_engine"] = engine
+
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    pairs = ["ADA/BTC", "ETH/BTC", "UNITTEST/BTC"]
+    data = history.load_data(datadir=testdatadir, timeframe="5m", pairs=pairs)
+    data = trim_dictlist(data, -500)
+    processed = backtesting.strategy.advise_all_indicators(data)
+    min_date, max_date = get_timerange(processed)
+    mid_date = min_date + timedelta(minutes=5 * 250)
+
+    def run_backtest(processed, end_date):
+        backtesting.trade_id_counter = 0
+        backtesting.order_id_counter = 0
+        return backtesting.backtest(
+            processed=deepcopy(processed), start_date=min_date, end_date=end_date
+        )
+
+    full_result = run_backtest(processed, max_date)
+    assert len(full_result["results"]) > 0
+
+    checkpoint_file = tmp_path / "checkpoint.pkl"
+    backtesting.checkpoint_file = checkpoint_file
+    partial = {pair: df[df["date"] <= mid_date] for pair, df in processed.items()}
+    partial_result = run_backtest(partial, mid_date)
+    assert checkpoint_file.is_file()
+    assert not log_has_re(r"Resuming backtest from checkpoint.*", caplog)
+    # Some trades were force-exited at the end of the partial backtest
+    assert len(partial_result["results"]) > 0
+
+    resumed_result = run_backtest(processed, max_date)
+    # State is saved before the last candle, which doesn't allow entries.
+    checkpoint_date = mid_date - timedelta(minutes=5)
+    assert log_has(
+        f"Resuming backtest from checkpoint at {checkpoint_date.strftime('%Y-%m-%d %H:%M:%S')}.",
+        caplog,
+    )
+    pd.testing.assert_frame_equal(full_result["results"], resumed_result["results"])
+    assert full_result["final_balance"] == resumed_result["final_balance"]
+
+    # Checkpoint ends after the backtest - not used.
+    caplog.clear()
+    run_backtest(partial, mid_date - timedelta(minutes=5))
+    assert not log_has_re(r"Resuming backtest from checkpoint.*", caplog)
+
+
+def test_backtest_profile_callbacks(default_conf, mocker, testdatadir) -> None:
+    default_conf["max_open_trades"] = 10
+    default_conf["backtest_profile_callbacks"] = True
+
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    timerange = TimeRange("date", None, 1517227800, 0)
+    data = history.load_data(
+        datadir=testdatadir, timeframe="5m", pairs=["UNITTEST/BTC"], timerange=timerange
+    )
+    processed = backtesting.strategy.advise_all_indicators(data)
+    order_filled = MagicMock()
+    backtesting.strategy.order_filled = order_filled
+    min_date, max_date = get_timerange(processed)
+
+    result = backtesting.backtest(processed=processed, start_date=min_date, end_date=max_date)
+    assert len(result["results"]) > 0
+    profile = {p["name"]: p for p in result["callback_profile"]}
+    assert profile["backtest"]["pct_of_loop"] == 100.0
+    assert profile["backtest"] == result["callback_profile"][0]
+    assert profile["backtest_loop"]["calls"] > 0
+    assert profile["_enter_trade"]["calls"] >= len(result["results"])
+    assert profile["order_filled"]["calls"] == order_filled.call_count
+    for entry in profile.values():
+        assert set(entry) == {"name", "calls", "total_ms", "mean_us", "p99_us", "pct_of_loop"}
+    # Callbacks not implemented by the strategy are not profiled
+    assert "custom_exit" not in profile
+
+    # Wrapped functions are restored
+    assert "backtest_loop" not in vars(backtesting)
+    assert "update" not in vars(backtesting.wallets)
+    assert backtesting.strategy.order_filled is order_filled
+    assert not hasattr(PairLocks.is_pair_locked, "__wrapped__")
+
+
+def test_backtest_stream(default_conf, mocker, testdatadir) -> None:
+    default_conf["max_open_trades"] = 10
+
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    timerange = TimeRange("date", None, 1517227800, 0)
+    data = history.load_data(
+        datadir=testdatadir, timeframe="5m", pairs=["UNITTEST/BTC"], timerange=timerange
+    )
+    processed = backtesting.strategy.advise_all_indicators(data)
+    min_date, max_date = get_timerange(processed)
+
+    expected = backtesting.backtest(
+        processed=deepcopy(processed), start_date=min_date, end_date=max_date
+    )["results"]
+    assert len(expected) > 1
+
+    chunks = []
+    backtesting.stream = BacktestStream(chunks.append, chunk_size=1, interval=3600)
+    result = backtesting.backtest(processed=processed, start_date=min_date, end_date=max_date)
+
+    # Results are built from the streamed trades
+    pd.testing.assert_frame_equal(result["results"], expected)
+    assert all(c["type"] == RPCMessageType.BACKTEST for c in chunks)
+    trades = [t for c in chunks for t in c["data"]["trades"]]
+    assert [t["close_timestamp"] for t in trades] == expected["close_timestamp"].tolist()
+    assert all(len(c["data"]["trades"]) <= 1 for c in chunks[:-1])
+    assert [c["data"]["finished"] for c in chunks] == [False] * (len(chunks) - 1) + [True]
+    assert chunks[-1]["data"]["trade_count"] == len(expected)
+    assert chunks[-1]["data"]["strategy"] == CURRENT_TEST_STRATEGY
+
+    equity = [e for c in chunks for e in c["data"]["equity"]]
+    # One snapshot per day - and one at the end of the backtest
+    assert len(equity) >= (max_date - min_date).days + 1
+    assert equity[-1]["timestamp"] == int(max_date.timestamp() * 1000)
+    assert equity[-1]["balance"] == result["final_balance"]
+
+
+def test_backtest_reuse_signals(default_conf, mocker, testdatadir) -> None:
+    default_conf["max_open_trades"] = 10
+
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    timerange = TimeRange("date", None, 1517227800, 0)
+    data = history.load_data(
+        datadir=testdatadir, timeframe="5m", pairs=["UNITTEST/BTC"], timerange=timerange
+    )
+    processed = backtesting.strategy.advise_all_indicators(data)
+    min_date, max_date = get_timerange(processed)
+    columns = processed["UNITTEST/BTC"].columns.tolist()
+
+    expected = backtesting.backtest(
+        processed=dict(processed), start_date=min_date, end_date=max_date
+    )["results"]
+    # The passed dataframe is not modified
+    assert processed["UNITTEST/BTC"].columns.tolist() == columns
+
+    backtesting.reuse_signals = True
+    convert_mock = mocker.spy(backtesting, "_get_ohlcv_as_lists")
+    detail_mock = mocker.spy(backtesting, "_get_detail_as_arrays")
+    for _ in range(2):
+        result = backtesting.backtest(
+            processed=dict(processed), start_date=min_date, end_date=max_date
+        )
+        pd.testing.assert_frame_equal(result["results"], expected)
+    assert convert_mock.call_count == 1
+    assert detail_mock.call_count == 1
+
+
+def test_backtest_signal_cache(default_conf, mocker, testdatadir) -> None:
+    default_conf["max_open_trades"] = 10
+
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    strategy = backtesting.strategy
+    timerange = TimeRange("date", None, 1517227800, 0)
+    data = history.load_data(
+        datadir=testdatadir, timeframe="5m", pairs=["UNITTEST/BTC"], timerange=timerange
+    )
+    processed = strategy.advise_all_indicators(data)
+    min_date, max_date = get_timerange(processed)
+
+    def run_backtest() -> pd.DataFrame:
+        return backtesting.backtest(
+            processed=dict(processed), start_date=min_date, end_date=max_date
+        )["results"]
+
+    buy_rsi, buy_plusdi = strategy.buy_rsi.value, strategy.buy_plusdi.value
+    sell_minusdi = strategy.sell_minusdi.value
+    expected = run_backtest()
+    strategy.sell_minusdi.value = 0.1
+    expected_exit_changed = run_backtest()
+    strategy.sell_minusdi.value = sell_minusdi
+
+    backtesting.signal_cache = SignalCache()
+    entry_mock = mocker.spy(strategy, "populate_entry_trend")
+    exit_mock = mocker.spy(strategy, "populate_exit_trend")
+    for _ in range(2):
+        pd.testing.assert_frame_equal(run_backtest(), expected)
+    assert entry_mock.call_count == 1
+    assert exit_mock.call_count == 1
+
+    # sell_minusdi is only used by exit signals
+    strategy.sell_minusdi.value = 0.1
+    pd.testing.assert_frame_equal(run_backtest(), expected_exit_changed)
+    assert entry_mock.call_count == 1
+    assert exit_mock.call_count == 2
+
+    # buy_rsi is used by entry and exit signals
+    strategy.buy_rsi.value = buy_rsi - 10
+    run_backtest()
+    assert entry_mock.call_count == 2
+    assert exit_mock.call_count == 3
+
+    # buy_plusdi is only used by entry signals - exit signals are cached per entry variant
+    strategy.buy_rsi.value = buy_rsi
+    strategy.buy_plusdi.value = 0.1
+    run_backtest()
+    assert entry_mock.call_count == 3
+    assert exit_mock.call_count == 4
+
+    # All variants are still cached
+    strategy.buy_plusdi.value = buy_plusdi
+    strategy.sell_minusdi.value = sell_minusdi
+    pd.testing.assert_frame_equal(run_backtest(), expected)
+    assert entry_mock.call_count == 3
+    assert exit_mock.call_count == 4
+
+
+def test_signal_cache_changed_columns() -> None:
+    shift = IntParameter(1, 3, default=1, space="buy")
+    calls = []
+
+    def advise_entry(dataframe, metadata):
+        calls.append(shift.value)
+        dataframe["rsi"] = dataframe["rsi"].shift(shift.value)
+        dataframe["enter_long"] = (dataframe["rsi"] < 30).astype(int)
+        return dataframe
+
+    def advise_exit(dataframe, metadata):
+        dataframe["exit_long"] = (dataframe["rsi"] > 70).astype(int)
+        return dataframe
+
+    strategy = MagicMock(advise_entry=advise_entry, advise_exit=advise_exit)
+    data = pd.DataFrame({"close": [1.0, 2.0, 3.0, 4.0], "rsi": [20.0, 80.0, 25.0, 75.0]})
+    cache = SignalCache()
+
+    expected = cache.advise_signals(strategy, "ETH/BTC", data.copy())
+    assert expected["rsi"].isna().iloc[0]
+    # Changed columns are restored on cache hits - in their original position
+    pd.testing.assert_frame_equal(cache.advise_signals(strategy, "ETH/BTC", data.copy()), expected)
+    assert calls == [1]
+
+    shift.value = 2
+    result = cache.advise_signals(strategy, "ETH/BTC", data.copy())
+    assert calls == [1, 2]
+    assert result["rsi"].tolist()[2:] == [20.0, 80.0]
+
+    # Removed columns can't be restored - such signals are not cached
+    def advise_drop(dataframe, metadata):
+        calls.append(shift.value)
+        return dataframe.drop(columns=["rsi"])
+
+    strategy.advise_entry = advise_drop
+    strategy.advise_exit = lambda dataframe, metadata: dataframe.assign(exit_long=0)
+    for _ in range(2):
+        assert "rsi" not in cache.advise_signals(strategy, "XRP/BTC", data.copy())
+    assert calls == [1, 2, 2, 2]
+
+
+def test_backtest_pruner(default_conf, mocker, testdatadir) -> None:
+    default_conf["max_open_trades"] = 10
+
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    timerange = TimeRange("date", None, 1517227800, 0)
+    data = history.load_data(
+        datadir=testdatadir, timeframe="5m", pairs=["UNITTEST/BTC"], timerange=timerange
+    )
+    processed = backtesting.strategy.advise_all_indicators(data)
+    min_date, max_date = get_timerange(processed)
+
+    expected = backtesting.backtest(
+        processed=deepcopy(processed), start_date=min_date, end_date=max_date
+    )["results"]
+    assert len(expected) > 1
+
+    interim = []
+
+    def bound(**kwargs):
+        interim.append(kwargs)
+        return None
+
+    # No bound - the backtest runs to the end
+    backtesting.pruner = BacktestPruner(bound, checkpoints=4)
+    result = backtesting.backtest(
+        processed=deepcopy(processed), start_date=min_date, end_date=max_date
+    )
+    pd.testing.assert_frame_equal(result["results"], expected)
+    assert result["pruned_loss"] is None
+    # Rounding may move the last checkpoint past the end of the timerange
+    assert len(interim) in (3, 4)
+    assert [i["progress"] for i in interim] == sorted(i["progress"] for i in interim)
+    assert interim[-1]["trade_count"] <= len(expected)
+    assert interim[-1]["profit_abs"] == pytest.approx(
+        expected.loc[expected["close_date"] < interim[-1]["current_time"], "profit_abs"].sum()
+    )
+
+    # Bound better than the best loss - not stopped
+    backtesting.pruner = BacktestPruner(lambda **kwargs: 1.0, checkpoints=4)
+    backtesting.pruner.best_loss = 2.0
+    result = backtesting.backtest(
+        processed=deepcopy(processed), start_date=min_date, end_date=max_date
+    )
+    assert result["pruned_loss"] is None
+    assert len(result["results"]) == len(expected)
+
+    # Stopped at the first checkpoint
+    backtesting.pruner.best_loss = 0.5
+    result = backtesting.backtest(
+        processed=deepcopy(processed), start_date=min_date, end_date=max_date
+    )
+    assert result["pruned_loss"] == 1.0
+    assert len(result["results"]) < len(expected)
+    assert (result["results"]["close_date"] <= min_date + (max_date - min_date) / 4).all()
+
+
+@pytest.mark.parametrize("engine", ["legacy", "columnar"])
+def test_backtest_left_open_partial_timerange(default_conf, mocker, testdatadir, engine) -> None:
+    # Backtests of a part of the loaded data (hyperopt successive halving) exit trades
+    # left open at the end of the part - not at the end of the data.
+    default_conf["max_open_trades"] = 10
+    default_conf["backtest_engine"] = engine
+
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    timerange = TimeRange("date", None, 1517227800, 0)
+    data = history.load_data(
+        datadir=testdatadir, timeframe="5m", pairs=["UNITTEST/BTC"], timerange=timerange
+    )
+    processed = backtesting.strategy.advise_all_indicators(data)
+    min_date, max_date = get_timerange(processed)
+
+    full = backtesting.backtest(
+        processed=deepcopy(processed), start_date=min_date, end_date=max_date
+    )["results"]
+    trade = full.loc[full["close_date"] - full["open_date"] > timedelta(minutes=15)].iloc[0]
+    end_date = (trade["open_date"] + timedelta(minutes=10)).to_pydatetime()
+
+    result = backtesting.backtest(
+        processed=deepcopy(processed), start_date=min_date, end_date=end_date
+    )["results"]
+    assert (result["close_date"] <= end_date).all()
+    left_open = result.loc[result["open_date"] == trade["open_date"]].iloc[0]
+    assert left_open["exit_reason"] == ExitType.FORCE_EXIT.value
+    assert left_open["close_date"] == end_date
+    candles = processed["UNITTEST/BTC"].set_index("date")
+    assert left_open["close_rate"] == candles.loc[end_date, "open"]
+    assert left_open["max_rate"] <= candles.loc[trade["open_date"] : end_date, "high"].max()
+
+
+def test_backtest_fast_math(default_conf, mocker, testdatadir, caplog) -> None:
+    default_conf["max_open_trades"] = 10
+
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    data = history.load_data(
+        datadir=testdatadir, timeframe="5m", pairs=["UNITTEST/BTC", "ETH/BTC", "ADA/BTC"]
+    )
+    processed = backtesting.strategy.advise_all_indicators(data)
+    min_date, max_date = get_timerange(processed)
+
+    precise_result = backtesting.backtest(
+        processed=deepcopy(processed), start_date=min_date, end_date=max_date
+    )
+    assert not log_has_re(r"Fast math verification.*", caplog)
+
+    backtesting.fast_math = True
+    backtesting.fast_math_verify = True
+    fast_result = backtesting.backtest(
+        processed=deepcopy(processed), start_date=min_date, end_date=max_date
+    )
+    assert BacktestTrade.fast_math is True
+    assert log_has_re(r"Fast math verification of \d+ trades: maximum deviation .*", caplog)
+    assert not log_has_re(r".*Exceeds the tolerance.*", caplog)
+
+    precise_results = precise_result["results"]
+    fast_results = fast_result["results"]
+    assert len(precise_results) == len(fast_results) > 0
+    assert (precise_results["exit_reason"] == fast_results["exit_reason"]).all()
+    assert np.allclose(precise_results["profit_abs"], fast_results["profit_abs"], atol=1e-8)
+    assert np.allclose(precise_results["profit_ratio"], fast_results["profit_ratio"], atol=1e-8)
+
+    # Exceeding the tolerance
+    caplog.clear()
+    backtesting.fast_math_tolerance = 0.0
+    mocker.patch(
+        "freqtrade.persistence.backtest_trade_model.BacktestTrade.calc_close_trade_value",
+        side_effect=lambda rate, amount=None: (amount or 1.0) * rate * 1.01,
+    )
+    deviation = backtesting.verify_fast_math(LocalTrade.bt_trades)
+    assert deviation[0] > 0
+    assert log_has_re(r".*Exceeds the tolerance of 0.00e\+00.", caplog)
+    assert BacktestTrade.fast_math is True
+
+    backtesting.fast_math = False
+    backtesting.prepare_backtest(False)
+    assert BacktestTrade.fast_math is False
+
+
+def test_backtest_wallet_ledger(default_conf, mocker, testdatadir, caplog) -> None:
+    default_conf["max_open_trades"] = 10
+    default_conf["stake_amount"] = "unlimited"
+    default_conf["position_stacking"] = True
+
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    data = history.load_data(
+        datadir=testdatadir, timeframe="5m", pairs=["UNITTEST/BTC", "ETH/BTC", "ADA/BTC"]
+    )
+
+    results = {}
+    for use_ledger in (False, True):
+        default_conf["backtest_wallet_ledger"] = use_ledger
+        default_conf["backtest_wallet_ledger_check"] = use_ledger
+        backtesting = Backtesting(default_conf)
+        backtesting._set_strategy(backtesting.strategylist[0])
+        assert backtesting.wallets._use_ledger is use_ledger
+        processed = backtesting.strategy.advise_all_indicators(deepcopy(data))
+        min_date, max_date = get_timerange(processed)
+        results[use_ledger] = backtesting.backtest(
+            processed=processed, start_date=min_date, end_date=max_date
+        )
+
+    assert not log_has_re(r"Wallet ledger inconsistent.*", caplog)
+    assert len(results[True]["results"]) == len(results[False]["results"]) > 0
+    assert np.allclose(results[True]["results"]["amount"], results[False]["results"]["amount"])
+    assert results[True]["final_balance"] == pytest.approx(results[False]["final_balance"])
+
+
 @pytest.mark.parametrize("use_detail", [True, False])
 def test_backtest_one_detail(default_conf_usdt, mocker, testdatadir, use_detail) -> None:
     default_conf_usdt["use_exit_signal"] = False
@@ -1923,6 +2794,143 @@ def test_backtest_start_multi_strat(default_conf, mocker, caplog, testdatadir):
         assert log_has(line, caplog)
 
 
+def test_backtest_start_multi_strat_parallel(default_conf, mocker, caplog, testdatadir):
+    default_conf.update(
+        {
+            "use_exit_signal": True,
+            "exit_profit_only": False,
+            "exit_profit_offset": 0.0,
+            "ignore_roi_if_entry_signal": False,
+        }
+    )
+    patch_exchange(mocker)
+    backtestmock = MagicMock(
+        return_value={
+            "results": pd.DataFrame(columns=BT_DATA_COLUMNS),
+            "config": default_conf,
+            "locks": [],
+            "rejected_signals": 20,
+            "timedout_entry_orders": 0,
+            "timedout_exit_orders": 0,
+            "canceled_trade_entries": 0,
+            "canceled_entry_orders": 0,
+            "replaced_entry_orders": 0,
+            "final_balance": 1000,
+        }
+    )
+    mocker.patch(
+        "freqtrade.plugins.pairlistmanager.PairListManager.whitelist",
+        PropertyMock(return_value=["UNITTEST/BTC"]),
+    )
+    mocker.patch("freqtrade.optimize.backtesting.Backtesting.backtest", backtestmock)
+
+    class SequentialParallel:
+        """Runs the delayed calls in this process, so mocks remain in place."""
+
+        def __init__(self, n_jobs):
+            self.n_jobs = n_jobs
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            pass
+
+        def _effective_n_jobs(self):
+            return self.n_jobs
+
+        def __call__(self, tasks):
+            return [func(*args, **kwargs) for func, args, kwargs in tasks]
+
+    parallel_mock = mocker.patch(
+        "freqtrade.optimize.backtesting.Parallel", side_effect=SequentialParallel
+    )
+    show_mock = mocker.patch("freqtrade.optimize.backtesting.show_backtest_results")
+    patched_configuration_load_config_file(mocker, default_conf)
+
+    args = [
+        "backtesting",
+        "--config",
+        "config.json",
+        "--datadir",
+        str(testdatadir),
+        "--strategy-path",
+        str(Path(__file__).parents[1] / "strategy/strats"),
+        "--timeframe",
+        "1m",
+        "--timerange",
+        "1510694220-1510700340",
+        "--strategy-list",
+        CURRENT_TEST_STRATEGY,
+        "StrategyTestV2",
+        "--strategy-list-jobs",
+        "2",
+    ]
+    args = get_args(args)
+    start_backtesting(args)
+
+    assert parallel_mock.call_count == 1
+    assert parallel_mock.call_args[1]["n_jobs"] == 2
+    assert backtestmock.call_count == 2
+    assert log_has("Parameter --strategy-list-jobs detected: 2 ...", caplog)
+    assert log_has("Backtesting 2 strategies using 2 parallel workers.", caplog)
+    assert log_has(f"Running backtesting for Strategy {CURRENT_TEST_STRATEGY}", caplog)
+    assert log_has("Running backtesting for Strategy StrategyTestV2", caplog)
+
+    results = show_mock.call_args[0][1]
+    assert list(results["strategy"].keys()) == [CURRENT_TEST_STRATEGY, "StrategyTestV2"]
+    assert len(results["strategy_comparison"]) == 2
+
+
+def test_backtest_strategies_parallel_workers(default_conf, mocker, testdatadir):
+    # Real worker processes - strategies, data and results are pickled.
+    patch_exchange(mocker)
+    default_conf["exchange"]["pair_whitelist"] = ["ETH/BTC", "LTC/BTC"]
+    patched_configuration_load_config_file(mocker, default_conf)
+    args = [
+        "backtesting",
+        "--config",
+        "config.json",
+        "--datadir",
+        str(testdatadir),
+        "--strategy-path",
+        str(Path(__file__).parents[1] / "strategy/strats"),
+        "--timeframe",
+        "5m",
+        "--timerange",
+        "20180110-20180115",
+        "--strategy-list",
+        CURRENT_TEST_STRATEGY,
+        "StrategyTestV2",
+        "--export",
+        "none",
+    ]
+    config = setup_optimize_configuration(get_args(args), RunMode.BACKTEST)
+    mocker.patch(
+        "freqtrade.plugins.pairlistmanager.PairListManager.whitelist",
+        PropertyMock(return_value=["ETH/BTC", "LTC/BTC"]),
+    )
+    backtesting = Backtesting(config)
+    # Class level mocks are not applied in the workers - markets are pickled with the exchange.
+    backtesting.exchange._markets = backtesting.exchange.markets
+    data, timerange = backtesting.load_bt_data()
+
+    for strat in backtesting.strategylist:
+        expected_dates = backtesting.backtest_one_strategy(strat, data, timerange)
+    expected = backtesting.all_results
+    backtesting.all_results = {}
+
+    dates = backtesting.backtest_strategies_parallel(
+        backtesting.strategylist, data, timerange, jobs=2
+    )
+    assert dates == expected_dates
+    assert list(backtesting.all_results) == [CURRENT_TEST_STRATEGY, "StrategyTestV2"]
+    for strategy_name, results in backtesting.all_results.items():
+        assert len(results["results"]) > 0
+        pd.testing.assert_frame_equal(results["results"], expected[strategy_name]["results"])
+        assert results["final_balance"] == expected[strategy_name]["final_balance"]
+
+
 def test_backtest_start_multi_strat_nomock(default_conf, mocker, caplog, testdatadir, capsys):
     default_conf.update(
         {
@@ -2450,6 +3458,8 @@ def test_backtest_start_multi_strat_caching(
         "freqtrade.data.btanalysis",
         load_backtest_metadata=load_backtest_metadata,
         load_backtest_stats=load_backtest_stats,
+        load_backtest_index=MagicMock(return_value={}),
+        save_backtest_index=MagicMock(),
     )
     mocker.patch("freqtrade.optimize.backtesting.get_strategy_run_id", side_effect=["1", "2", "2"])
 
@@ -1,8 +1,10 @@
 # pragma pylint: disable=missing-docstring,W0212,C0103
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from functools import wraps
 from pathlib import Path
-from unittest.mock import ANY, MagicMock, PropertyMock
+from threading import Event
+from unittest.mock import ANY, MagicMock, PropertyMock, call
 
 import pandas as pd
 import pytest
@@ -13,12 +15,16 @@ from freqtrade.commands.optimize_commands import setup_optimize_configuration, s
 from freqtrade.data.history import load_data
 from freqtrade.enums import ExitType, RunMode
 from freqtrade.exceptions import OperationalException
+from freqtrade.optimize.bt_pruner import BacktestPruner
 from freqtrade.optimize.hyperopt import Hyperopt
 from freqtrade.optimize.hyperopt_auto import HyperOptAuto
+from freqtrade.optimize.hyperopt_loss_interface import IHyperOptLoss
+from freqtrade.optimize.hyperopt_pool import HyperoptPool
 from freqtrade.optimize.hyperopt_tools import HyperoptTools
 from freqtrade.optimize.optimize_reports import generate_strategy_stats
 from freqtrade.optimize.space import SKDecimal
 from freqtrade.strategy import IntParameter
+from freqtrade.strategy.indicator_cache import IndicatorCache
 from freqtrade.util import dt_utc
 from tests.conftest import (
     CURRENT_TEST_STRATEGY,
@@ -355,16 +361,14 @@ def test_start_calls_optimizer(mocker, hyperopt_conf, capsys) -> None:
     mocker.patch("freqtrade.optimize.hyperopt.INITIAL_POINTS", 2)
 
     parallel = mocker.patch(
-        "freqtrade.optimize.hyperopt.Hyperopt.run_optimizer_parallel",
+        "freqtrade.optimize.hyperopt.Hyperopt.generate_optimizer",
         MagicMock(
-            return_value=[
-                {
-                    "loss": 1,
-                    "results_explanation": "foo result",
-                    "params": {"buy": {}, "sell": {}, "roi": {}, "stoploss": 0.0},
-                    "results_metrics": generate_result_metrics(),
-                }
-            ]
+            return_value={
+                "loss": 1,
+                "results_explanation": "foo result",
+                "params": {"buy": {}, "sell": {}, "roi": {}, "stoploss": 0.0},
+                "results_metrics": generate_result_metrics(),
+            }
         ),
     )
     patch_exchange(mocker)
@@ -534,7 +538,7 @@ def test_generate_optimizer(mocker, hyperopt_conf) -> None:
     patch_exchange(mocker)
     mocker.patch.object(Path, "open")
     mocker.patch("freqtrade.configuration.config_validation.validate_config_schema")
-    mocker.patch("freqtrade.optimize.hyperopt.load", return_value={"XRP/BTC": None})
+    load_mock = mocker.patch("freqtrade.optimize.hyperopt.load", return_value={"XRP/BTC": None})
 
     optimizer_param = {
         "buy_plusdi": 0.02,
@@ -591,6 +595,7 @@ def test_generate_optimizer(mocker, hyperopt_conf) -> None:
         "params_not_optimized": {"buy": {}, "protection": {}, "sell": {}},
         "results_metrics": ANY,
         "total_profit": 3.1e-08,
+        "is_pruned": False,
     }
 
     hyperopt = Hyperopt(hyperopt_conf)
@@ -600,6 +605,236 @@ def test_generate_optimizer(mocker, hyperopt_conf) -> None:
     generate_optimizer_value = hyperopt.generate_optimizer(list(optimizer_param.values()))
     assert generate_optimizer_value == response_expected
 
+    # Data is loaded once - and not modified by the epochs
+    assert hyperopt.generate_optimizer(list(optimizer_param.values())) == response_expected
+    assert load_mock.call_count == 1
+    assert hyperopt.load_hyperopt_data() == {"XRP/BTC": None}
+
+    # Stopped early - the bound is used as loss
+    mocker.patch(
+        "freqtrade.optimize.hyperopt.Backtesting.backtest",
+        return_value={**backtest_result, "pruned_loss": 5.0},
+    )
+    hyperopt.current_best_loss = 2.0
+    result = hyperopt.generate_optimizer(list(optimizer_param.values()))
+    assert result["loss"] == 5.0
+    assert result["is_pruned"] is True
+
+    # Part of the timerange
+    backtest_mock = mocker.patch(
+        "freqtrade.optimize.hyperopt.Backtesting.backtest", return_value=backtest_result
+    )
+    hyperopt.generate_optimizer(list(optimizer_param.values()), 1 / 3)
+    assert backtest_mock.call_args.kwargs["start_date"] == dt_utc(2017, 12, 10)
+    assert backtest_mock.call_args.kwargs["end_date"] == dt_utc(2017, 12, 11)
+
+
+def test_hyperopt_pruner(mocker, hyperopt_conf) -> None:
+    patch_exchange(mocker)
+    hyperopt = Hyperopt(hyperopt_conf)
+    assert hyperopt.backtesting.pruner is None
+
+    class BoundLoss(IHyperOptLoss):
+        @staticmethod
+        def hyperopt_loss_function(results, *args, **kwargs):
+            return -results["profit_abs"].sum()
+
+        @staticmethod
+        def hyperopt_loss_bound(*, max_drawdown_relative, **kwargs):
+            return 10.0 if max_drawdown_relative > 0.2 else None
+
+    mocker.patch(
+        "freqtrade.optimize.hyperopt.HyperOptLossResolver.load_hyperoptloss",
+        return_value=BoundLoss(),
+    )
+    hyperopt = Hyperopt(hyperopt_conf)
+    assert isinstance(hyperopt.backtesting.pruner, BacktestPruner)
+
+
+@pytest.mark.parametrize(
+    "spaces,reuse",
+    [
+        (["default"], False),
+        (["roi", "stoploss"], True),
+        (["roi", "protection"], False),
+        (["trailing", "trades"], True),
+    ],
+)
+def test_hyperopt_reuse_signals(mocker, hyperopt_conf, spaces, reuse) -> None:
+    patch_exchange(mocker)
+    hyperopt_conf.update({"spaces": spaces})
+    hyperopt = Hyperopt(hyperopt_conf)
+    assert hyperopt.backtesting.reuse_signals is reuse
+    # Signals which are not reused completely are cached per parameter values
+    assert (hyperopt.backtesting.signal_cache is None) is reuse
+    assert hyperopt.backtesting.strategy.ft_indicator_cache is None
+
+    hyperopt_conf.update({"analyze_per_epoch": True})
+    hyperopt = Hyperopt(hyperopt_conf)
+    assert hyperopt.backtesting.reuse_signals is False
+    assert hyperopt.backtesting.signal_cache is None
+    assert isinstance(hyperopt.backtesting.strategy.ft_indicator_cache, IndicatorCache)
+
+
+def test_hyperopt_pool(mocker, hyperopt_conf) -> None:
+    patch_exchange(mocker)
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopt.opt = MagicMock()
+    hyperopt._processed = {"XRP/BTC": None}
+    generate_mock = mocker.patch(
+        "freqtrade.optimize.hyperopt.Hyperopt.generate_optimizer",
+        side_effect=lambda x, fidelity: {"loss": x[0]},
+    )
+
+    # Single job - epochs run in this process
+    with HyperoptPool(hyperopt, 1) as pool:
+        future = pool.submit([1], 100)
+        assert future.done()
+        assert future.result() == {"loss": 1}
+    assert generate_mock.call_count == 1
+
+    # Workers don't receive loaded data or the optimizer
+    state = hyperopt.__getstate__()
+    assert state["_processed"] is None
+    assert "opt" not in state
+    assert hyperopt._processed == {"XRP/BTC": None}
+
+
+def test_run_optimizer_parallel(mocker, hyperopt_conf) -> None:
+    patch_exchange(mocker)
+    hyperopt_conf.update({"epochs": 5})
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopt.opt = MagicMock()
+    points = iter(range(1, 100))
+    pending_points = []
+
+    def get_asked_points(n_points, pending):
+        pending_points.append(sorted(pending))
+        return [[next(points)] for _ in range(n_points)], [False] * n_points
+
+    mocker.patch.object(hyperopt, "get_asked_points", side_effect=get_asked_points)
+    evaluated = []
+    mocker.patch.object(
+        hyperopt,
+        "evaluate_result",
+        side_effect=lambda val, current, is_random: evaluated.append((current, val["loss"])),
+    )
+    release = Event()
+
+    def generate_optimizer(raw_params):
+        if raw_params == [1]:
+            # The first epoch only finishes once the third one started
+            release.wait(10)
+        elif raw_params == [3]:
+            release.set()
+        return {"loss": raw_params[0]}
+
+    advance = MagicMock()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pool = MagicMock(jobs=2)
+        pool.submit = lambda x, best_loss: executor.submit(generate_optimizer, x)
+        hyperopt.run_optimizer_parallel(pool, 1, advance)
+
+    # The free worker got a new point while the first epoch was still running
+    assert pending_points[:2] == [[], [[1]]]
+    told = [x for c in hyperopt.opt.tell.call_args_list for x in c[0][0]]
+    assert sorted(told) == [[1], [2], [3], [4], [5]]
+    assert told.index([2]) < told.index([1])
+    # Evaluated in the order the points were asked
+    assert evaluated == [(1, 1), (2, 2), (3, 3), (4, 4), (5, 5)]
+    assert advance.call_count == 5
+
+
+def test_run_optimizer_halving(mocker, hyperopt_conf) -> None:
+    patch_exchange(mocker)
+    hyperopt_conf.update({"epochs": 2, "hyperopt_successive_halving": True})
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopt.opt = MagicMock()
+    points = iter(range(1, 100))
+    pending_points = []
+
+    def get_asked_points(n_points, pending):
+        pending_points.append(sorted(pending))
+        return [[next(points)] for _ in range(n_points)], [False] * n_points
+
+    mocker.patch.object(hyperopt, "get_asked_points", side_effect=get_asked_points)
+    evaluated = []
+    mocker.patch.object(
+        hyperopt,
+        "evaluate_result",
+        side_effect=lambda val, current, is_random: evaluated.append((current, val)),
+    )
+    submitted = []
+
+    def submit(x, best_loss, fidelity):
+        submitted.append((x, fidelity))
+        future = Future()
+        # Higher points are better
+        future.set_result({"loss": -x[0], "fidelity": fidelity})
+        return future
+
+    pool = MagicMock(jobs=1, submit=submit)
+    advance = MagicMock()
+    hyperopt.run_optimizer_halving(pool, 1, advance)
+
+    # 9 candidates on 1/9, 3 on 1/3 and 1 on the full timerange - per epoch
+    assert len(submitted) == 26
+    assert [x for x, fidelity in submitted[:13] if fidelity == 1 / 3] == [[7], [8], [9]]
+    assert [x for x, fidelity in submitted[:13] if fidelity == 1] == [[9]]
+    assert evaluated == [
+        (1, {"loss": -9, "fidelity": 1}),
+        (2, {"loss": -18, "fidelity": 1}),
+    ]
+    assert advance.call_count == 2
+    # Only results of the full timerange are told
+    assert hyperopt.opt.tell.call_args_list == [call([[9]], [-9]), call([[18]], [-18])]
+    # Discarded candidates are not asked for again
+    assert pending_points == [[], [(i,) for i in range(1, 9)]]
+
+
+def test_run_optimizer_halving_config(mocker, hyperopt_conf) -> None:
+    patch_exchange(mocker)
+    hyperopt_conf.update(
+        {
+            "epochs": 2,
+            "hyperopt_successive_halving": True,
+            "hyperopt_halving_rungs": 2,
+            "hyperopt_halving_eta": 4,
+        }
+    )
+    mocker.patch("freqtrade.optimize.hyperopt.HALVING_DISCARDED_SIZE", 2)
+    hyperopt = Hyperopt(hyperopt_conf)
+    hyperopt.opt = MagicMock()
+    points = iter(range(1, 100))
+    pending_points = []
+
+    def get_asked_points(n_points, pending):
+        pending_points.append(sorted(pending))
+        return [[next(points)] for _ in range(n_points)], [False] * n_points
+
+    mocker.patch.object(hyperopt, "get_asked_points", side_effect=get_asked_points)
+    mocker.patch.object(hyperopt, "evaluate_result")
+    submitted = []
+
+    def submit(x, best_loss, fidelity):
+        submitted.append((x, fidelity))
+        future = Future()
+        future.set_result({"loss": -x[0], "fidelity": fidelity})
+        return future
+
+    hyperopt.run_optimizer_halving(MagicMock(jobs=1, submit=submit), 1, MagicMock())
+
+    # 4 candidates on 1/4 and 1 on the full timerange - per epoch
+    assert submitted[:5] == [([1], 0.25), ([2], 0.25), ([3], 0.25), ([4], 0.25), ([4], 1)]
+    assert len(submitted) == 10
+    # Only the most recently discarded candidates are remembered
+    assert pending_points == [[], [(1,), (2,)]]
+    assert hyperopt.opt.tell.call_args_list == [call([[4]], [-4]), call([[8]], [-8])]
+
+    hyperopt_conf["hyperopt_halving_eta"] = 1
+    with pytest.raises(OperationalException, match=r"eta of at least 2"):
+        Hyperopt(hyperopt_conf)
+
 
 def test_clean_hyperopt(mocker, hyperopt_conf, caplog):
     patch_exchange(mocker)
@@ -632,24 +867,22 @@ def test_print_json_spaces_all(mocker, hyperopt_conf, capsys) -> None:
     )
 
     parallel = mocker.patch(
-        "freqtrade.optimize.hyperopt.Hyperopt.run_optimizer_parallel",
+        "freqtrade.optimize.hyperopt.Hyperopt.generate_optimizer",
         MagicMock(
-            return_value=[
-                {
-                    "loss": 1,
-                    "results_explanation": "foo result",
-                    "params": {},
-                    "params_details": {
-                        "buy": {"mfi-value": None},
-                        "sell": {"sell-mfi-value": None},
-                        "roi": {},
-                        "stoploss": {"stoploss": None},
-                        "trailing": {"trailing_stop": None},
-                        "max_open_trades": {"max_open_trades": None},
-                    },
-                    "results_metrics": generate_result_metrics(),
-                }
-            ]
+            return_value={
+                "loss": 1,
+                "results_explanation": "foo result",
+                "params": {},
+                "params_details": {
+                    "buy": {"mfi-value": None},
+                    "sell": {"sell-mfi-value": None},
+                    "roi": {},
+                    "stoploss": {"stoploss": None},
+                    "trailing": {"trailing_stop": None},
+                    "max_open_trades": {"max_open_trades": None},
+                },
+                "results_metrics": generate_result_metrics(),
+            }
         ),
     )
     patch_exchange(mocker)
@@ -696,22 +929,20 @@ def test_print_json_spaces_default(mocker, hyperopt_conf, capsys) -> None:
     )
 
     parallel = mocker.patch(
-        "freqtrade.optimize.hyperopt.Hyperopt.run_optimizer_parallel",
+        "freqtrade.optimize.hyperopt.Hyperopt.generate_optimizer",
         MagicMock(
-            return_value=[
-                {
-                    "loss": 1,
-                    "results_explanation": "foo result",
-                    "params": {},
-                    "params_details": {
-                        "buy": {"mfi-value": None},
-                        "sell": {"sell-mfi-value": None},
-                        "roi": {},
-                        "stoploss": {"stoploss": None},
-                    },
-                    "results_metrics": generate_result_metrics(),
-                }
-            ]
+            return_value={
+                "loss": 1,
+                "results_explanation": "foo result",
+                "params": {},
+                "params_details": {
+                    "buy": {"mfi-value": None},
+                    "sell": {"sell-mfi-value": None},
+                    "roi": {},
+                    "stoploss": {"stoploss": None},
+                },
+                "results_metrics": generate_result_metrics(),
+            }
         ),
     )
     patch_exchange(mocker)
@@ -751,17 +982,15 @@ def test_print_json_spaces_roi_stoploss(mocker, hyperopt_conf, capsys) -> None:
     )
 
     parallel = mocker.patch(
-        "freqtrade.optimize.hyperopt.Hyperopt.run_optimizer_parallel",
+        "freqtrade.optimize.hyperopt.Hyperopt.generate_optimizer",
         MagicMock(
-            return_value=[
-                {
-                    "loss": 1,
-                    "results_explanation": "foo result",
-                    "params": {},
-                    "params_details": {"roi": {}, "stoploss": {"stoploss": None}},
-                    "results_metrics": generate_result_metrics(),
-                }
-            ]
+            return_value={
+                "loss": 1,
+                "results_explanation": "foo result",
+                "params": {},
+                "params_details": {"roi": {}, "stoploss": {"stoploss": None}},
+                "results_metrics": generate_result_metrics(),
+            }
         ),
     )
     patch_exchange(mocker)
@@ -804,16 +1033,14 @@ def test_simplified_interface_roi_stoploss(mocker, hyperopt_conf, capsys) -> Non
     )
 
     parallel = mocker.patch(
-        "freqtrade.optimize.hyperopt.Hyperopt.run_optimizer_parallel",
+        "freqtrade.optimize.hyperopt.Hyperopt.generate_optimizer",
         MagicMock(
-            return_value=[
-                {
-                    "loss": 1,
-                    "results_explanation": "foo result",
-                    "params": {"stoploss": 0.0},
-                    "results_metrics": generate_result_metrics(),
-                }
-            ]
+            return_value={
+                "loss": 1,
+                "results_explanation": "foo result",
+                "params": {"stoploss": 0.0},
+                "results_metrics": generate_result_metrics(),
+            }
         ),
     )
     patch_exchange(mocker)
@@ -892,16 +1119,14 @@ def test_simplified_interface_buy(mocker, hyperopt_conf, capsys) -> None:
     )
 
     parallel = mocker.patch(
-        "freqtrade.optimize.hyperopt.Hyperopt.run_optimizer_parallel",
+        "freqtrade.optimize.hyperopt.Hyperopt.generate_optimizer",
         MagicMock(
-            return_value=[
-                {
-                    "loss": 1,
-                    "results_explanation": "foo result",
-                    "params": {},
-                    "results_metrics": generate_result_metrics(),
-                }
-            ]
+            return_value={
+                "loss": 1,
+                "results_explanation": "foo result",
+                "params": {},
+                "results_metrics": generate_result_metrics(),
+            }
         ),
     )
     patch_exchange(mocker)
@@ -942,16 +1167,14 @@ def test_simplified_interface_sell(mocker, hyperopt_conf, capsys) -> None:
     )
 
     parallel = mocker.patch(
-        "freqtrade.optimize.hyperopt.Hyperopt.run_optimizer_parallel",
+        "freqtrade.optimize.hyperopt.Hyperopt.generate_optimizer",
         MagicMock(
-            return_value=[
-                {
-                    "loss": 1,
-                    "results_explanation": "foo result",
-                    "params": {},
-                    "results_metrics": generate_result_metrics(),
-                }
-            ]
+            return_value={
+                "loss": 1,
+                "results_explanation": "foo result",
+                "params": {},
+                "results_metrics": generate_result_metrics(),
+            }
         ),
     )
     patch_exchange(mocker)
@@ -1055,6 +1278,13 @@ def test_in_strategy_auto_hyperopt(mocker, hyperopt_conf, tmp_path, fee) -> None
     assert hyperopt.backtesting.strategy.sell_rsi.value != 74
     assert hyperopt.backtesting.strategy.max_open_trades != 1
 
+    # Metrics not required by the loss function are only calculated for the best epoch
+    assert hyperopt.custom_hyperoptloss.required_metrics == []
+    best_metrics = hyperopt.current_best_epoch["results_metrics"]
+    assert "lazy_metrics" not in best_metrics
+    assert "results_per_pair" in best_metrics
+    assert "sharpe" in best_metrics
+
     hyperopt.custom_hyperopt.generate_estimator = lambda *args, **kwargs: "ET1"
     with pytest.raises(OperationalException, match="Estimator ET1 not supported."):
         hyperopt.get_optimizer([], 2)
@@ -18,12 +18,15 @@ from freqtrade.data.btanalysis import (
 from freqtrade.edge import PairInfo
 from freqtrade.enums import ExitType
 from freqtrade.optimize.optimize_reports import (
+    LAZY_METRICS,
+    complete_strategy_stats,
     generate_backtest_stats,
     generate_daily_stats,
     generate_edge_table,
     generate_pair_metrics,
     generate_periodic_breakdown_stats,
     generate_strategy_comparison,
+    generate_strategy_stats,
     generate_trading_stats,
     show_sorted_pairlist,
     store_backtest_analysis_results,
@@ -246,13 +249,87 @@ def test_generate_backtest_stats(default_conf, testdatadir, tmp_path):
     filename1.unlink()
 
 
+def test_generate_strategy_stats_lazy(default_conf, testdatadir):
+    default_conf.update({"strategy": CURRENT_TEST_STRATEGY})
+    StrategyResolver.load_strategy(default_conf)
+    results = load_backtest_data(testdatadir / "backtest_results/backtest-result.json")
+    content = {
+        "results": results,
+        "config": default_conf,
+        "locks": [],
+        "final_balance": 1000.02,
+        "rejected_signals": 20,
+        "timedout_entry_orders": 0,
+        "timedout_exit_orders": 0,
+        "canceled_trade_entries": 0,
+        "canceled_entry_orders": 0,
+        "replaced_entry_orders": 0,
+        "backtest_start_time": dt_ts() // 1000,
+        "backtest_end_time": dt_ts() // 1000,
+    }
+    min_date = results["open_date"].min().to_pydatetime().replace(second=0, microsecond=0)
+    max_date = results["close_date"].max().to_pydatetime().replace(second=0, microsecond=0)
+    pairlist = list(results["pair"].unique())
+    full = generate_strategy_stats(
+        pairlist, "DefStrat", content, min_date, max_date, market_change=0.1, is_hyperopt=True
+    )
+    assert "lazy_metrics" not in full
+    assert all(key in full for key in LAZY_METRICS["results_per_pair"])
+
+    stats = generate_strategy_stats(
+        pairlist,
+        "DefStrat",
+        content,
+        min_date,
+        max_date,
+        market_change=0.1,
+        is_hyperopt=True,
+        metrics=["sharpe"],
+    )
+    assert stats["lazy_metrics"] == [
+        "results_per_pair",
+        "tag_metrics",
+        "daily_stats",
+        "sortino",
+        "calmar",
+    ]
+    assert stats["sharpe"] == full["sharpe"]
+    for key in ("results_per_pair", "exit_reason_summary", "winning_days", "sortino", "calmar"):
+        assert key not in stats
+    # Basic metrics are always available
+    for key in ("total_trades", "profit_total", "max_drawdown_account", "wins", "holding_avg"):
+        assert stats[key] == full[key]
+
+    # Trades are serialized when storing hyperopt results
+    stats["trades"] = [
+        {**t, "open_date": str(t["open_date"]), "close_date": str(t["close_date"])}
+        for t in stats["trades"]
+    ]
+    completed = complete_strategy_stats(stats)
+    assert completed is stats
+    assert "lazy_metrics" not in stats
+    for group in LAZY_METRICS.values():
+        for key in group:
+            if key in full:
+                assert stats[key] == full[key], key
+
+    # Complete stats are not recalculated
+    stats["results_per_pair"] = []
+    complete_strategy_stats(stats)
+    assert stats["results_per_pair"] == []
+
+
 def test_store_backtest_stats(testdatadir, mocker):
     dump_mock = mocker.patch("freqtrade.optimize.optimize_reports.bt_storage.file_dump_json")
+    index_mock = mocker.patch(
+        "freqtrade.optimize.optimize_reports.bt_storage.update_backtest_index"
+    )
 
     data = {"metadata": {}, "strategy": {}, "strategy_comparison": []}
     store_backtest_stats(testdatadir, data, "2022_01_01_15_05_13")
 
     assert dump_mock.call_count == 3
+    assert index_mock.call_count == 1
     assert isinstance(dump_mock.call_args_list[0][0][0], Path)
     assert str(dump_mock.call_args_list[0][0][0]).startswith(str(testdatadir / "backtest-result"))
 
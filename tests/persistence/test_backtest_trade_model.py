@@ -0,0 +1,147 @@
+import pickle
+
+import pytest
+
+from freqtrade.persistence import BacktestOrder, BacktestTrade, LocalTrade
+from freqtrade.util import dt_utc
+
+
+def _bt_order(order_id: int, side: str, amount: float, price: float) -> BacktestOrder:
+    return BacktestOrder(
+        id=order_id,
+        ft_trade_id=1,
+        ft_is_open=True,
+        ft_pair="ETH/USDT",
+        order_id=str(order_id),
+        symbol="ETH/USDT",
+        ft_order_side=side,
+        side=side,
+        order_type="limit",
+        status="open",
+        order_date=dt_utc(2024, 1, 1, order_id),
+        ft_price=price,
+        price=price,
+        average=price,
+        amount=amount,
+        filled=0,
+        remaining=amount,
+        cost=amount * price,
+        ft_order_tag="",
+    )
+
+
+@pytest.mark.parametrize("is_short", [False, True])
+def test_backtest_trade_order_index(fee, is_short):
+    entry_side = "sell" if is_short else "buy"
+    exit_side = "buy" if is_short else "sell"
+    trade = BacktestTrade(
+        id=1,
+        pair="ETH/USDT",
+        stake_amount=20.0,
+        amount=0,
+        open_rate=2.0,
+        open_date=dt_utc(2024, 1, 1),
+        fee_open=fee.return_value,
+        fee_close=fee.return_value,
+        is_short=is_short,
+        exchange="binance",
+    )
+    assert isinstance(trade, LocalTrade)
+    assert trade.has_open_orders is False
+    assert trade.select_order(entry_side, is_open=True) is None
+
+    order1 = _bt_order(1, entry_side, 10, 2.0)
+    trade.add_bt_order(order1)
+    assert order1.trade is trade
+    assert trade.has_open_orders is True
+    assert trade.open_orders == [order1]
+    assert trade.open_orders_ids == ["1"]
+    assert trade.select_order(entry_side, is_open=True) is order1
+    assert trade.select_order(exit_side, is_open=True) is None
+    assert trade.nr_of_successful_entries == 0
+
+    order1.close_bt_order(dt_utc(2024, 1, 1, 1), trade)
+    assert order1.ft_is_open is False
+    assert order1.status == "closed"
+    assert trade.has_open_orders is False
+    assert trade.select_order(entry_side, is_open=True) is None
+    assert trade.select_order(entry_side, is_open=False) is order1
+    assert trade.nr_of_successful_entries == 1
+    assert trade.amount == 10
+    assert order1.stake_amount == 20.0
+
+    # Replaced order
+    order2 = _bt_order(2, entry_side, 10, 1.8)
+    trade.add_bt_order(order2)
+    assert trade.has_open_orders is True
+    trade.remove_bt_order(order2)
+    assert trade.has_open_orders is False
+    assert trade.orders == [order1]
+
+    order3 = _bt_order(3, exit_side, 5, 2.2)
+    trade.add_bt_order(order3)
+    assert trade.select_order(exit_side, is_open=True) is order3
+    assert trade.select_order(is_open=True) is order3
+    order3.close_bt_order(dt_utc(2024, 1, 1, 3), trade)
+    assert trade.nr_of_successful_entries == 1
+    assert trade.nr_of_successful_exits == 1
+    assert trade.select_filled_orders() == [order1, order3]
+    # Partial exits are applied to the trade by Backtesting._process_exit_order()
+    assert trade.amount == 10
+
+    # Indexes must match the implementation scanning all orders.
+    for side in (None, entry_side, exit_side):
+        assert trade.select_filled_orders(side) == LocalTrade.select_filled_orders(trade, side)
+        for is_open in (None, True, False):
+            assert trade.select_order(side, is_open) is LocalTrade.select_order(
+                trade, side, is_open
+            )
+
+    orders_json = trade.to_json()["orders"]
+    assert len(orders_json) == 2
+    assert orders_json[1]["ft_order_side"] == exit_side
+    assert orders_json[1]["order_filled_timestamp"] == dt_utc(2024, 1, 1, 3).timestamp() * 1000
+
+    # Trades are pickled for checkpoints and parallel backtests
+    trade2 = pickle.loads(pickle.dumps(trade))  # noqa: S301
+    assert trade2.nr_of_successful_exits == 1
+    assert trade2.orders[0].trade is trade2
+    assert trade2.amount == 10
+
+
+@pytest.mark.parametrize("is_short", [False, True])
+@pytest.mark.parametrize("trading_mode", ["spot", "futures"])
+def test_backtest_trade_fast_math(fee, is_short, trading_mode):
+    trade = BacktestTrade(
+        id=1,
+        pair="ETH/USDT",
+        stake_amount=60.0,
+        amount=30.0,
+        open_rate=2.0,
+        open_date=dt_utc(2024, 1, 1),
+        fee_open=fee.return_value,
+        fee_close=fee.return_value,
+        is_short=is_short,
+        exchange="binance",
+        trading_mode=trading_mode,
+        leverage=1.0 if trading_mode == "spot" else 3.0,
+        funding_fees=0.0 if trading_mode == "spot" else -0.0123,
+    )
+    rates = [0.1, 1.9, 2.0, 2.000001, 2.3456789, 123.456]
+    precise = [
+        (trade.calc_close_trade_value(rate), trade.calc_profit_ratio(rate, 10.0, 2.1))
+        for rate in rates
+    ]
+    precise_open_value = trade._calc_open_trade_value(30.0, 2.0)
+    try:
+        BacktestTrade.fast_math = True
+        assert pytest.approx(trade._calc_open_trade_value(30.0, 2.0), abs=1e-12) == (
+            precise_open_value
+        )
+        for rate, (close_value, profit_ratio) in zip(rates, precise):
+            assert pytest.approx(trade.calc_close_trade_value(rate), abs=1e-10) == close_value
+            assert pytest.approx(trade.calc_profit_ratio(rate, 10.0, 2.1), abs=1e-8) == (
+                profit_ratio
+            )
+    finally:
+        BacktestTrade.fast_math = False
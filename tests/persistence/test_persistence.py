@@ -1888,6 +1888,66 @@ def test_get_trades_proxy(fee, use_db, is_short):
     Trade.use_db = True
 
 
+def test_get_trades_proxy_index(fee):
+    LocalTrade.reset_trades()
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    # Close dates are not in order - as trades of different pairs are processed sequentially
+    # when using timeframe-detail.
+    close_offsets = [10, 12, 5, 30, 12, 7, 40, 1, None, None, None]
+    for idx, offset in enumerate(close_offsets):
+        LocalTrade.add_bt_trade(
+            LocalTrade(
+                id=idx + 1,
+                pair="ETH/USDT" if idx % 2 else "XRP/USDT",
+                stake_amount=10,
+                amount=5,
+                open_rate=2,
+                open_date=start + timedelta(minutes=(idx * 7) % 11),
+                close_date=start + timedelta(minutes=offset) if offset is not None else None,
+                is_open=offset is None,
+                fee_open=fee.return_value,
+                fee_close=fee.return_value,
+                exchange="binance",
+            )
+        )
+
+    def linear(pair, is_open, open_date, close_date):
+        if is_open is None:
+            trades = LocalTrade.bt_trades + LocalTrade.bt_trades_open
+        else:
+            trades = LocalTrade.bt_trades_open if is_open else LocalTrade.bt_trades
+        return [
+            t
+            for t in trades
+            if (pair is None or t.pair == pair)
+            and (open_date is None or t.open_date > open_date)
+            and (close_date is None or (t.close_date and t.close_date > close_date))
+        ]
+
+    dates = [None] + [start + timedelta(minutes=m) for m in (0, 3, 5, 11, 12, 35, 50)]
+    for pair in (None, "ETH/USDT", "XRP/USDT", "ADA/USDT"):
+        for is_open in (None, True, False):
+            for open_date in dates:
+                for close_date in dates:
+                    res = LocalTrade.get_trades_proxy(
+                        pair=pair, is_open=is_open, open_date=open_date, close_date=close_date
+                    )
+                    # Identical trades, in identical order
+                    assert res == linear(pair, is_open, open_date, close_date)
+
+    # Trades closed later are added to the index
+    trade = LocalTrade.bt_trades[0]
+    LocalTrade.bt_trades.append(trade)
+    assert len(LocalTrade.get_trades_proxy(is_open=False, close_date=start)) == 9
+    assert len(LocalTrade.get_trades_proxy(pair=trade.pair, is_open=False)) == 5
+
+    # Replacing the trades list (resuming a backtest) rebuilds the index
+    LocalTrade.bt_trades = [trade]
+    assert LocalTrade.get_trades_proxy(is_open=False, close_date=start) == [trade]
+    LocalTrade.reset_trades()
+    assert LocalTrade.get_trades_proxy(is_open=False, close_date=start) == []
+
+
 @pytest.mark.usefixtures("init_persistence")
 @pytest.mark.parametrize("is_short", [True, False])
 def test_get_trades__query(fee, is_short):
@@ -2145,6 +2205,9 @@ def test_Trade_object_idem():
         "bt_trades_open_pp",
         "bt_open_open_trade_count",
         "bt_total_profit",
+        "bt_changed_trades",
+        "bt_trades_closed_index",
+        "bt_trades_open_date_index",
         "from_json",
     )
 
@@ -155,3 +155,48 @@ def test_PairLocks_reason(use_db):
 
     PairLocks.reset_locks()
     PairLocks.use_db = True
+
+
+@pytest.mark.usefixtures("init_persistence")
+def test_PairLocks_backtest_index():
+    PairLocks.timeframe = "5m"
+    PairLocks.use_db = False
+    PairLocks.reset_locks()
+    start = datetime(2020, 5, 1, 14, 0, 0, tzinfo=timezone.utc)
+
+    PairLocks.lock_pair("ETH/BTC", start + timedelta(minutes=30), now=start)
+    PairLocks.lock_pair("ETH/BTC", start + timedelta(minutes=10), now=start, side="long")
+    PairLocks.lock_pair("XRP/BTC", start + timedelta(minutes=60), now=start)
+    PairLocks.lock_pair("*", start + timedelta(minutes=20), now=start, side="short")
+
+    PairLocks.expire_locks(start)
+    assert len(PairLocks.get_pair_locks("ETH/BTC", start, side="long")) == 2
+    assert PairLocks.is_pair_locked("LTC/BTC", start, side="short")
+    assert not PairLocks.is_pair_locked("LTC/BTC", start, side="long")
+
+    # Lock end times are rounded up to the next candle
+    now = start + timedelta(minutes=30)
+    PairLocks.expire_locks(now)
+    locks = PairLocks.get_pair_locks("ETH/BTC", now, side="long")
+    assert len(locks) == 1
+    assert locks[0].lock_end_time == start + timedelta(minutes=35)
+    assert not PairLocks.is_pair_locked("LTC/BTC", now, side="short")
+    # Expired locks are purged from the index
+    assert len(PairLocks._lock_index["ETH/BTC"][1]) == 1
+    assert len(PairLocks.get_pair_locks(None, now)) == 2
+
+    # Lookups in the past are still possible
+    assert PairLocks.is_pair_locked("LTC/BTC", start, side="short")
+    assert len(PairLocks.get_pair_locks("ETH/BTC", start, side="long")) == 2
+
+    # Expired locks remain part of the backtest result
+    assert len(PairLocks.get_all_locks()) == 4
+
+    # Replacing the lock list (resuming a backtest) rebuilds the index
+    PairLocks.locks = PairLocks.locks[:1]
+    assert len(PairLocks.get_pair_locks(None, start)) == 1
+    assert not PairLocks.is_pair_locked("XRP/BTC", start)
+
+    PairLocks.reset_locks()
+    assert not PairLocks.is_pair_locked("ETH/BTC", start)
+    PairLocks.use_db = True
@@ -7,6 +7,7 @@ import logging
 import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from threading import Thread
 from unittest.mock import ANY, MagicMock, PropertyMock
 
 import pandas as pd
@@ -2489,6 +2490,17 @@ def test_api_backtesting(botclient, mocker, fee, caplog, tmp_path):
         assert result["status_msg"] == "Backtest ended"
         assert result["progress"] == 1
         assert result["backtest_result"]
+        strategy_result = result["backtest_result"]["strategy"][CURRENT_TEST_STRATEGY]
+        assert "trades" in strategy_result
+
+        rc = client_get(client, f"{BASE_URI}/backtest?include_trades=false")
+        assert_response(rc)
+        result_no_trades = rc.json()["backtest_result"]
+        assert "trades" not in result_no_trades["strategy"][CURRENT_TEST_STRATEGY]
+        assert (
+            result_no_trades["strategy"][CURRENT_TEST_STRATEGY]["total_trades"]
+            == strategy_result["total_trades"]
+        )
 
         rc = client_get(client, f"{BASE_URI}/backtest/abort")
         assert_response(rc)
@@ -2576,6 +2588,7 @@ def test_api_backtest_history(botclient, mocker, testdatadir):
             testdatadir / "backtest_results/backtest-result.json",
         ],
     )
+    index_mock = mocker.patch("freqtrade.data.btanalysis.save_backtest_index")
 
     rc = client_get(client, f"{BASE_URI}/backtest/history")
     assert_response(rc, 503)
@@ -2588,6 +2601,9 @@ def test_api_backtest_history(botclient, mocker, testdatadir):
     assert_response(rc)
     result = rc.json()
     assert len(result) == 3
+    # Index is created from the metadata files
+    assert index_mock.call_count == 1
+    assert list(index_mock.call_args[0][1]) == ["backtest-result_multistrat", "backtest-result"]
     fn = result[0]["filename"]
     assert fn == "backtest-result_multistrat"
     assert result[0]["notes"] == ""
@@ -2826,6 +2842,20 @@ def test_api_ws_requests(botclient, caplog):
     assert response["type"] == "analyzed_df"
 
 
+def test_api_ws_webserver_mode(botclient):
+    ftbot, client = botclient
+    ws_url = f"/api/v1/message/ws?token={_TEST_WS_TOKEN}"
+    ftbot.config["runmode"] = RunMode.WEBSERVER
+
+    with client.websocket_connect(ws_url) as ws:
+        ws.send_json({"type": "subscribe", "data": ["backtest"]})
+        ws.send_json({"type": "whitelist", "data": None})
+        response = ws.receive_json()
+
+    assert response["type"] == "exception"
+    assert response["data"] == "Bot is not in the correct state"
+
+
 def test_api_ws_send_msg(default_conf, mocker, caplog):
     try:
         caplog.set_level(logging.DEBUG)
@@ -2860,6 +2890,20 @@ def test_api_ws_send_msg(default_conf, mocker, caplog):
             apiserver.send_msg(test_message)
             assert first_waiter != second_waiter
 
+            # Publishing from a different thread is scheduled on the event loop
+            third_waiter = apiserver._message_stream._waiter
+            backtest_message = {"type": "backtest", "data": {"trades": []}}
+            thread = Thread(
+                target=apiserver._message_stream.publish_threadsafe, args=(backtest_message,)
+            )
+            thread.start()
+            thread.join()
+            for _ in range(20):
+                if third_waiter.done():
+                    break
+                time.sleep(0.05)
+            assert third_waiter.result()[0] == backtest_message
+
     finally:
         ApiServer.shutdown()
         ApiServer.shutdown()
@@ -19,6 +19,7 @@ from freqtrade.optimize.space import SKDecimal
 from freqtrade.persistence import PairLocks, Trade
 from freqtrade.resolvers import StrategyResolver
 from freqtrade.strategy.hyper import detect_parameters
+from freqtrade.strategy.indicator_cache import IndicatorCache
 from freqtrade.strategy.parameters import (
     BaseParameter,
     BooleanParameter,
@@ -26,6 +27,7 @@ from freqtrade.strategy.parameters import (
     DecimalParameter,
     IntParameter,
     RealParameter,
+    track_parameter_reads,
 )
 from freqtrade.strategy.strategy_wrapper import strategy_safe_wrapper
 from freqtrade.util import dt_now
@@ -1051,6 +1053,89 @@ def test_hyperopt_parameters():
     assert len(list(boolpar.range)) == 1
 
 
+def test_track_parameter_reads():
+    intpar = IntParameter(low=0, high=5, default=1, space="buy")
+    boolpar = BooleanParameter(default=True, space="sell")
+    decpar = DecimalParameter(low=0, high=1, default=0.5, space="sell")
+
+    with track_parameter_reads() as outer:
+        assert boolpar.value is True
+        with track_parameter_reads() as inner:
+            assert intpar.value == 1
+            intpar.value = 3
+        assert inner == {intpar}
+    # Nested reads are reported to the outer context - writes are not reads.
+    assert outer == {boolpar, intpar}
+    assert decpar not in outer
+
+    # Nothing is recorded outside of a context
+    assert decpar.value == 0.5
+    assert outer == {boolpar, intpar}
+
+
+def test_cached_indicator(default_conf):
+    strategy = StrategyResolver.load_strategy(default_conf)
+    dataframe = DataFrame({"close": [float(i) for i in range(100)]})
+    metadata = {"pair": "ETH/BTC"}
+    calls = []
+
+    def sma(df: DataFrame):
+        calls.append(strategy.buy_rsi.value)
+        return df["close"].rolling(strategy.buy_rsi.value).mean()
+
+    def cached_sma(name="sma", **kwargs):
+        return strategy.cached_indicator(dataframe, metadata, name, sma, **kwargs)
+
+    # Without cache, the indicator is calculated on every call
+    cached_sma()
+    cached_sma()
+    assert len(calls) == 2
+
+    calls.clear()
+    strategy.ft_indicator_cache = IndicatorCache(size=2)
+    buy_rsi = strategy.buy_rsi.value
+    expected = cached_sma()
+    result = cached_sma()
+    assert calls == [buy_rsi]
+    assert result.equals(expected)
+    # Results are copies - modifying them doesn't modify the cache
+    result.iloc[-1] = -1
+    assert cached_sma().equals(expected)
+
+    strategy.buy_rsi.value = buy_rsi + 1
+    assert not cached_sma().equals(expected)
+    strategy.buy_rsi.value = buy_rsi
+    assert cached_sma().equals(expected)
+    assert calls == [buy_rsi, buy_rsi + 1]
+
+    # Least recently used combination is dropped
+    strategy.buy_rsi.value = buy_rsi + 2
+    cached_sma()
+    strategy.buy_rsi.value = buy_rsi
+    cached_sma()
+    assert calls == [buy_rsi, buy_rsi + 1, buy_rsi + 2]
+    strategy.buy_rsi.value = buy_rsi + 1
+    cached_sma()
+    assert calls == [buy_rsi, buy_rsi + 1, buy_rsi + 2, buy_rsi + 1]
+
+    # Declared dependencies
+    calls.clear()
+    strategy.buy_rsi.value = buy_rsi
+    cached_sma("sma_dep", depends_on=[strategy.sell_rsi])
+    cached_sma("sma_dep", depends_on=[strategy.sell_rsi])
+    strategy.sell_rsi.value += 1
+    cached_sma("sma_dep", depends_on=[strategy.sell_rsi])
+    assert calls == [buy_rsi, buy_rsi]
+
+    # Indicators are cached per pair and timeframe
+    metadata = {"pair": "ETH/BTC", "timeframe": "1h"}
+    cached_sma()
+    assert len(calls) == 3
+
+    # Cached indicators are not pickled
+    assert strategy.ft_indicator_cache.__getstate__()["_cache"] == {}
+
+
 def test_auto_hyperopt_interface(default_conf):
     default_conf.update({"strategy": "HyperoptableStrategyV2"})
     PairLocks.timeframe = default_conf["timeframe"]
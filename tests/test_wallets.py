@@ -7,12 +7,15 @@ from sqlalchemy import select
 
 from freqtrade.constants import UNLIMITED_STAKE_AMOUNT
 from freqtrade.exceptions import DependencyException
-from freqtrade.persistence import Trade
+from freqtrade.persistence import LocalTrade, Trade, disable_database_use, enable_database_use
+from freqtrade.wallets import Wallets
 from tests.conftest import (
     EXMS,
     create_mock_trades,
     create_mock_trades_usdt,
+    get_patched_exchange,
     get_patched_freqtradebot,
+    log_has_re,
     patch_wallet,
 )
 
@@ -451,3 +454,81 @@ def test_check_exit_amount_futures(mocker, default_conf, fee):
     assert freqtrade.wallets.check_exit_amount(trade) is False
     assert total_mock.call_count == 0
     assert update_mock.call_count == 1
+
+
+@pytest.mark.parametrize("trading_mode", ["spot", "futures"])
+def test_wallet_ledger(mocker, default_conf_usdt, fee, caplog, trading_mode):
+    default_conf_usdt["dry_run"] = True
+    default_conf_usdt["trading_mode"] = trading_mode
+    default_conf_usdt["margin_mode"] = "isolated"
+    default_conf_usdt["tradable_balance_ratio"] = 1.0
+    exchange = get_patched_exchange(mocker, default_conf_usdt)
+    disable_database_use("5m")
+    try:
+        LocalTrade.reset_trades()
+        create_mock_trades_usdt(fee, is_short=None, use_db=False)
+        for idx, trade in enumerate(LocalTrade.bt_trades + LocalTrade.bt_trades_open, start=1):
+            trade.id = idx
+            # Trades are not added to a database - link orders and apply column defaults.
+            trade.leverage = trade.leverage or 1.0
+            for order in trade.orders:
+                order._trade_bt = trade
+
+        full = Wallets(default_conf_usdt, exchange, is_backtest=True)
+        ledger_conf = deepcopy(default_conf_usdt)
+        ledger_conf["backtest_wallet_ledger"] = True
+        ledger_conf["backtest_wallet_ledger_check"] = True
+        ledger = Wallets(ledger_conf, exchange, is_backtest=True)
+        assert ledger._use_ledger
+        assert len(ledger._ledger) == len(LocalTrade.bt_trades_open) == 4
+
+        def assert_wallets_equal():
+            # Ledger first - updates consume the changed trades.
+            ledger.update()
+            full.update()
+            for ledger_dict, full_dict in (
+                (ledger.get_all_balances(), full.get_all_balances()),
+                (ledger.get_all_positions(), full.get_all_positions()),
+            ):
+                assert ledger_dict.keys() == full_dict.keys()
+                for key, value in full_dict.items():
+                    for ledger_val, full_val in zip(ledger_dict[key], value):
+                        assert ledger_val == pytest.approx(full_val)
+            assert ledger.get_available_stake_amount() == pytest.approx(
+                full.get_available_stake_amount()
+            )
+
+        assert_wallets_equal()
+        if trading_mode == "spot":
+            assert len(ledger.get_all_balances()) == 5
+        else:
+            assert len(ledger.get_all_positions()) == 4
+
+        # Close a trade
+        trade = LocalTrade.bt_trades_open[0]
+        trade.close_profit_abs = 2.5
+        trade.is_open = False
+        LocalTrade.close_bt_trade(trade)
+        assert trade.id in LocalTrade.bt_changed_trades
+        assert_wallets_equal()
+        assert not LocalTrade.bt_changed_trades
+        assert len(ledger._ledger) == 3
+
+        # Remove a trade (entry never filled)
+        LocalTrade.remove_bt_trade(LocalTrade.bt_trades_open[-1])
+        assert_wallets_equal()
+        assert len(ledger._ledger) == 2
+        assert not log_has_re(r"Wallet ledger inconsistent.*", caplog)
+
+        # Changes without event are detected by the consistency check
+        LocalTrade.bt_trades_open[0].stake_amount += 10
+        ledger.update()
+        assert log_has_re(r"Wallet ledger inconsistent for USDT.*", caplog)
+
+        # Trades reset - ledger is rebuilt
+        LocalTrade.reset_trades()
+        assert_wallets_equal()
+        assert ledger._ledger == {}
+        assert ledger.get_total("USDT") == default_conf_usdt["dry_run_wallet"]
+    finally:
+        enable_database_use()